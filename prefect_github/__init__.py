@@ -1,5 +1,9 @@
 from . import _version
-from .credentials import GitHubCredentials  # noqa
+from .credentials import (  # noqa
+    GitHubAppCredentials,
+    GitHubCredentials,
+    GitHubCredentialsPool,
+)
 from .repository import GitHubRepository  # noqa
 
 __version__ = _version.get_versions()["version"]
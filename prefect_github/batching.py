@@ -0,0 +1,487 @@
+"""
+Batching of operations: merging several operations into a single request
+under unique aliases, whether queries issued concurrently within a short
+window or independent mutations, and handing each its own part of the result.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import deque
+from copy import deepcopy
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    Visitor,
+    print_ast,
+    visit,
+)
+
+from prefect_github.concurrency import RequestPriority, get_credentials_key
+from prefect_github.cost import MAX_NODE_LIMIT, estimate_query_cost
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.utils import get_operation_definition
+
+# The most operations merged into a single request.
+MAX_BATCH_OPERATIONS = 50
+# The most rate-limit points a merged request may be estimated to cost.
+MAX_BATCH_POINTS = 50
+# The most mutations merged into a single request; GitHub runs them one
+# after another, so large batches risk timing out.
+MAX_BATCH_MUTATIONS = 10
+# The most mutations sent per minute, under GitHub's secondary rate limit on
+# content creation.
+MUTATIONS_PER_MINUTE = 80
+# The least time, in seconds, between two requests sending mutations.
+MUTATION_INTERVAL = 1.0
+
+SendRaw = Callable[[str, Dict[str, Any], RequestPriority], Awaitable[Dict[str, Any]]]
+
+_BATCHERS: Dict[Tuple[str, float], "QueryBatcher"] = {}
+_BATCHERS_LOCK = threading.Lock()
+_PACERS: Dict[str, "MutationPacer"] = {}
+_PACERS_LOCK = threading.Lock()
+
+
+class _BatchEntry(NamedTuple):
+    """
+    An operation waiting in a batch for its part of the result.
+    """
+
+    document: DocumentNode
+    variables: Dict[str, Any]
+    future: concurrent.futures.Future
+
+
+class _Batch:
+    """
+    The operations collected during one window, sent by the first caller.
+    """
+
+    def __init__(self):
+        self.entries: List[_BatchEntry] = []
+        self.requests = 0
+        self.node_count = 0
+        self.priority = RequestPriority.LOW
+        self.full: concurrent.futures.Future = concurrent.futures.Future()
+
+    def close(self):
+        """
+        Stops the window early, e.g. because the batch reached its ceiling.
+        """
+        if not self.full.done():
+            self.full.set_result(None)
+
+
+def is_batchable(
+    document: DocumentNode, operation_type: OperationType = OperationType.QUERY
+) -> bool:
+    """
+    Checks whether an operation can be merged with others: it must be a
+    single operation of the given type selecting plain fields at its root.
+
+    Args:
+        document: The parsed operation.
+        operation_type: The type of operations being batched.
+
+    Returns:
+        True if the operation can be batched.
+    """
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if len(operations) != 1:
+        return False
+    operation = operations[0]
+    return (
+        operation.operation is operation_type
+        and not operation.directives
+        and all(
+            isinstance(selection, FieldNode)
+            for selection in operation.selection_set.selections
+        )
+    )
+
+
+def merge_operations(
+    operations: List[Tuple[DocumentNode, Dict[str, Any]]]
+) -> Tuple[DocumentNode, Dict[str, Any], List[Dict[str, str]]]:
+    """
+    Merges several operations of the same type into one, prefixing the root
+    fields, variables and fragments of the i-th operation with `batch{i}_` so
+    that none collide.
+
+    Args:
+        operations: The parsed operations along with their variables.
+
+    Returns:
+        The merged operation, its variables, and, for every operation, its
+            root aliases in the merged one mapped to its original response keys.
+    """
+    operation_type = OperationType.QUERY
+    variable_definitions = []
+    selections = []
+    fragments = []
+    merged_variables = {}
+    aliases = []
+    for index, (document, variables) in enumerate(operations):
+        prefix = f"batch{index}_"
+        document = deepcopy(document)
+
+        class Prefixer(Visitor):
+            """Prefixes the variables and fragments of a query in place."""
+
+            def enter_variable(self, node: VariableNode, *args):
+                node.name = NameNode(value=prefix + node.name.value)
+
+            def enter_fragment_spread(self, node: FragmentSpreadNode, *args):
+                node.name = NameNode(value=prefix + node.name.value)
+
+            def enter_fragment_definition(self, node: FragmentDefinitionNode, *args):
+                node.name = NameNode(value=prefix + node.name.value)
+
+        visit(document, Prefixer())
+        operation = get_operation_definition(document)
+        operation_type = operation.operation
+        variable_definitions.extend(operation.variable_definitions or ())
+        query_aliases = {}
+        for field in operation.selection_set.selections:
+            key = (field.alias or field.name).value
+            field.alias = NameNode(value=prefix + key)
+            query_aliases[field.alias.value] = key
+            selections.append(field)
+        aliases.append(query_aliases)
+        fragments.extend(
+            definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        )
+        merged_variables.update(
+            {prefix + name: value for name, value in variables.items()}
+        )
+
+    merged = OperationDefinitionNode(
+        operation=operation_type,
+        variable_definitions=tuple(variable_definitions),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    return DocumentNode(definitions=(merged, *fragments)), merged_variables, aliases
+
+
+def split_result(
+    result: Dict[str, Any], aliases: List[Dict[str, str]]
+) -> List[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    Splits the result of a merged query into the data and errors of each of
+    the queries it merged; errors without a path are given to every query.
+
+    Args:
+        result: The raw result, with `data` and possibly `errors`.
+        aliases: The aliases returned by `merge_operations`.
+
+    Returns:
+        The data, under the original response keys, and the errors, with their
+            path rewritten to them, of every query.
+    """
+    data = result.get("data") or {}
+    errors = result.get("errors") or []
+    if not isinstance(errors, list):
+        errors = [errors]
+    parts = []
+    for query_aliases in aliases:
+        query_data = {key: data.get(alias) for alias, key in query_aliases.items()}
+        query_errors = []
+        for error in errors:
+            path = error.get("path") if isinstance(error, dict) else None
+            if not path:
+                query_errors.append(error)
+            elif path[0] in query_aliases:
+                error = dict(error, path=[query_aliases[path[0]], *path[1:]])
+                query_errors.append(error)
+        parts.append((query_data, query_errors))
+    return parts
+
+
+class QueryBatcher:
+    """
+    Collects the queries sent with some credentials during a short window and
+    sends them as a single request.
+
+    The first query of a batch waits for the window to pass, or for the batch
+    to reach `max_operations` queries or `max_points` estimated points, then
+    sends the batch and hands every query its part of the result. Errors are
+    raised only to the queries they concern.
+
+    Attributes:
+        window: How long, in seconds, a batch collects queries.
+        max_operations: The most queries merged into a single request.
+        max_points: The most rate-limit points a request is estimated to cost.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        max_operations: int = MAX_BATCH_OPERATIONS,
+        max_points: int = MAX_BATCH_POINTS,
+    ):
+        self.window = window
+        self.max_operations = max_operations
+        self.max_points = max_points
+        self._lock = threading.Lock()
+        self._open: Optional[_Batch] = None
+        self._sending: Set[asyncio.Future] = set()
+
+    def _fits(self, batch: _Batch, requests: int, node_count: int) -> bool:
+        """
+        Checks whether a query fits in a batch without exceeding its ceiling.
+        """
+        points = int((batch.requests + requests) / 100 + 0.5)
+        return (
+            len(batch.entries) < self.max_operations
+            and points <= self.max_points
+            and batch.node_count + node_count <= MAX_NODE_LIMIT
+        )
+
+    async def submit(
+        self,
+        document: DocumentNode,
+        variables: Dict[str, Any],
+        send: SendRaw,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Dict[str, Any]:
+        """
+        Adds a query to the current batch and waits for its part of the result.
+
+        Args:
+            document: The parsed query; see `is_batchable`.
+            variables: The variables the query is sent with.
+            send: Coroutine function sending a query string with its variables
+                and priority, and returning the raw result.
+            priority: The priority of the query; a batch is sent with the
+                highest priority of its queries.
+
+        Returns:
+            The result data of the query.
+
+        Raises:
+            GitHubGraphQLError: If GitHub reported errors for the query.
+        """
+        cost = estimate_query_cost(document, **variables)
+        requests = sum(connection.parent_count for connection in cost.connections)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            batch = self._open
+            if batch is not None and not self._fits(batch, requests, cost.node_count):
+                batch.close()
+                batch = None
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            batch.entries.append(_BatchEntry(document, variables, future))
+            batch.requests += requests
+            batch.node_count += cost.node_count
+            if RequestPriority(priority).rank < batch.priority.rank:
+                batch.priority = RequestPriority(priority)
+            if len(batch.entries) >= self.max_operations:
+                batch.close()
+
+        if leader:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(batch.full)), self.window
+                )
+            except asyncio.TimeoutError:
+                pass
+            except BaseException:
+                # cancelled: the followers are still sent, without this query
+                self._detach(batch)
+                self._send_followers(batch, send)
+                raise
+            self._detach(batch)
+            await self._send_batch(batch, send, leader=True)
+        return await asyncio.wrap_future(future)
+
+    def _detach(self, batch: _Batch):
+        """
+        Stops a batch from taking more queries, before it is sent.
+        """
+        with self._lock:
+            if self._open is batch:
+                self._open = None
+        batch.close()
+
+    def _send_followers(self, batch: _Batch, send: SendRaw):
+        """
+        Sends the queries of a detached batch but the leader's in a task of
+        their own, once the leader was cancelled.
+        """
+        with self._lock:
+            leader = batch.entries.pop(0)
+        leader.future.cancel()
+        if batch.entries:
+            sending = asyncio.ensure_future(self._send_batch(batch, send))
+            self._sending.add(sending)
+            sending.add_done_callback(self._sending.discard)
+
+    async def _send_batch(self, batch: _Batch, send: SendRaw, leader: bool = False):
+        """
+        Sends the queries of a batch as one request and resolves their futures;
+        if the leader, whose query is the first, is cancelled while sending it,
+        the other queries are sent again without it.
+        """
+        entries = batch.entries
+        try:
+            if len(entries) == 1:
+                query = print_ast(entries[0].document)
+                result = await send(query, entries[0].variables, batch.priority)
+                parts = [(result.get("data"), result.get("errors") or [])]
+            else:
+                document, variables, aliases = merge_operations(
+                    [(entry.document, entry.variables) for entry in entries]
+                )
+                result = await send(print_ast(document), variables, batch.priority)
+                parts = split_result(result, aliases)
+        except Exception as exc:
+            for entry in entries:
+                if not entry.future.done():
+                    entry.future.set_exception(exc)
+            return
+        except asyncio.CancelledError:
+            if leader:
+                self._send_followers(batch, send)
+            else:
+                for entry in entries:
+                    entry.future.cancel()
+            raise
+        except BaseException:
+            for entry in entries:
+                entry.future.cancel()
+            raise
+
+        for entry, (data, errors) in zip(entries, parts):
+            if entry.future.done():
+                # the caller was cancelled meanwhile
+                continue
+            if errors:
+                entry.future.set_exception(GitHubGraphQLError(errors))
+            else:
+                entry.future.set_result(data)
+
+
+class MutationPacer:
+    """
+    Spaces out the requests sending mutations with some credentials to stay
+    under GitHub's secondary rate limits: at most `per_minute` mutations are
+    sent in any minute, and requests are at least `interval` seconds apart.
+
+    Attributes:
+        per_minute: The most mutations sent in any minute.
+        interval: The least time, in seconds, between two requests.
+    """
+
+    def __init__(
+        self,
+        per_minute: int = MUTATIONS_PER_MINUTE,
+        interval: float = MUTATION_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.per_minute = per_minute
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sent: deque = deque()
+        self._last_sent: Optional[float] = None
+
+    def _get_delay(self, count: int, now: float) -> float:
+        """
+        Computes how long to wait before sending some mutations.
+        """
+        while self._sent and self._sent[0] <= now - 60:
+            self._sent.popleft()
+        delay = 0.0
+        if self._last_sent is not None:
+            delay = self._last_sent + self.interval - now
+        excess = min(len(self._sent) + count - self.per_minute, len(self._sent))
+        if excess > 0:
+            delay = max(delay, self._sent[excess - 1] + 60 - now)
+        return delay
+
+    async def wait(self, count: int = 1):
+        """
+        Waits until some mutations can be sent, and records them as sent.
+
+        Args:
+            count: The number of mutations in the request.
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = self._get_delay(count, now)
+                if delay <= 0:
+                    self._sent.extend([now] * count)
+                    self._last_sent = now
+                    return
+            await asyncio.sleep(delay)
+
+
+def get_mutation_pacer(github_credentials: Any) -> MutationPacer:
+    """
+    Gets the process-wide pacer of the mutations sent with some credentials.
+
+    Args:
+        github_credentials: The credentials mutations are sent with.
+
+    Returns:
+        The pacer shared by every mutation sent with the credentials.
+    """
+    key = get_credentials_key(github_credentials)
+    with _PACERS_LOCK:
+        pacer = _PACERS.get(key)
+        if pacer is None:
+            pacer = _PACERS[key] = MutationPacer()
+        return pacer
+
+
+def get_query_batcher(github_credentials: Any) -> Optional[QueryBatcher]:
+    """
+    Gets the process-wide batcher of the queries sent with some credentials,
+    if they enable batching.
+
+    Args:
+        github_credentials: The credentials queries are sent with.
+
+    Returns:
+        The batcher, or None if the credentials set no batch window.
+    """
+    window = getattr(github_credentials, "query_batch_window", None)
+    if not window:
+        return None
+    key = (get_credentials_key(github_credentials), window)
+    with _BATCHERS_LOCK:
+        batcher = _BATCHERS.get(key)
+        if batcher is None:
+            batcher = _BATCHERS[key] = QueryBatcher(window)
+        return batcher
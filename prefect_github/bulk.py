@@ -0,0 +1,730 @@
+"""
+Bulk queries: fetching many objects of the same kind with aliased root fields,
+many per request, instead of one request per object.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict,
+    Sequence,
+    Tuple,
+)
+
+from prefect import task
+from sgqlc.operation import Operation
+
+from prefect_github import GitHubCredentials
+from prefect_github.concurrency import RequestPriority, get_credentials_key
+from prefect_github.cost import MAX_NODE_LIMIT, QueryCost, estimate_query_cost
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.graphql import _request_graphql_op, _subset_return_fields
+from prefect_github.organization import (
+    return_fields_defaults as organization_return_fields_defaults,
+)
+from prefect_github.repository import (
+    return_fields_defaults as repository_return_fields_defaults,
+)
+from prefect_github.schemas import graphql_schema
+from prefect_github.user import return_fields_defaults as user_return_fields_defaults
+from prefect_github.utils import camel_to_snake_case, get_scalar_field_names
+
+# The most aliased root fields sent in a single request.
+MAX_ALIASES_PER_REQUEST = 100
+# The most rate-limit points a single request is estimated to cost.
+MAX_POINTS_PER_REQUEST = 50
+# The most IDs GitHub accepts in a single `nodes(ids:)` field.
+MAX_IDS_PER_REQUEST = 100
+# The node types selected by `query_nodes` by default.
+DEFAULT_NODE_TYPES = ("Issue", "PullRequest", "User")
+# How long, in seconds, a user or organization fetched by login is remembered.
+LOGIN_MEMO_TTL = 60 * 60
+# The most users and organizations remembered; the least recently used go first.
+MAX_LOGIN_MEMO_SIZE = 10_000
+# The error types reporting that an object does not exist, or is not visible.
+MISSING_ERROR_TYPES = ("NOT_FOUND",)
+
+# The users and organizations fetched by login in this process, with the time
+# they expire at, keyed by the credentials, root field, return fields and
+# lowercase login, and ordered from least to most recently used.
+_LOGIN_MEMO: OrderedDict[
+    Tuple[str, str, Tuple[str, ...], str], Tuple[Optional[Dict], float]
+] = collections.OrderedDict()
+_LOGIN_MEMO_LOCK = threading.Lock()
+
+
+def chunk_by_cost(
+    items: Sequence[Any],
+    get_cost: Callable[[Any], QueryCost],
+    max_aliases: int = MAX_ALIASES_PER_REQUEST,
+    max_points: int = MAX_POINTS_PER_REQUEST,
+) -> List[List[Any]]:
+    """
+    Splits items into chunks whose aliased selections fit in one request.
+
+    A chunk holds at most `max_aliases` items, and the selections of its
+    items are estimated to cost at most `max_points` points and to stay
+    under GitHub's node limit; an item exceeding them alone gets a chunk of
+    its own.
+
+    Args:
+        items: The items to select, one aliased root field each.
+        get_cost: Returns the estimated cost of the selection of an item.
+        max_aliases: The most items per chunk.
+        max_points: The most points per chunk.
+
+    Returns:
+        The chunks, keeping the order of the items.
+    """
+    chunks = []
+    chunk, requests, node_count = [], 0, 0
+    for item in items:
+        cost = get_cost(item)
+        item_requests = sum(connection.parent_count for connection in cost.connections)
+        if chunk and (
+            len(chunk) >= max_aliases
+            or round((requests + item_requests) / 100) > max_points
+            or node_count + cost.node_count > MAX_NODE_LIMIT
+        ):
+            chunks.append(chunk)
+            chunk, requests, node_count = [], 0, 0
+        chunk.append(item)
+        requests += item_requests
+        node_count += cost.node_count
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def request_aliased(
+    op: Operation,
+    github_credentials: GitHubCredentials,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Sends an operation of aliased root fields, keeping the errors of each
+    alias apart instead of raising them.
+
+    Args:
+        op: The operation, each root field under its own alias.
+        github_credentials: Credentials to use for authentication with GitHub.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        The result data and the errors of every alias that has some.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported errors that concern no alias,
+            e.g. because the operation is invalid.
+    """
+    result = await _request_graphql_op(op, github_credentials, priority=priority)
+    errors = result.get("errors") or []
+    if not isinstance(errors, list):
+        errors = [errors]
+    errors_by_alias: Dict[str, List[Dict[str, Any]]] = {}
+    shared_errors = []
+    for error in errors:
+        path = error.get("path") if isinstance(error, dict) else None
+        if path:
+            errors_by_alias.setdefault(path[0], []).append(error)
+        else:
+            shared_errors.append(error)
+    if shared_errors or result.get("data") is None:
+        raise GitHubGraphQLError(shared_errors or errors)
+    return result["data"], errors_by_alias
+
+
+def is_missing(errors: List[Dict[str, Any]]) -> bool:
+    """
+    Checks whether the errors of an alias only report a missing object.
+
+    Args:
+        errors: The errors of the alias.
+
+    Returns:
+        True if every error is of one of the `MISSING_ERROR_TYPES`.
+    """
+    return all(error.get("type") in MISSING_ERROR_TYPES for error in errors)
+
+
+def _select_repositories(
+    op: Operation,
+    repositories: Iterable[Tuple[str, str]],
+    follow_renames: bool,
+    return_fields: Optional[Iterable[str]],
+):
+    """
+    Selects the return fields of several repositories, the i-th one under the
+    `repository{i}` alias.
+    """
+    for index, (owner, name) in enumerate(repositories):
+        op_selection = op.repository(
+            __alias__=f"repository{index}",
+            owner=owner,
+            name=name,
+            follow_renames=follow_renames,
+        )
+        _subset_return_fields(
+            op_selection,
+            ("repository",),
+            return_fields,
+            repository_return_fields_defaults,
+        )
+
+
+@task
+async def query_repositories(  # noqa
+    repositories: Iterable[Tuple[str, str]],
+    github_credentials: GitHubCredentials,
+    follow_renames: bool = True,
+    return_fields: Iterable[str] = None,
+    max_aliases: int = MAX_ALIASES_PER_REQUEST,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """
+    Fetches the same fields of many repositories, with many repositories per
+    request and the requests sent concurrently.
+
+    Args:
+        repositories: The `(owner, name)` pairs of the repositories.
+        github_credentials: Credentials to use for authentication with GitHub.
+        follow_renames: Follow repository renames. If disabled, a repository
+            referenced by its old name is reported missing.
+        return_fields: Subset the return fields (as snake_case); defaults to
+            fields listed in configs/query/*.json.
+        max_aliases: The most repositories fetched per request; requests are
+            also kept within the estimated point and node limits.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict of the returned fields of each repository, keyed by its
+            `(owner, name)` pair; repositories that do not exist, or that
+            the credentials cannot see, map to None.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported other errors.
+
+    Example:
+        Fetch the star count of many repositories.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.bulk import query_repositories
+
+        @flow()
+        async def github_stars_flow():
+            github_credentials = await GitHubCredentials.load("github-token")
+            repositories = await query_repositories(
+                [("PrefectHQ", "prefect"), ("PrefectHQ", "prefect-github")],
+                github_credentials,
+                return_fields=["stargazer_count"],
+            )
+            return {
+                f"{owner}/{name}": repository["stargazerCount"]
+                for (owner, name), repository in repositories.items()
+                if repository is not None
+            }
+        ```
+    """
+    repositories = list(dict.fromkeys(tuple(pair) for pair in repositories))
+    if not repositories:
+        return {}
+
+    # every repository has the same selection, so they cost the same
+    op = Operation(graphql_schema.Query)
+    _select_repositories(op, repositories[:1], follow_renames, return_fields)
+    cost = estimate_query_cost(op)
+    chunks = chunk_by_cost(
+        repositories, lambda repository: cost, max_aliases=max_aliases
+    )
+
+    async def fetch(chunk: List[Tuple[str, str]]):
+        """Fetches a chunk of repositories in one request."""
+        op = Operation(graphql_schema.Query)
+        _select_repositories(op, chunk, follow_renames, return_fields)
+        data, errors_by_alias = await request_aliased(
+            op, github_credentials, priority=priority
+        )
+        errors = [
+            error
+            for errors in errors_by_alias.values()
+            if not is_missing(errors)
+            for error in errors
+        ]
+        if errors:
+            raise GitHubGraphQLError(errors)
+        return {
+            repository: data.get(f"repository{index}")
+            for index, repository in enumerate(chunk)
+        }
+
+    results = {}
+    for chunk_results in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+    return results
+
+
+def _select_node_types(
+    node_selection, return_fields: Dict[str, Optional[Iterable[str]]]
+):
+    """
+    Selects the return fields of each node type through an inline fragment,
+    along with the `__typename` and `id` of every node.
+    """
+    node_selection.id()
+    for type_name, fields in return_fields.items():
+        node_type = getattr(graphql_schema, type_name, None)
+        if not isinstance(node_type, type) or not issubclass(
+            node_type, graphql_schema.Node
+        ):
+            raise ValueError(f"{type_name!r} is not a node type.")
+        if not fields:
+            fields = get_scalar_field_names(node_type)
+        elif isinstance(fields, str):
+            fields = (fields,)
+        fields = {camel_to_snake_case(field) for field in fields} - {"id"}
+        if fields:
+            node_selection.__as__(node_type).__fields__(*sorted(fields))
+
+
+@task
+async def query_nodes(  # noqa
+    ids: Iterable[str],
+    github_credentials: GitHubCredentials,
+    return_fields: Dict[str, Iterable[str]] = None,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetches many nodes by their global ID through the root `nodes` field,
+    with up to 100 IDs per request and the requests sent concurrently.
+
+    Args:
+        ids: The global node IDs, of any types; duplicates are fetched once.
+        github_credentials: Credentials to use for authentication with GitHub.
+        return_fields: The return fields (as snake_case) of each node type,
+            keyed by the name of the type, e.g. `{"Issue": ["title"]}`; a
+            type mapped to None selects its scalar fields. Defaults to the
+            scalar fields of issues, pull requests and users. Nodes of other
+            types only return their `__typename` and `id`.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict of the returned fields of each node, keyed by its ID; nodes
+            that do not exist, or that the credentials cannot see, map to None.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported other errors.
+
+    Example:
+        Refresh the state of issues and pull requests from a previous sync.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.bulk import query_nodes
+
+        @flow()
+        async def github_refresh_flow(ids):
+            github_credentials = await GitHubCredentials.load("github-token")
+            return await query_nodes(
+                ids,
+                github_credentials,
+                return_fields={
+                    "Issue": ["state", "updated_at"],
+                    "PullRequest": ["state", "merged", "updated_at"],
+                },
+            )
+        ```
+    """
+    ids = list(dict.fromkeys(ids))
+    if return_fields is None:
+        return_fields = dict.fromkeys(DEFAULT_NODE_TYPES)
+
+    async def fetch(chunk: List[str]):
+        """Fetches a chunk of nodes in one request."""
+        op = Operation(graphql_schema.Query)
+        _select_node_types(op.nodes(ids=chunk), return_fields)
+        data, errors_by_alias = await request_aliased(
+            op, github_credentials, priority=priority
+        )
+        errors = errors_by_alias.get("nodes", [])
+        if not is_missing(errors):
+            raise GitHubGraphQLError(errors)
+        return dict(zip(chunk, data["nodes"] or [None] * len(chunk)))
+
+    chunks = [
+        ids[start : start + MAX_IDS_PER_REQUEST]
+        for start in range(0, len(ids), MAX_IDS_PER_REQUEST)
+    ]
+    results = {}
+    for chunk_results in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+    return results
+
+
+def clear_login_memo():
+    """
+    Forgets the users and organizations `query_users` and
+    `query_organizations` fetched, e.g. so that later calls see renames.
+    """
+    with _LOGIN_MEMO_LOCK:
+        _LOGIN_MEMO.clear()
+
+
+def _get_memoized(key: Tuple) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Gets whether an object is remembered and unexpired, and the object; the
+    memo lock must be held.
+    """
+    value, expires_at = _LOGIN_MEMO.get(key, (None, 0.0))
+    if expires_at <= time.monotonic():
+        _LOGIN_MEMO.pop(key, None)
+        return False, None
+    _LOGIN_MEMO.move_to_end(key)
+    return True, value
+
+
+def _memoize(fetched: Dict[Tuple, Optional[Dict[str, Any]]]):
+    """
+    Remembers fetched objects, forgetting the least recently used ones beyond
+    `MAX_LOGIN_MEMO_SIZE`; the memo lock must be held.
+    """
+    expires_at = time.monotonic() + LOGIN_MEMO_TTL
+    for key, value in fetched.items():
+        _LOGIN_MEMO[key] = (value, expires_at)
+        _LOGIN_MEMO.move_to_end(key)
+    while len(_LOGIN_MEMO) > MAX_LOGIN_MEMO_SIZE:
+        _LOGIN_MEMO.popitem(last=False)
+
+
+async def _query_by_login(
+    root: str,
+    logins: Iterable[str],
+    github_credentials: GitHubCredentials,
+    return_fields: Optional[Iterable[str]],
+    return_fields_defaults: Dict[Tuple, Tuple],
+    max_aliases: int,
+    priority: RequestPriority,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetches the objects of a root field taking a login, e.g. `user`, many
+    per request, answering logins fetched recently in the process from memory.
+    """
+    if isinstance(return_fields, str):
+        return_fields = (return_fields,)
+    fields_key = tuple(
+        sorted(camel_to_snake_case(field) for field in return_fields or ())
+    )
+    credentials_key = get_credentials_key(github_credentials)
+    logins = list(logins)
+
+    def get_memo_key(login: str):
+        return (credentials_key, root, fields_key, login.lower())
+
+    memo = {}
+    with _LOGIN_MEMO_LOCK:
+        for login in logins:
+            found, value = _get_memoized(get_memo_key(login))
+            if found:
+                memo[get_memo_key(login)] = value
+    # logins are case-insensitive, so fetch each one once
+    missing_logins = list(
+        {
+            login.lower(): login for login in logins if get_memo_key(login) not in memo
+        }.values()
+    )
+
+    def select(op: Operation, chunk: List[str]):
+        """Selects the i-th login of a chunk under the `{root}{i}` alias."""
+        for index, login in enumerate(chunk):
+            op_selection = getattr(op, root)(__alias__=f"{root}{index}", login=login)
+            _subset_return_fields(
+                op_selection, (root,), return_fields, return_fields_defaults
+            )
+
+    async def fetch(chunk: List[str]):
+        """Fetches a chunk of logins in one request and remembers them."""
+        op = Operation(graphql_schema.Query)
+        select(op, chunk)
+        data, errors_by_alias = await request_aliased(
+            op, github_credentials, priority=priority
+        )
+        errors = [
+            error
+            for errors in errors_by_alias.values()
+            if not is_missing(errors)
+            for error in errors
+        ]
+        if errors:
+            raise GitHubGraphQLError(errors)
+        fetched = {
+            get_memo_key(login): data.get(f"{root}{index}")
+            for index, login in enumerate(chunk)
+        }
+        with _LOGIN_MEMO_LOCK:
+            _memoize(fetched)
+        memo.update(fetched)
+
+    if missing_logins:
+        # every login has the same selection, so they cost the same
+        op = Operation(graphql_schema.Query)
+        select(op, missing_logins[:1])
+        cost = estimate_query_cost(op)
+        chunks = chunk_by_cost(
+            missing_logins, lambda login: cost, max_aliases=max_aliases
+        )
+        await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return {login: memo[get_memo_key(login)] for login in logins}
+
+
+@task
+async def query_users(  # noqa
+    logins: Iterable[str],
+    github_credentials: GitHubCredentials,
+    return_fields: Iterable[str] = None,
+    max_aliases: int = MAX_ALIASES_PER_REQUEST,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetches many users by login, with many users per request and the requests
+    sent concurrently.
+
+    Logins are case-insensitive and fetched once, and users fetched in the
+    last `LOGIN_MEMO_TTL` seconds of the same process, with the same
+    credentials and return fields, are not fetched again, up to
+    `MAX_LOGIN_MEMO_SIZE` of them; see `clear_login_memo`.
+
+    Args:
+        logins: The logins of the users.
+        github_credentials: Credentials to use for authentication with GitHub.
+        return_fields: Subset the return fields (as snake_case); defaults to
+            fields listed in configs/query/*.json.
+        max_aliases: The most users fetched per request.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict of the returned fields of each user, keyed by login as given;
+            logins of no user map to None.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported other errors.
+
+    Example:
+        Look up the names of the authors of some commits.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.bulk import query_users
+
+        @flow()
+        async def github_authors_flow(logins):
+            github_credentials = await GitHubCredentials.load("github-token")
+            return await query_users(
+                logins, github_credentials, return_fields=["name", "company"]
+            )
+        ```
+    """
+    return await _query_by_login(
+        "user",
+        logins,
+        github_credentials,
+        return_fields,
+        user_return_fields_defaults,
+        max_aliases,
+        priority,
+    )
+
+
+@task
+async def query_organizations(  # noqa
+    logins: Iterable[str],
+    github_credentials: GitHubCredentials,
+    return_fields: Iterable[str] = None,
+    max_aliases: int = MAX_ALIASES_PER_REQUEST,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetches many organizations by login, with many organizations per request
+    and the requests sent concurrently.
+
+    Logins are case-insensitive and fetched once, and organizations fetched
+    in the last `LOGIN_MEMO_TTL` seconds of the same process, with the same
+    credentials and return fields, are not fetched again, up to
+    `MAX_LOGIN_MEMO_SIZE` of them; see `clear_login_memo`.
+
+    Args:
+        logins: The logins of the organizations.
+        github_credentials: Credentials to use for authentication with GitHub.
+        return_fields: Subset the return fields (as snake_case); defaults to
+            fields listed in configs/query/*.json.
+        max_aliases: The most organizations fetched per request.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict of the returned fields of each organization, keyed by login as
+            given; logins of no organization map to None.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported other errors.
+    """
+    return await _query_by_login(
+        "organization",
+        logins,
+        github_credentials,
+        return_fields,
+        organization_return_fields_defaults,
+        max_aliases,
+        priority,
+    )
+
+
+def _parse_repository(repository: str) -> Tuple[str, str]:
+    """
+    Splits an `owner/name` repository into its owner and name.
+    """
+    owner, _, name = repository.partition("/")
+    if not owner or not name:
+        raise ValueError(f"Expected a repository as 'owner/name', got {repository!r}.")
+    return owner, name
+
+
+@task
+async def query_repository_files(  # noqa
+    files: Iterable[Tuple[str, str]],
+    github_credentials: GitHubCredentials,
+    max_bytes: Optional[int] = None,
+    max_aliases: int = MAX_ALIASES_PER_REQUEST,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Any]:
+    """
+    Fetches the contents of many files, from any number of repositories,
+    through `repository.object` without cloning, with many files per request
+    and the requests sent concurrently.
+
+    Args:
+        files: The `(repository, expression)` pairs of the files, where the
+            repository is given as `owner/name` and the expression as
+            `ref:path`, e.g. `("PrefectHQ/prefect", "HEAD:pyproject.toml")`.
+        github_credentials: Credentials to use for authentication with GitHub.
+        max_bytes: The size above which a file is reported oversized rather
+            than returned; files GitHub truncates are always reported so.
+        max_aliases: The most files fetched per request.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict with the `text` and `byteSize` of each text file, keyed by its
+            `(repository, expression)` pair, under `files`, and the pairs of
+            the `binary` files, the `oversized` files, and the `missing`
+            files, i.e. those whose repository, ref or path does not exist or
+            that are not files, each under its own key.
+
+    Raises:
+        GitHubGraphQLError: If GitHub reported other errors.
+
+    Example:
+        Read the CODEOWNERS of many repositories.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.bulk import query_repository_files
+
+        @flow()
+        async def github_codeowners_flow(repositories):
+            github_credentials = await GitHubCredentials.load("github-token")
+            result = await query_repository_files(
+                [
+                    (repository, "HEAD:.github/CODEOWNERS")
+                    for repository in repositories
+                ],
+                github_credentials,
+            )
+            return {
+                repository: file["text"]
+                for (repository, _), file in result["files"].items()
+            }
+        ```
+    """
+    files = list(dict.fromkeys(tuple(file) for file in files))
+    for repository, _ in files:
+        _parse_repository(repository)
+
+    def select(op: Operation, chunk: List[Tuple[str, str]]) -> Dict[Tuple, Tuple]:
+        """
+        Selects the files of a chunk, grouped by repository, and returns the
+        repository and object aliases of each file.
+        """
+        repository_selections = {}
+        aliases = {}
+        for file in chunk:
+            repository, expression = file
+            if repository not in repository_selections:
+                owner, name = _parse_repository(repository)
+                repository_alias = f"repository{len(repository_selections)}"
+                repository_selections[repository] = (
+                    repository_alias,
+                    op.repository(__alias__=repository_alias, owner=owner, name=name),
+                )
+            repository_alias, repository_selection = repository_selections[repository]
+            file_alias = f"file{len(aliases)}"
+            repository_selection.object(
+                __alias__=file_alias, expression=expression
+            ).__as__(graphql_schema.Blob).__fields__(
+                "byte_size", "is_binary", "is_truncated", "text"
+            )
+            aliases[file] = (repository_alias, file_alias)
+        return aliases
+
+    result = {"files": {}, "binary": [], "oversized": [], "missing": []}
+
+    async def fetch(chunk: List[Tuple[str, str]]):
+        """Fetches a chunk of files in one request and sorts them."""
+        op = Operation(graphql_schema.Query)
+        aliases = select(op, chunk)
+        data, errors_by_alias = await request_aliased(
+            op, github_credentials, priority=priority
+        )
+        errors = [
+            error
+            for errors in errors_by_alias.values()
+            if not is_missing(errors)
+            for error in errors
+        ]
+        if errors:
+            raise GitHubGraphQLError(errors)
+        for file, (repository_alias, file_alias) in aliases.items():
+            blob = (data.get(repository_alias) or {}).get(file_alias)
+            if not blob or blob.get("__typename", "Blob") != "Blob":
+                result["missing"].append(file)
+            elif blob["isBinary"]:
+                result["binary"].append(file)
+            elif blob["isTruncated"] or (
+                max_bytes is not None and blob["byteSize"] > max_bytes
+            ):
+                result["oversized"].append(file)
+            else:
+                result["files"][file] = {
+                    "text": blob["text"],
+                    "byteSize": blob["byteSize"],
+                }
+
+    if files:
+        # every file has the same selection, so they cost the same
+        op = Operation(graphql_schema.Query)
+        select(op, files[:1])
+        cost = estimate_query_cost(op)
+        chunks = chunk_by_cost(files, lambda file: cost, max_aliases=max_aliases)
+        await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return result
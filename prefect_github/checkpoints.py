@@ -0,0 +1,333 @@
+"""
+Persisted pagination checkpoints, so that long exports resume from their last
+cursor instead of the first page after a crash.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Union
+
+from anyio import to_thread
+from prefect.blocks.system import JSON
+
+# The number of consumed pages after which a checkpoint is saved by default.
+DEFAULT_CHECKPOINT_EVERY = 10
+
+
+class Checkpoint(NamedTuple):
+    """
+    The progress of a paginated traversal.
+
+    Attributes:
+        cursor: The end cursor of the last page the consumer handled.
+        pages: The number of pages handled so far.
+        items: The number of nodes handled so far.
+        updated_at: The epoch time at which the checkpoint was saved.
+    """
+
+    cursor: Optional[str]
+    pages: int
+    items: int
+    updated_at: float = 0.0
+
+
+def get_checkpoint_key(query: Union[str, Any], path: Iterable[str]) -> str:
+    """
+    Derives a stable key for the traversal of a connection, so that reruns of
+    the same query resume from its checkpoint.
+
+    Args:
+        query: The operation, either as a GraphQL string or sgqlc.Operation;
+            the cursor must be passed as a variable for the key to be stable.
+        path: The response keys leading to the connection.
+
+    Returns:
+        A short hexadecimal digest of the query and path.
+    """
+    digest = hashlib.sha256(str(query).encode("utf-8"))
+    digest.update(json.dumps(list(path)).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class CheckpointStore(ABC):
+    """
+    Storage for pagination checkpoints, keyed by traversal.
+    """
+
+    @abstractmethod
+    async def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Loads the checkpoint of a traversal.
+
+        Args:
+            key: The key of the traversal.
+
+        Returns:
+            The checkpoint, or None if the traversal has none.
+        """
+
+    @abstractmethod
+    async def save(self, key: str, checkpoint: Checkpoint):
+        """
+        Saves the checkpoint of a traversal, replacing the previous one.
+
+        Args:
+            key: The key of the traversal.
+            checkpoint: The progress of the traversal.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """
+        Deletes the checkpoint of a traversal, e.g. once it is complete.
+
+        Args:
+            key: The key of the traversal.
+        """
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in a local JSON file, which is replaced atomically so a
+    crash while saving never corrupts it.
+
+    Attributes:
+        path: The path of the JSON file.
+
+    Example:
+        Resume an export of every issue after a crash.
+        ```python
+        from prefect_github import GitHubCredentials
+        from prefect_github.checkpoints import FileCheckpointStore
+        from prefect_github.pagination import iterate_connection
+        from prefect_github.repository import query_repository_issues
+
+        github_credentials = GitHubCredentials.load("github-token")
+        store = FileCheckpointStore("issues-export.json")
+        async for issue in iterate_connection(
+            query_repository_issues,
+            ("repository", "issues"),
+            github_credentials,
+            owner="PrefectHQ",
+            name="prefect",
+            labels=None,
+            states=None,
+            checkpoint_store=store,
+        ):
+            export(issue)
+        ```
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reads every checkpoint in the file; must be called with the lock held.
+        """
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, checkpoints: Dict[str, Dict[str, Any]]):
+        """
+        Replaces the file with new contents; must be called with the lock held.
+        """
+        temporary_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(checkpoints, indent=2, sort_keys=True))
+        os.replace(temporary_path, self.path)
+
+    def _load(self, key: str) -> Optional[Checkpoint]:
+        with self._lock:
+            checkpoint = self._read().get(key)
+        return Checkpoint(**checkpoint) if checkpoint is not None else None
+
+    def _save(self, key: str, checkpoint: Optional[Checkpoint]):
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoint is None:
+                checkpoints.pop(key, None)
+            else:
+                checkpoints[key] = checkpoint._asdict()
+            self._write(checkpoints)
+
+    async def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Loads the checkpoint of a traversal.
+
+        Args:
+            key: The key of the traversal.
+
+        Returns:
+            The checkpoint, or None if the traversal has none.
+        """
+        return await to_thread.run_sync(self._load, key)
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        """
+        Saves the checkpoint of a traversal, replacing the previous one.
+
+        Args:
+            key: The key of the traversal.
+            checkpoint: The progress of the traversal.
+        """
+        await to_thread.run_sync(self._save, key, checkpoint)
+
+    async def delete(self, key: str):
+        """
+        Deletes the checkpoint of a traversal, e.g. once it is complete.
+
+        Args:
+            key: The key of the traversal.
+        """
+        await to_thread.run_sync(self._save, key, None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in a SQLite database, which several processes can share.
+
+    Attributes:
+        path: The path of the database file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _execute(self, statement: str, parameters: tuple = ()) -> list:
+        """
+        Runs a statement in its own transaction and returns the rows it read.
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = sqlite3.connect(
+                    self.path, timeout=30, check_same_thread=False
+                )
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS pagination_checkpoints ("
+                    "key TEXT PRIMARY KEY, "
+                    "cursor TEXT, "
+                    "pages INTEGER NOT NULL, "
+                    "items INTEGER NOT NULL, "
+                    "updated_at REAL NOT NULL)"
+                )
+            with self._connection:
+                return self._connection.execute(statement, parameters).fetchall()
+
+    async def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Loads the checkpoint of a traversal.
+
+        Args:
+            key: The key of the traversal.
+
+        Returns:
+            The checkpoint, or None if the traversal has none.
+        """
+        rows = await to_thread.run_sync(
+            self._execute,
+            "SELECT cursor, pages, items, updated_at "
+            "FROM pagination_checkpoints WHERE key = ?",
+            (key,),
+        )
+        return Checkpoint(*rows[0]) if rows else None
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        """
+        Saves the checkpoint of a traversal, replacing the previous one.
+
+        Args:
+            key: The key of the traversal.
+            checkpoint: The progress of the traversal.
+        """
+        await to_thread.run_sync(
+            self._execute,
+            "INSERT OR REPLACE INTO pagination_checkpoints VALUES (?, ?, ?, ?, ?)",
+            (key, *checkpoint),
+        )
+
+    async def delete(self, key: str):
+        """
+        Deletes the checkpoint of a traversal, e.g. once it is complete.
+
+        Args:
+            key: The key of the traversal.
+        """
+        await to_thread.run_sync(
+            self._execute, "DELETE FROM pagination_checkpoints WHERE key = ?", (key,)
+        )
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class BlockCheckpointStore(CheckpointStore):
+    """
+    Keeps each checkpoint in a Prefect JSON block, so that flow runs on any
+    infrastructure can resume from it.
+
+    Attributes:
+        prefix: The prefix of the names of the blocks.
+    """
+
+    def __init__(self, prefix: str = "github-checkpoint"):
+        self.prefix = prefix
+
+    def _get_block_name(self, key: str) -> str:
+        """
+        Builds a valid block name for a traversal key.
+        """
+        return re.sub(r"[^a-z0-9-]+", "-", f"{self.prefix}-{key}".lower())
+
+    async def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Loads the checkpoint of a traversal.
+
+        Args:
+            key: The key of the traversal.
+
+        Returns:
+            The checkpoint, or None if the traversal has none.
+        """
+        try:
+            block = await JSON.load(self._get_block_name(key))
+        except ValueError:  # no such block
+            return None
+        return Checkpoint(**block.value) if block.value else None
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        """
+        Saves the checkpoint of a traversal, replacing the previous one.
+
+        Args:
+            key: The key of the traversal.
+            checkpoint: The progress of the traversal.
+        """
+        block = JSON(value=checkpoint._asdict())
+        await block.save(self._get_block_name(key), overwrite=True)
+
+    async def delete(self, key: str):
+        """
+        Clears the checkpoint of a traversal, e.g. once it is complete.
+
+        Args:
+            key: The key of the traversal.
+        """
+        if await self.load(key) is not None:
+            await JSON(value=None).save(self._get_block_name(key), overwrite=True)
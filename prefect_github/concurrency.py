@@ -0,0 +1,347 @@
+"""
+Adaptive control of the number of GraphQL requests in flight against GitHub.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from prefect_github.rate_limit import (
+    get_budget_summary,
+    get_response_status,
+    parse_rate_limit_feedback,
+)
+
+# GraphQL error types that signal GitHub is struggling to serve the load.
+OVERLOAD_ERROR_TYPES = ("RATE_LIMITED", "RESOURCE_LIMITS_EXCEEDED")
+# The share of the concurrency limit that low priority requests leave free.
+RESERVED_CONCURRENCY_FRACTION = 0.25
+# The share of the hourly points that low priority requests leave unspent.
+RESERVED_BUDGET_FRACTION = 0.1
+# The longest low priority requests sleep before checking the budget again.
+BUDGET_POLL_INTERVAL = 60.0
+
+
+class RequestPriority(str, Enum):
+    """
+    The lane a request is scheduled in when several flows share a token.
+
+    High priority requests, e.g. interactive ones, are granted slots first and
+    may use the capacity and rate-limit budget reserved from low priority
+    requests, e.g. batch backfills. Normal priority requests are granted slots
+    after high priority ones but are otherwise unrestricted.
+    """
+
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+    @property
+    def rank(self) -> int:
+        """
+        The order in which waiting requests of this priority are granted slots.
+        """
+        return _PRIORITY_RANKS[self]
+
+
+_PRIORITY_RANKS = {
+    RequestPriority.HIGH: 0,
+    RequestPriority.NORMAL: 1,
+    RequestPriority.LOW: 2,
+}
+
+
+def is_overloaded(result: Dict[str, Any]) -> bool:
+    """
+    Checks whether a raw sgqlc endpoint result signals that GitHub is
+    throttling requests or failing under load, as opposed to rejecting the
+    request itself.
+
+    Args:
+        result: The dict returned by calling an sgqlc endpoint.
+
+    Returns:
+        True for throttled responses, server errors and timeouts.
+    """
+    if parse_rate_limit_feedback(result).throttled:
+        return True
+    if get_response_status(result) >= 500:
+        return True
+    errors = result.get("errors")
+    if not isinstance(errors, list):
+        return False
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        message = str(error.get("message", "")).lower()
+        if error.get("type") in OVERLOAD_ERROR_TYPES or "timeout" in message:
+            return True
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of requests in flight, adapting the limit with additive
+    increase and multiplicative decrease (AIMD).
+
+    Every fast, healthy response raises the limit by `increase / limit`, i.e.
+    by `increase` once a full window of requests succeeded. A throttled or
+    failed response cuts the limit by `decrease_factor`, at most once per
+    window: responses to requests sent before the last cut are not counted
+    again. Responses slower than `latency_threshold` hold the limit steady.
+
+    Waiting requests are granted slots in order of priority, then arrival, and
+    low priority requests never take the last `reserved_fraction` of the limit,
+    so that high priority requests find a free slot quickly.
+
+    The limiter can be shared across threads and event loops, since Prefect may
+    run tasks in either.
+
+    Attributes:
+        min_limit: The lowest the limit is cut to.
+        max_limit: The highest the limit is raised to.
+        increase: The number of slots added per window of healthy responses.
+        decrease_factor: The factor the limit is multiplied by on overload.
+        latency_threshold: The response time, in seconds, above which the
+            limit stops growing.
+        reserved_fraction: The share of the limit kept free of low priority
+            requests.
+
+    Example:
+        Inspect the concurrency the executor settled on for some credentials.
+        ```python
+        from prefect_github import GitHubCredentials
+        from prefect_github.concurrency import get_concurrency_limiter
+
+        github_credentials = GitHubCredentials.load("github-token")
+        github_credentials.max_concurrent_requests = 8
+        limiter = get_concurrency_limiter(github_credentials)
+        print(limiter.limit, limiter.in_flight)
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 10.0,
+        reserved_fraction: float = RESERVED_CONCURRENCY_FRACTION,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.reserved_fraction = reserved_fraction
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._waiters: List[
+            Tuple[int, int, RequestPriority, asyncio.AbstractEventLoop, asyncio.Future]
+        ] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """
+        The number of requests currently allowed in flight.
+        """
+        return max(int(self._limit), self.min_limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently in flight.
+        """
+        return self._in_flight
+
+    def get_limit(self, priority: RequestPriority = RequestPriority.NORMAL) -> int:
+        """
+        Gets the number of requests in flight up to which a request of some
+        priority may be sent.
+
+        Args:
+            priority: The priority of the request.
+
+        Returns:
+            The limit, less the reserved slots for low priority requests.
+        """
+        limit = self.limit
+        if RequestPriority(priority) is not RequestPriority.LOW:
+            return limit
+        reserved = int(limit * self.reserved_fraction + 0.5)
+        return max(limit - reserved, 1)
+
+    def _grant_waiters(self):
+        """
+        Hands free slots to waiting requests; must be called with the lock held.
+        """
+        while self._waiters:
+            if self._in_flight >= self.get_limit(self._waiters[0][2]):
+                # the waiters behind have the same or a lower priority
+                return
+            _, _, _, loop, future = heapq.heappop(self._waiters)
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._resolve_waiter, future)
+
+    def _resolve_waiter(self, future: asyncio.Future):
+        """
+        Wakes a waiting request on its own event loop, giving the slot back if
+        the request was cancelled in the meantime.
+        """
+        if future.done():
+            self._free_slot()
+        else:
+            future.set_result(None)
+
+    def _free_slot(self):
+        """
+        Frees a slot without recording a response.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._grant_waiters()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL):
+        """
+        Waits until a request may be sent.
+
+        Args:
+            priority: The priority of the request.
+        """
+        priority = RequestPriority(priority)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            ahead = self._waiters and self._waiters[0][0] <= priority.rank
+            if self._in_flight < self.get_limit(priority) and not ahead:
+                self._in_flight += 1
+                return
+            future = loop.create_future()
+            waiter = (priority.rank, next(self._counter), priority, loop, future)
+            heapq.heappush(self._waiters, waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # woken with a slot right before being cancelled
+                self._free_slot()
+                raise
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:  # already granted a slot, which is freed on wake
+                    pass
+                else:
+                    heapq.heapify(self._waiters)
+                    self._grant_waiters()
+            raise
+
+    def release(self, started_at: float, overloaded: bool = False):
+        """
+        Frees the slot of a finished request and adapts the limit to how the
+        request went.
+
+        Args:
+            started_at: The `time.monotonic()` time the request was sent at.
+            overloaded: Whether the response signalled throttling or overload.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            if overloaded:
+                if started_at >= self._last_decrease:
+                    self._limit = max(
+                        self._limit * self.decrease_factor, self.min_limit
+                    )
+                    self._last_decrease = now
+            elif now - started_at <= self.latency_threshold:
+                self._limit = min(
+                    self._limit + self.increase / self._limit, self.max_limit
+                )
+            self._grant_waiters()
+
+
+_LIMITERS: Dict[Tuple[str, int], AdaptiveConcurrencyLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_credentials_key(github_credentials: Any) -> str:
+    """
+    Identifies the rate-limit budget that requests sent with some credentials
+    draw from.
+
+    Args:
+        github_credentials: The credentials requests are sent with.
+
+    Returns:
+        A stable, non-secret key for the credentials.
+    """
+    get_budget_key = getattr(github_credentials, "_get_budget_key", None)
+    if get_budget_key is None:
+        return "default"
+    return get_budget_key()
+
+
+def get_concurrency_limiter(
+    github_credentials: Optional[Any] = None,
+) -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    Gets the process-wide limiter for requests sent with some credentials,
+    if they limit concurrency.
+
+    Args:
+        github_credentials: The credentials requests are sent with.
+
+    Returns:
+        The limiter shared by every request sent with the credentials, or None
+        if the credentials set no `max_concurrent_requests`.
+    """
+    initial_limit = getattr(github_credentials, "max_concurrent_requests", None)
+    if not initial_limit:
+        return None
+    key = (get_credentials_key(github_credentials), initial_limit)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = AdaptiveConcurrencyLimiter(
+                initial_limit=initial_limit
+            )
+        return limiter
+
+
+async def wait_for_rate_limit_budget(
+    fingerprints: Iterable[str],
+    priority: RequestPriority = RequestPriority.NORMAL,
+    reserved_fraction: float = RESERVED_BUDGET_FRACTION,
+):
+    """
+    Holds back low priority requests while the rate-limit budget of the tokens
+    they would be sent with is within the share reserved for other requests,
+    until the budget resets. Other requests are never held back.
+
+    Args:
+        fingerprints: The fingerprints of the tokens the request draws from.
+        priority: The priority of the request.
+        reserved_fraction: The share of the hourly points kept for high and
+            normal priority requests.
+    """
+    if RequestPriority(priority) is not RequestPriority.LOW:
+        return
+    fingerprints = list(fingerprints)
+    while True:
+        available, limit, reset_at = get_budget_summary(fingerprints)
+        if available > limit * reserved_fraction:
+            return
+        delay = min(reset_at - time.time(), BUDGET_POLL_INTERVAL)
+        if delay <= 0:
+            return
+        await asyncio.sleep(delay)
@@ -0,0 +1,526 @@
+"""
+Coordination of the rate-limit budget of a token across worker processes, so
+that workers sharing a token draw from a single budget instead of pacing
+themselves in isolation.
+"""
+
+import asyncio
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+from urllib.parse import unquote, urlparse
+
+from anyio import to_thread
+
+from prefect_github.exceptions import BudgetCoordinatorError
+from prefect_github.rate_limit import (
+    DEFAULT_POINTS_PER_HOUR,
+    RateLimitFeedback,
+    get_cooldown_until,
+)
+
+# The window assumed for a token until GitHub reports when its budget resets.
+DEFAULT_BUDGET_WINDOW = 3600
+# The delay before asking again when the reset time of a budget is unknown.
+DEFAULT_RETRY_DELAY = 1.0
+# The Redis commands that can be sent again when their reply was lost, since
+# the server applying them twice has the same effect as applying them once.
+IDEMPOTENT_REDIS_COMMANDS = ("AUTH", "SELECT", "GET", "SET", "PTTL")
+
+
+class BudgetCoordinator(ABC):
+    """
+    Shared view of the rate-limit budget of tokens, backed by storage that
+    every worker can reach.
+
+    Workers reserve points before sending a request and record the rate-limit
+    headers of the response afterwards. The remaining budget is only ever
+    lowered by responses within a window, since responses to requests sent
+    by other workers may arrive out of order, and it starts over once the
+    window resets.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, points: int = 1) -> float:
+        """
+        Reserves points of a token's budget for a request.
+
+        Args:
+            key: The fingerprint of the token.
+            points: The points the request is expected to cost.
+
+        Returns:
+            Zero if the points were reserved, otherwise the number of seconds
+            to wait before trying again.
+        """
+
+    @abstractmethod
+    def record(self, key: str, feedback: RateLimitFeedback):
+        """
+        Updates a token's budget from the feedback of a response.
+
+        Args:
+            key: The fingerprint of the token.
+            feedback: The feedback parsed from the response.
+        """
+
+    def close(self):
+        """
+        Releases the connections held by the coordinator.
+        """
+
+
+class SQLiteBudgetCoordinator(BudgetCoordinator):
+    """
+    Coordinates the workers of a single host through a SQLite database, whose
+    file locks serialize the updates of concurrent processes.
+
+    Attributes:
+        path: The path of the database file.
+        timeout: The seconds to wait for another process to release the lock.
+
+    Example:
+        Share the budget of a token between the workers of a host.
+        ```python
+        from prefect_github.coordination import SQLiteBudgetCoordinator
+
+        coordinator = SQLiteBudgetCoordinator("/var/tmp/github-budget.db")
+        delay = coordinator.reserve("token-fingerprint")
+        ```
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens the database, creating the budget table if needed; must be called
+        with the lock held.
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_budgets ("
+                "key TEXT PRIMARY KEY, "
+                "budget_limit INTEGER NOT NULL, "
+                "remaining INTEGER NOT NULL, "
+                "reset_at REAL NOT NULL, "
+                "cooldown_until REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _update(self, key: str, update) -> Any:
+        """
+        Reads and writes the budget of a token within a single transaction.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT budget_limit, remaining, reset_at, cooldown_until "
+                    "FROM token_budgets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    row = (DEFAULT_POINTS_PER_HOUR, DEFAULT_POINTS_PER_HOUR, 0.0, 0.0)
+                budget = dict(
+                    zip(("limit", "remaining", "reset_at", "cooldown_until"), row)
+                )
+                result = update(budget, time.time())
+                connection.execute(
+                    "INSERT OR REPLACE INTO token_budgets VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        budget["limit"],
+                        budget["remaining"],
+                        budget["reset_at"],
+                        budget["cooldown_until"],
+                    ),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def reserve(self, key: str, points: int = 1) -> float:
+        """
+        Reserves points of a token's budget for a request.
+
+        Args:
+            key: The fingerprint of the token.
+            points: The points the request is expected to cost.
+
+        Returns:
+            Zero if the points were reserved, otherwise the number of seconds
+            to wait before trying again.
+        """
+
+        def update(budget: Dict[str, Any], now: float) -> float:
+            if now < budget["cooldown_until"]:
+                return budget["cooldown_until"] - now
+            if now >= budget["reset_at"]:
+                budget["remaining"] = budget["limit"]
+                budget["reset_at"] = now + DEFAULT_BUDGET_WINDOW
+            if budget["remaining"] < points:
+                return budget["reset_at"] - now
+            budget["remaining"] -= points
+            return 0.0
+
+        return self._update(key, update)
+
+    def record(self, key: str, feedback: RateLimitFeedback):
+        """
+        Updates a token's budget from the feedback of a response.
+
+        Args:
+            key: The fingerprint of the token.
+            feedback: The feedback parsed from the response.
+        """
+
+        def update(budget: Dict[str, Any], now: float):
+            if feedback.limit is not None:
+                budget["limit"] = feedback.limit
+            if feedback.remaining is not None and feedback.reset_at is not None:
+                if feedback.reset_at != budget["reset_at"]:
+                    budget["remaining"] = feedback.remaining
+                    budget["reset_at"] = feedback.reset_at
+                else:
+                    budget["remaining"] = min(budget["remaining"], feedback.remaining)
+            cooldown_until = get_cooldown_until(feedback, now)
+            if cooldown_until is not None:
+                budget["cooldown_until"] = max(budget["cooldown_until"], cooldown_until)
+
+        self._update(key, update)
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class RedisBudgetCoordinator(BudgetCoordinator):
+    """
+    Coordinates workers across hosts through any server speaking the Redis
+    protocol, using only commands that are atomic on their own.
+
+    Each token's budget is a counter that expires when its window resets, so
+    that reserving points is a single `DECRBY`. Throttled tokens get a cooldown
+    key that expires when GitHub allows them again.
+
+    Attributes:
+        host: The host of the server.
+        port: The port of the server.
+        db: The database to select.
+        password: The password to authenticate with, if any.
+        username: The user to authenticate as, if any.
+        use_ssl: Whether to connect over TLS.
+        prefix: The prefix of the keys the coordinator writes.
+        timeout: The socket timeout in seconds.
+
+    Example:
+        Share the budget of a token between workers on several hosts.
+        ```python
+        from prefect_github.coordination import get_budget_coordinator
+
+        coordinator = get_budget_coordinator("redis://redis.internal:6379/0")
+        delay = coordinator.reserve("token-fingerprint")
+        ```
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        username: Optional[str] = None,
+        use_ssl: bool = False,
+        prefix: str = "prefect-github:budget",
+        timeout: float = 10.0,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.username = username
+        self.use_ssl = use_ssl
+        self.prefix = prefix
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """
+        Opens the connection, authenticating and selecting the database; must be
+        called with the lock held.
+        """
+        sock = socket.create_connection((self.host, self.port), self.timeout)
+        if self.use_ssl:
+            sock = ssl.create_default_context().wrap_socket(
+                sock, server_hostname=self.host
+            )
+        self._socket = sock
+        self._reader = sock.makefile("rb")
+        try:
+            if self.password is not None:
+                credentials = [self.password]
+                if self.username is not None:
+                    credentials.insert(0, self.username)
+                self._send("AUTH", *credentials)
+            if self.db:
+                self._send("SELECT", self.db)
+        except BaseException:
+            self._disconnect()
+            raise
+
+    def _disconnect(self):
+        """
+        Drops the connection; must be called with the lock held.
+        """
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+        self._socket = self._reader = None
+
+    def _read_reply(self) -> Any:
+        """
+        Reads a single RESP reply from the server.
+        """
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("The Redis server closed the connection.")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise BudgetCoordinatorError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2].decode("utf-8")
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise BudgetCoordinatorError(
+            f"Unexpected reply from the Redis server: {line!r}"
+        )
+
+    def _write(self, *args: Union[str, int, float]):
+        """
+        Writes a command to the open connection.
+        """
+        parts = [str(arg).encode("utf-8") for arg in args]
+        message = b"*%d\r\n" % len(parts) + b"".join(
+            b"$%d\r\n%s\r\n" % (len(part), part) for part in parts
+        )
+        self._socket.sendall(message)
+
+    def _send(self, *args: Union[str, int, float]) -> Any:
+        """
+        Sends a command over the open connection and reads its reply.
+        """
+        self._write(*args)
+        return self._read_reply()
+
+    def execute(self, *args: Union[str, int, float]) -> Any:
+        """
+        Sends a command, reconnecting once if the connection was dropped.
+
+        A command whose reply was lost is only sent again if it is idempotent,
+        since the server may have applied it; e.g. a `DECRBY` is not.
+
+        Args:
+            *args: The command and its arguments.
+
+        Returns:
+            The decoded reply.
+        """
+        retriable = str(args[0]).upper() in IDEMPOTENT_REDIS_COMMANDS
+        with self._lock:
+            for attempt in range(2):
+                if self._socket is None:
+                    self._connect()
+                written = False
+                try:
+                    self._write(*args)
+                    written = True
+                    return self._read_reply()
+                except (ConnectionError, OSError):
+                    self._disconnect()
+                    if attempt or (written and not retriable):
+                        raise
+
+    def _key(self, key: str, name: str) -> str:
+        """
+        Builds the name of a key holding part of a token's budget.
+        """
+        return f"{self.prefix}:{key}:{name}"
+
+    def reserve(self, key: str, points: int = 1) -> float:
+        """
+        Reserves points of a token's budget for a request.
+
+        Args:
+            key: The fingerprint of the token.
+            points: The points the request is expected to cost.
+
+        Returns:
+            Zero if the points were reserved, otherwise the number of seconds
+            to wait before trying again.
+        """
+        cooldown = self.execute("PTTL", self._key(key, "cooldown"))
+        if cooldown > 0:
+            return cooldown / 1000
+
+        remaining_key = self._key(key, "remaining")
+        limit = self.execute("GET", self._key(key, "limit"))
+        limit = int(limit) if limit is not None else DEFAULT_POINTS_PER_HOUR
+        self.execute("SET", remaining_key, limit, "EX", DEFAULT_BUDGET_WINDOW, "NX")
+        if self.execute("DECRBY", remaining_key, points) >= 0:
+            return 0.0
+        self.execute("INCRBY", remaining_key, points)
+        reset_in = self.execute("PTTL", remaining_key)
+        return reset_in / 1000 if reset_in > 0 else DEFAULT_RETRY_DELAY
+
+    def record(self, key: str, feedback: RateLimitFeedback):
+        """
+        Updates a token's budget from the feedback of a response.
+
+        Args:
+            key: The fingerprint of the token.
+            feedback: The feedback parsed from the response.
+        """
+        now = time.time()
+        if feedback.limit is not None:
+            self.execute("SET", self._key(key, "limit"), feedback.limit)
+
+        if (
+            feedback.remaining is not None
+            and feedback.reset_at is not None
+            and feedback.reset_at > now
+        ):
+            remaining_key = self._key(key, "remaining")
+            remaining = self.execute("GET", remaining_key)
+            reset_in = self.execute("PTTL", remaining_key)
+            # a reset time far from the counter's expiry means a new window
+            new_window = abs(reset_in / 1000 - (feedback.reset_at - now)) > 1
+            if remaining is None or new_window or int(remaining) > feedback.remaining:
+                self.execute(
+                    "SET",
+                    remaining_key,
+                    feedback.remaining,
+                    "PX",
+                    int((feedback.reset_at - now) * 1000),
+                )
+
+        cooldown_until = get_cooldown_until(feedback, now)
+        if cooldown_until is not None and cooldown_until > now:
+            cooldown_key = self._key(key, "cooldown")
+            cooldown_in = int((cooldown_until - now) * 1000)
+            if cooldown_in > self.execute("PTTL", cooldown_key):
+                self.execute("SET", cooldown_key, 1, "PX", cooldown_in)
+
+    def close(self):
+        """
+        Closes the connection to the server.
+        """
+        with self._lock:
+            self._disconnect()
+
+
+def create_budget_coordinator(url: str) -> BudgetCoordinator:
+    """
+    Creates a coordinator from the URL of its storage.
+
+    Args:
+        url: Either `sqlite:///path/to/file.db`, or
+            `redis://[[username]:password@]host[:port][/db]`, or `rediss://`
+            for Redis over TLS.
+
+    Returns:
+        The coordinator.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "sqlite":
+        return SQLiteBudgetCoordinator(unquote(parsed.path) or ":memory:")
+    if parsed.scheme in ("redis", "rediss"):
+        db = parsed.path.strip("/")
+        return RedisBudgetCoordinator(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            username=unquote(parsed.username) if parsed.username else None,
+            use_ssl=parsed.scheme == "rediss",
+        )
+    raise ValueError(
+        f"Unsupported rate-limit coordinator URL scheme {parsed.scheme!r}; "
+        "use sqlite, redis or rediss."
+    )
+
+
+_COORDINATORS: Dict[str, BudgetCoordinator] = {}
+_COORDINATORS_LOCK = threading.Lock()
+
+
+def get_budget_coordinator(url: str) -> BudgetCoordinator:
+    """
+    Gets the process-wide coordinator for a storage URL, creating it if needed.
+
+    Args:
+        url: The URL of the storage, see `create_budget_coordinator`.
+
+    Returns:
+        The coordinator shared by every client using the URL in this process.
+    """
+    with _COORDINATORS_LOCK:
+        coordinator = _COORDINATORS.get(url)
+        if coordinator is None:
+            coordinator = _COORDINATORS[url] = create_budget_coordinator(url)
+        return coordinator
+
+
+async def reserve_shared_budget(
+    coordinator: BudgetCoordinator, key: str, points: int = 1
+):
+    """
+    Waits until points of a token's shared budget are reserved.
+
+    Args:
+        coordinator: The coordinator of the budget.
+        key: The fingerprint of the token.
+        points: The points the request is expected to cost.
+    """
+    delay = await to_thread.run_sync(coordinator.reserve, key, points)
+    while delay > 0:
+        await asyncio.sleep(delay)
+        delay = await to_thread.run_sync(coordinator.reserve, key, points)
@@ -0,0 +1,290 @@
+"""
+Local estimation of the rate-limit cost of GitHub GraphQL operations, following
+GitHub's published rules for calculating a query's point cost and node count.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    value_from_ast_untyped,
+)
+from sgqlc.operation import Operation
+
+from prefect_github.utils import (
+    get_named_type,
+    get_operation_definition,
+    get_root_type,
+    get_schema_field,
+    get_schema_type,
+    parse_graphql_document,
+)
+
+# GitHub rejects operations that could return more nodes than this.
+MAX_NODE_LIMIT = 500_000
+# The largest page GitHub serves; assumed for connections missing first/last.
+MAX_PAGE_SIZE = 100
+PAGINATION_ARGUMENTS = ("first", "last")
+
+
+class ConnectionCost(NamedTuple):
+    """
+    The contribution of a single connection to the cost of an operation.
+
+    Attributes:
+        path: The dotted path of the connection, using aliases if present.
+        page_size: The number of nodes requested per parent, from first/last.
+        parent_count: The number of parents the connection is requested for,
+            i.e. the product of the page sizes of the enclosing connections.
+    """
+
+    path: str
+    page_size: int
+    parent_count: int
+
+    @property
+    def node_count(self) -> int:
+        """
+        The maximum number of nodes the connection can return.
+        """
+        return self.page_size * self.parent_count
+
+
+class QueryCost(NamedTuple):
+    """
+    The estimated cost of an operation.
+
+    Attributes:
+        points: The rate-limit points GitHub will charge for the operation.
+        node_count: The maximum number of nodes the operation can return.
+        connections: The contribution of every connection in the operation.
+    """
+
+    points: int
+    node_count: int
+    connections: List[ConnectionCost]
+
+    @property
+    def exceeds_node_limit(self) -> bool:
+        """
+        Whether GitHub will reject the operation for requesting too many nodes.
+        """
+        return self.node_count > MAX_NODE_LIMIT
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarizes the estimate as plain data, e.g. to return from a task.
+
+        Returns:
+            A dict of the points, node count and per-connection breakdown.
+        """
+        return {
+            "points": self.points,
+            "node_count": self.node_count,
+            "exceeds_node_limit": self.exceeds_node_limit,
+            "connections": [
+                dict(connection._asdict(), node_count=connection.node_count)
+                for connection in self.connections
+            ],
+        }
+
+
+def get_page_size(
+    field: FieldNode,
+    variables: Dict[str, Any],
+    variable_defaults: Optional[Dict[str, Any]] = None,
+) -> Optional[int]:
+    """
+    Reads the page size requested by a field through its first/last arguments.
+
+    Args:
+        field: The field node to inspect.
+        variables: The variables the operation is sent with.
+        variable_defaults: The default values declared for the variables.
+
+    Returns:
+        The page size, or None if the field has neither argument.
+    """
+    variable_defaults = variable_defaults or {}
+    sizes = []
+    for argument in field.arguments or ():
+        if argument.name.value not in PAGINATION_ARGUMENTS:
+            continue
+        if isinstance(argument.value, VariableNode):
+            name = argument.value.name.value
+            value = variables.get(name, variable_defaults.get(name))
+        else:
+            value = value_from_ast_untyped(argument.value)
+        if value is not None:
+            sizes.append(int(value))
+    return max(sizes) if sizes else None
+
+
+def is_connection_type(schema_type: Optional[type]) -> bool:
+    """
+    Checks whether a `graphql_schema` type is a paginated connection.
+
+    Args:
+        schema_type: The named type returned by a field.
+
+    Returns:
+        True if the type follows the connection pattern.
+    """
+    return (
+        schema_type is not None
+        and get_schema_field(schema_type, "pageInfo") is not None
+    )
+
+
+def _get_variable_defaults(operation: OperationDefinitionNode) -> Dict[str, Any]:
+    """
+    Collects the default values declared for an operation's variables.
+    """
+    return {
+        definition.variable.name.value: value_from_ast_untyped(definition.default_value)
+        for definition in operation.variable_definitions or ()
+        if definition.default_value is not None
+    }
+
+
+def _collect_connections(
+    selection_set: SelectionSetNode,
+    container_type: Optional[type],
+    path: List[str],
+    parent_count: int,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Dict[str, Any],
+    variable_defaults: Dict[str, Any],
+    connections: List[ConnectionCost],
+):
+    """
+    Walks a selection set, recording every connection along with the number of
+    parents it is requested for.
+    """
+    for selection in selection_set.selections:
+        if isinstance(selection, (InlineFragmentNode, FragmentSpreadNode)):
+            if isinstance(selection, FragmentSpreadNode):
+                selection = fragments[selection.name.value]
+            fragment_type = container_type
+            if selection.type_condition is not None:
+                fragment_type = get_schema_type(selection.type_condition.name.value)
+            _collect_connections(
+                selection.selection_set,
+                fragment_type,
+                path,
+                parent_count,
+                fragments,
+                variables,
+                variable_defaults,
+                connections,
+            )
+            continue
+
+        name = selection.name.value
+        if name.startswith("__"):
+            continue
+
+        field_type = None
+        if container_type is not None:
+            schema_field = get_schema_field(container_type, name)
+            if schema_field is not None:
+                field_type = get_named_type(schema_field.type)
+
+        field_path = path + [selection.alias.value if selection.alias else name]
+        child_count = parent_count
+        page_size = get_page_size(selection, variables, variable_defaults)
+        if page_size is not None or is_connection_type(field_type):
+            if page_size is None:
+                page_size = MAX_PAGE_SIZE
+            connections.append(
+                ConnectionCost(
+                    path=".".join(field_path),
+                    page_size=page_size,
+                    parent_count=parent_count,
+                )
+            )
+            child_count = parent_count * page_size
+
+        if selection.selection_set is not None:
+            _collect_connections(
+                selection.selection_set,
+                field_type,
+                field_path,
+                child_count,
+                fragments,
+                variables,
+                variable_defaults,
+                connections,
+            )
+
+
+def estimate_query_cost(
+    op: Union[Operation, str, DocumentNode],
+    operation_name: Optional[str] = None,
+    **vars,
+) -> QueryCost:
+    """
+    Estimates the rate-limit points and node count of an operation without
+    sending it.
+
+    GitHub assumes every connection returns a full page. A connection is
+    requested once per node of its enclosing connections, the point cost is
+    the total number of such requests divided by 100, rounded, with a minimum
+    of one point, and the node count is the sum of the nodes every connection
+    can return.
+
+    Args:
+        op: The operation, either as a valid GraphQL string, sgqlc.Operation,
+            or parsed GraphQL document.
+        operation_name: The operation to estimate if the document has several.
+        **vars: The variables the operation would be sent with.
+
+    Returns:
+        The estimated cost.
+
+    Example:
+        Estimates the cost of listing comments on a hundred issues.
+        ```python
+        from sgqlc.operation import Operation
+        from prefect_github.cost import estimate_query_cost
+        from prefect_github.schemas import graphql_schema
+
+        op = Operation(graphql_schema.Query)
+        issues = op.repository(owner="PrefectHQ", name="prefect").issues(first=100)
+        issues.nodes().comments(first=50).nodes().__fields__("body")
+        cost = estimate_query_cost(op)  # 1 point, 5,100 nodes
+        ```
+    """
+    if not isinstance(op, DocumentNode):
+        op = parse_graphql_document(op)
+    operation = get_operation_definition(op, operation_name)
+    fragments = {
+        definition.name.value: definition
+        for definition in op.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    connections: List[ConnectionCost] = []
+    _collect_connections(
+        operation.selection_set,
+        get_root_type(operation),
+        [],
+        1,
+        fragments,
+        vars,
+        _get_variable_defaults(operation),
+        connections,
+    )
+    requests = sum(connection.parent_count for connection in connections)
+    return QueryCost(
+        points=max(1, int(requests / 100 + 0.5)),
+        node_count=sum(connection.node_count for connection in connections),
+        connections=connections,
+    )
@@ -1,18 +1,115 @@
 """Credential classes used to perform authenticated interactions with GitHub"""
 
+import base64
+import json
+import threading
+import time
+import urllib.request
 import warnings
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from prefect.blocks.abstract import CredentialsBlock
+from prefect.logging import get_logger
 from pydantic import Field, SecretStr
 from sgqlc.endpoint.http import HTTPEndpoint
 
+from prefect_github.coordination import BudgetCoordinator, get_budget_coordinator
+from prefect_github.rate_limit import (
+    acquire_token_budget,
+    defer_token_budget,
+    get_token_budget,
+    parse_rate_limit_feedback,
+    release_token_budget,
+    token_fingerprint,
+)
 
-class GitHubCredentials(CredentialsBlock):
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# GitHub rejects app JWTs that are valid for more than ten minutes.
+APP_JWT_LIFETIME = 540
+# Installation tokens are refreshed in the background once they are used this
+# many seconds or less before they expire.
+INSTALLATION_TOKEN_REFRESH_MARGIN = 300
+# How long, in seconds, minting an installation token may take.
+INSTALLATION_TOKEN_TIMEOUT = 30
+
+logger = get_logger(__name__)
+
+
+class _GitHubCredentialsBase(CredentialsBlock, ABC):
+    """
+    The settings and rate-limit bookkeeping shared by the GitHub credentials
+    blocks, however they authenticate.
+    """
+
+    rate_limit_coordinator_url: Optional[SecretStr] = Field(
+        default=None,
+        description=(
+            "The URL of a SQLite database (sqlite:///path) or Redis server "
+            "(redis://host:port/db) through which workers share the rate-limit "
+            "budget of their tokens."
+        ),
+    )
+    query_batch_window: Optional[float] = Field(
+        default=None,
+        description=(
+            "How long, in seconds, concurrent queries are collected to be sent "
+            "as a single request; leave unset to send every query on its own."
+        ),
+    )
+    max_concurrent_requests: Optional[int] = Field(
+        default=None,
+        description=(
+            "How many GraphQL requests may be in flight at first; the limit then "
+            "adapts to how GitHub responds. Leave unset to send requests without "
+            "a limit."
+        ),
+    )
+
+    @abstractmethod
+    def _get_budget_key(self) -> str:
+        """
+        Identifies the rate-limit budget requests sent with the block draw from.
+        """
+
+    def _get_budget_fingerprints(self) -> List[str]:
+        """
+        Lists the fingerprints of the tokens whose budget requests draw from.
+        """
+        return [self._get_budget_key()]
+
+    def _get_budget_coordinator(self) -> Optional[BudgetCoordinator]:
+        """
+        Gets the coordinator of the budget shared with other workers, if any.
+        """
+        if self.rate_limit_coordinator_url is None:
+            return None
+        return get_budget_coordinator(
+            self.rate_limit_coordinator_url.get_secret_value()
+        )
+
+
+class GitHubCredentials(_GitHubCredentialsBase):
     """
     Block used to manage GitHub authentication.
 
     Attributes:
         token: the token to authenticate into GitHub.
+        rate_limit_coordinator_url: The URL of storage shared by workers that
+            use the same token, so that they draw from a single rate-limit
+            budget; either `sqlite:///path/to/file.db` for workers on one
+            host, or `redis://host:port/db` for workers across hosts.
+        query_batch_window: How long, in seconds, concurrent queries are
+            collected to be sent as a single aliased request; batching is
+            disabled when unset.
+        max_concurrent_requests: The number of GraphQL requests that may be
+            in flight at first, which then adapts to throttling and latency;
+            requests are not limited when unset.
 
     Examples:
         Load stored GitHub credentials:
@@ -30,6 +127,13 @@ class GitHubCredentials(CredentialsBlock):
         default=None, description="A GitHub personal access token (PAT)."
     )
 
+    def _get_budget_key(self) -> str:
+        """
+        Identifies the rate-limit budget requests sent with the block draw from.
+        """
+        token = self.token.get_secret_value() if self.token is not None else None
+        return token_fingerprint(token)
+
     def get_client(self) -> HTTPEndpoint:
         """
         Gets an authenticated GitHub GraphQL HTTPEndpoint client.
@@ -52,9 +156,7 @@ class GitHubCredentials(CredentialsBlock):
         else:
             base_headers = None
 
-        endpoint = HTTPEndpoint(
-            "https://api.github.com/graphql", base_headers=base_headers
-        )
+        endpoint = HTTPEndpoint(GITHUB_GRAPHQL_URL, base_headers=base_headers)
         return endpoint
 
     def get_endpoint(self) -> HTTPEndpoint:
@@ -86,3 +188,429 @@ class GitHubCredentials(CredentialsBlock):
             DeprecationWarning,
         )
         return self.get_client()
+
+
+class PooledHTTPEndpoint:
+    """
+    GraphQL client that sends each request with whichever pooled token has the
+    most rate-limit budget left.
+
+    It is called like `sgqlc.endpoint.http.HTTPEndpoint`. The budget of every
+    token is updated from the rate-limit headers of its responses; a token that
+    gets throttled is taken out of rotation until GitHub allows it again, and
+    the request is retried once with each of the other tokens.
+
+    With a coordinator, points are reserved from the budget shared with other
+    workers before a token is used; tokens whose shared budget is spent are
+    taken out of rotation until it resets, and the request waits if all are.
+
+    Attributes:
+        endpoints: The per-token endpoints, keyed by token fingerprint.
+        scopes: The OAuth scopes that requests sent by this client need.
+        coordinator: The coordinator of the budget shared with other workers.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        scopes: Iterable[str] = (),
+        coordinator: Optional[BudgetCoordinator] = None,
+    ):
+        self.endpoints: Dict[str, HTTPEndpoint] = {
+            token_fingerprint(token): HTTPEndpoint(
+                GITHUB_GRAPHQL_URL, base_headers={"Authorization": f"Bearer {token}"}
+            )
+            for token in tokens
+        }
+        self.scopes = frozenset(scopes)
+        self.coordinator = coordinator
+
+    def _reserve(self, fingerprint: str, points: int = 1) -> bool:
+        """
+        Reserves points of the token's shared budget, waiting if every token
+        is out of rotation.
+
+        Returns:
+            False if the token's shared budget is spent.
+        """
+        if self.coordinator is None:
+            return True
+        # only tokens that are all out of rotation get picked while cooling down
+        wait = get_token_budget(fingerprint).cooldown_until - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        delay = self.coordinator.reserve(fingerprint, points)
+        if delay > 0:
+            defer_token_budget(fingerprint, time.time() + delay)
+            return False
+        return True
+
+    def __call__(
+        self,
+        query,
+        variables=None,
+        operation_name=None,
+        extra_headers=None,
+        timeout=None,
+        points: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Sends the request with the least-loaded token.
+
+        Args:
+            query: The GraphQL query or mutation to execute.
+            variables: The variables to send alongside the query.
+            operation_name: The operation to run if the query has several.
+            extra_headers: Extra HTTP headers to send.
+            timeout: Overrides the default timeout.
+            points: The rate-limit points the request is expected to cost,
+                reserved from the shared budget of the token it is sent with.
+
+        Returns:
+            The raw sgqlc result of the last attempt.
+        """
+        tried = []
+        while True:
+            fingerprint = acquire_token_budget(
+                self.endpoints, scopes=self.scopes, exclude=tried
+            )
+            feedback = None
+            try:
+                if not self._reserve(fingerprint, points):
+                    continue
+                result = self.endpoints[fingerprint](
+                    query,
+                    variables=variables,
+                    operation_name=operation_name,
+                    extra_headers=extra_headers,
+                    timeout=timeout,
+                )
+                feedback = parse_rate_limit_feedback(result)
+            finally:
+                release_token_budget(fingerprint, feedback)
+            if self.coordinator is not None:
+                self.coordinator.record(fingerprint, feedback)
+
+            tried.append(fingerprint)
+            if not feedback.throttled or len(tried) == len(self.endpoints):
+                return result
+
+
+class GitHubCredentialsPool(GitHubCredentials):
+    """
+    Block used to spread GitHub requests across several tokens, so that the
+    rate-limit budget grows with the number of tokens in the pool.
+
+    Each request goes to the token with the most remaining budget, based on
+    the rate-limit headers GitHub returns. Throttled tokens are taken out of
+    rotation until their limit resets, and tokens that GitHub reports as lacking
+    the `required_scopes` are skipped.
+
+    Attributes:
+        token: An optional token that is added to the pool.
+        tokens: The tokens to spread requests across.
+        required_scopes: The OAuth scopes every request sent with the pool
+            needs, e.g. `["repo"]`.
+
+    Examples:
+        Load a stored pool of GitHub tokens:
+        ```python
+        from prefect_github import GitHubCredentialsPool
+        github_credentials_block = GitHubCredentialsPool.load("BLOCK_NAME")
+        ```
+    """
+
+    _block_type_name = "GitHub Credentials Pool"
+    _documentation_url = "https://prefecthq.github.io/prefect-github/credentials/#prefect_github.credentials.GitHubCredentialsPool"  # noqa
+
+    tokens: List[SecretStr] = Field(
+        default_factory=list,
+        description="GitHub personal access tokens (PATs) to spread requests across.",
+    )
+    required_scopes: List[str] = Field(
+        default_factory=list,
+        description=(
+            "The OAuth scopes requests need, e.g. repo; tokens that GitHub reports "
+            "as lacking them are never used."
+        ),
+    )
+
+    def _get_token_values(self) -> List[str]:
+        """
+        Lists the distinct token values in the pool, in order.
+        """
+        tokens = [self.token] if self.token is not None else []
+        tokens.extend(self.tokens)
+        return list(dict.fromkeys(token.get_secret_value() for token in tokens))
+
+    def _get_budget_key(self) -> str:
+        """
+        Identifies the rate-limit budget requests sent with the block draw from.
+        """
+        return "pool-" + "-".join(sorted(self._get_budget_fingerprints()))
+
+    def _get_budget_fingerprints(self) -> List[str]:
+        """
+        Lists the fingerprints of the tokens whose budget requests draw from.
+        """
+        return [token_fingerprint(token) for token in self._get_token_values()]
+
+    def get_client(self, scopes: Optional[Iterable[str]] = None) -> PooledHTTPEndpoint:
+        """
+        Gets a GitHub GraphQL client that balances requests across the pool.
+
+        Args:
+            scopes: The OAuth scopes requests sent by the client need, e.g.
+                `["repo"]`; tokens known to lack them are never used. Defaults
+                to the `required_scopes` of the pool.
+
+        Returns:
+            A client that can be called like an sgqlc HTTPEndpoint.
+
+        Example:
+            Gets a client that balances requests across two tokens.
+            ```python
+            from prefect_github import GitHubCredentialsPool
+
+            github_credentials = GitHubCredentialsPool(tokens=[token_a, token_b])
+            client = github_credentials.get_client()
+            ```
+        """
+        tokens = self._get_token_values()
+        if not tokens:
+            raise ValueError("The credentials pool does not contain any tokens.")
+        if scopes is None:
+            scopes = self.required_scopes
+        return PooledHTTPEndpoint(
+            tokens, scopes=scopes, coordinator=self._get_budget_coordinator()
+        )
+
+
+def _base64url(data: bytes) -> str:
+    """
+    Encodes bytes as unpadded base64url, as used in JWTs.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _encode_app_jwt(app_id: str, private_key: str, now: float) -> str:
+    """
+    Signs a short-lived RS256 JWT that authenticates as a GitHub App.
+    """
+    header = {"alg": "RS256", "typ": "JWT"}
+    # backdate the issue time to allow for clock drift, as GitHub recommends
+    payload = {"iat": int(now) - 60, "exp": int(now) + APP_JWT_LIFETIME, "iss": app_id}
+    signing_input = ".".join(
+        _base64url(json.dumps(part, separators=(",", ":")).encode("utf-8"))
+        for part in (header, payload)
+    )
+    key = serialization.load_pem_private_key(private_key.encode("utf-8"), password=None)
+    signature = key.sign(
+        signing_input.encode("ascii"), padding.PKCS1v15(), hashes.SHA256()
+    )
+    return f"{signing_input}.{_base64url(signature)}"
+
+
+class _InstallationToken(NamedTuple):
+    """
+    An installation access token and the epoch time at which it expires.
+    """
+
+    token: str
+    expires_at: float
+
+
+_INSTALLATION_TOKENS: Dict[Tuple[str, str, int], _InstallationToken] = {}
+_INSTALLATION_TOKEN_LOCKS: Dict[Tuple[str, str, int], threading.Lock] = {}
+# The threads refreshing tokens that are about to expire.
+_INSTALLATION_TOKEN_REFRESHES: Dict[Tuple[str, str, int], threading.Thread] = {}
+_INSTALLATION_TOKENS_LOCK = threading.Lock()
+
+
+class GitHubAppCredentials(_GitHubCredentialsBase):
+    """
+    Block used to authenticate with GitHub as a GitHub App installation, which
+    gets higher rate limits than a personal access token.
+
+    Installation tokens are minted with a JWT signed by the app's private key
+    and cached in memory. Once a token is used less than
+    `INSTALLATION_TOKEN_REFRESH_MARGIN` seconds before it expires, its
+    replacement is minted in a background thread while the token keeps being
+    used; requests only wait for a token when none was minted yet or the
+    cached one expired, and get their client in a worker thread then.
+
+    Attributes:
+        app_id: The ID of the GitHub App.
+        installation_id: The ID of the app's installation to act as.
+        private_key: The PEM-encoded private key of the GitHub App.
+        api_url: The base URL of the GitHub REST and GraphQL APIs.
+        rate_limit_coordinator_url: The URL of storage shared by workers that
+            act as the same installation; see `GitHubCredentials`.
+        query_batch_window: How long, in seconds, concurrent queries are
+            collected to be sent as a single aliased request.
+        max_concurrent_requests: The number of GraphQL requests that may be
+            in flight at first; see `GitHubCredentials`.
+
+    Examples:
+        Load stored GitHub App credentials:
+        ```python
+        from prefect_github import GitHubAppCredentials
+        github_credentials_block = GitHubAppCredentials.load("BLOCK_NAME")
+        ```
+    """
+
+    _block_type_name = "GitHub App Credentials"
+    _documentation_url = "https://prefecthq.github.io/prefect-github/credentials/#prefect_github.credentials.GitHubAppCredentials"  # noqa
+
+    app_id: str = Field(default=..., description="The ID of the GitHub App.")
+    installation_id: int = Field(
+        default=..., description="The ID of the GitHub App installation."
+    )
+    private_key: SecretStr = Field(
+        default=..., description="The PEM-encoded private key of the GitHub App."
+    )
+    api_url: str = Field(
+        default=GITHUB_API_URL,
+        title="API URL",
+        description="The base URL of the GitHub API.",
+    )
+
+    def _get_budget_key(self) -> str:
+        """
+        Identifies the rate-limit budget requests sent with the block draw from.
+        """
+        return f"app-{self.app_id}-{self.installation_id}"
+
+    def _get_cache_key(self) -> Tuple[str, str, int]:
+        """
+        Identifies the installation whose token is cached.
+        """
+        return (self.api_url.rstrip("/"), self.app_id, self.installation_id)
+
+    def _mint_installation_token(self) -> _InstallationToken:
+        """
+        Exchanges a freshly signed app JWT for a new installation token.
+        """
+        app_jwt = _encode_app_jwt(
+            self.app_id, self.private_key.get_secret_value(), time.time()
+        )
+        request = urllib.request.Request(
+            url=(
+                f"{self.api_url.rstrip('/')}/app/installations/"
+                f"{self.installation_id}/access_tokens"
+            ),
+            headers={
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {app_jwt}",
+            },
+            method="POST",
+        )
+        with urllib.request.urlopen(
+            request, timeout=INSTALLATION_TOKEN_TIMEOUT
+        ) as response:
+            content = json.loads(response.read().decode("utf-8"))
+
+        expires_at = datetime.fromisoformat(
+            content["expires_at"].replace("Z", "+00:00")
+        ).timestamp()
+        return _InstallationToken(token=content["token"], expires_at=expires_at)
+
+    def _refresh_installation_token(
+        self, key: Tuple[str, str, int], mint_lock: threading.Lock
+    ):
+        """
+        Mints and caches a new installation token, releasing the mint lock of
+        the installation once done; meant to run in a background thread.
+        """
+        try:
+            installation_token = self._mint_installation_token()
+            with _INSTALLATION_TOKENS_LOCK:
+                _INSTALLATION_TOKENS[key] = installation_token
+        except Exception as exc:
+            # the cached token is used until it expires, then minted in the open
+            logger.warning("Could not refresh the installation token: %s", exc)
+        finally:
+            with _INSTALLATION_TOKENS_LOCK:
+                _INSTALLATION_TOKEN_REFRESHES.pop(key, None)
+            mint_lock.release()
+
+    def get_installation_token(self) -> str:
+        """
+        Gets an installation access token, minting one only if no cached token
+        is valid; a cached token about to expire is still returned, while its
+        replacement is minted in the background.
+
+        Returns:
+            An installation access token for the GitHub App.
+
+        Example:
+            Gets an installation access token.
+            ```python
+            from prefect_github import GitHubAppCredentials
+
+            github_credentials = GitHubAppCredentials(
+                app_id="123456", installation_id=7890123, private_key=private_key
+            )
+            token = github_credentials.get_installation_token()
+            ```
+        """
+        key = self._get_cache_key()
+
+        def get_cached() -> Optional[_InstallationToken]:
+            """Gets the cached token unless it expired."""
+            installation_token = _INSTALLATION_TOKENS.get(key)
+            expires_at = installation_token.expires_at if installation_token else 0
+            return installation_token if expires_at > time.time() else None
+
+        with _INSTALLATION_TOKENS_LOCK:
+            installation_token = get_cached()
+            mint_lock = _INSTALLATION_TOKEN_LOCKS.setdefault(key, threading.Lock())
+        if installation_token is not None:
+            refresh_at = (
+                installation_token.expires_at - INSTALLATION_TOKEN_REFRESH_MARGIN
+            )
+            # only one refresh is in flight, later uses keep the cached token
+            if time.time() >= refresh_at and mint_lock.acquire(blocking=False):
+                refresh = threading.Thread(
+                    target=self._refresh_installation_token,
+                    args=(key, mint_lock),
+                    daemon=True,
+                )
+                with _INSTALLATION_TOKENS_LOCK:
+                    _INSTALLATION_TOKEN_REFRESHES[key] = refresh
+                refresh.start()
+            return installation_token.token
+
+        # only one thread mints, the others wait for its token
+        with mint_lock:
+            with _INSTALLATION_TOKENS_LOCK:
+                installation_token = get_cached()
+            if installation_token is None:
+                installation_token = self._mint_installation_token()
+                with _INSTALLATION_TOKENS_LOCK:
+                    _INSTALLATION_TOKENS[key] = installation_token
+        return installation_token.token
+
+    def get_client(self) -> HTTPEndpoint:
+        """
+        Gets a GitHub GraphQL HTTPEndpoint client authenticated as the app
+        installation.
+
+        Returns:
+            An authenticated GitHub GraphQL HTTPEndpoint client.
+
+        Example:
+            Gets an authenticated GitHub GraphQL HTTPEndpoint client.
+            ```python
+            from prefect_github import GitHubAppCredentials
+
+            github_credentials = GitHubAppCredentials(
+                app_id="123456", installation_id=7890123, private_key=private_key
+            )
+            client = github_credentials.get_client()
+            ```
+        """
+        base_headers = {"Authorization": f"Bearer {self.get_installation_token()}"}
+        return HTTPEndpoint(
+            f"{self.api_url.rstrip('/')}/graphql", base_headers=base_headers
+        )
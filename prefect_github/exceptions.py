@@ -1,5 +1,73 @@
 """Custom errors for Prefect GitHub"""
 
+from pprint import pformat
+from typing import Any, List
+
 
 class InvalidRepositoryURLError(ValueError):
     pass
+
+
+class GitHubGraphQLError(RuntimeError):
+    """
+    Raised when GitHub reports errors for a GraphQL operation.
+
+    Attributes:
+        errors: The errors returned by GitHub.
+    """
+
+    def __init__(self, errors: Any):
+        self.errors = errors
+        super().__init__(f"Error encountered:\n{pformat(errors)}")
+
+    def get_error_types(self) -> List[str]:
+        """
+        Lists the GitHub error types, e.g. `NOT_FOUND` or `RATE_LIMITED`.
+
+        Returns:
+            The types of the errors that carry one.
+        """
+        errors = self.errors if isinstance(self.errors, list) else [self.errors]
+        return [
+            error["type"]
+            for error in errors
+            if isinstance(error, dict) and error.get("type")
+        ]
+
+    def has_error_type(self, error_type: str) -> bool:
+        """
+        Checks whether any of the errors has the given GitHub error type.
+
+        Args:
+            error_type: The error type to look for, e.g. `NOT_FOUND`.
+
+        Returns:
+            True if one of the errors has that type.
+        """
+        return error_type in self.get_error_types()
+
+
+class BudgetCoordinatorError(RuntimeError):
+    """
+    Raised when the storage shared by workers to coordinate their rate-limit
+    budget replies with an error.
+    """
+
+
+class SearchResultLimitError(RuntimeError):
+    """
+    Raised when a search returns more results than GitHub's search limit in a
+    time window too short to be split, so that some of them cannot be fetched.
+
+    Attributes:
+        query: The search query of the window, with its date qualifier.
+        count: The number of results GitHub counted.
+    """
+
+    def __init__(self, query: str, count: int):
+        self.query = query
+        self.count = count
+        super().__init__(
+            f"The search {query!r} returns {count} results, more than GitHub "
+            "returns for a single search."
+        )
@@ -5,36 +5,262 @@ This is a module containing generic GraphQL tasks
 # This module was auto-generated using prefect-collection-generator so
 # manually editing this file is not recommended.
 
+import time
 from functools import partial
-from pprint import pformat
-from typing import Any, Dict, Iterable, List, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from anyio import to_thread
+from graphql import (
+    DocumentNode,
+    GraphQLError,
+    NamedTypeNode,
+    NameNode,
+    OperationType,
+    VariableDefinitionNode,
+    VariableNode,
+    print_ast,
+)
 from prefect import task
 from sgqlc.operation import Operation, Selection
 
 from prefect_github import GitHubCredentials
-from prefect_github.utils import camel_to_snake_case
+from prefect_github.batching import (
+    MAX_BATCH_MUTATIONS,
+    get_mutation_pacer,
+    get_query_batcher,
+    is_batchable,
+    merge_operations,
+    split_result,
+)
+from prefect_github.checkpoints import (
+    DEFAULT_CHECKPOINT_EVERY,
+    CheckpointStore,
+    get_checkpoint_key,
+)
+from prefect_github.concurrency import (
+    RequestPriority,
+    get_concurrency_limiter,
+    is_overloaded,
+    wait_for_rate_limit_budget,
+)
+from prefect_github.coordination import BudgetCoordinator, reserve_shared_budget
+from prefect_github.cost import MAX_NODE_LIMIT, MAX_PAGE_SIZE, estimate_query_cost
+from prefect_github.credentials import PooledHTTPEndpoint
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.hydration import hydrate_connections, prepare_hydration
+from prefect_github.pagination import (
+    DEFAULT_PREFETCH,
+    iterate_connection_bidirectional,
+    iterate_connection_nodes,
+)
+from prefect_github.planner import execute_within_node_limit
+from prefect_github.rate_limit import parse_rate_limit_feedback, record_token_feedback
+from prefect_github.utils import (
+    camel_to_snake_case,
+    ensure_selected,
+    find_fields,
+    get_named_type,
+    get_operation_definition,
+    get_path,
+    get_scalar_field_names,
+    get_schema_field,
+    parse_graphql_document,
+    set_argument,
+)
 
 
-async def _execute_graphql_op(
+async def _request_graphql_op(
+    op: Union[Operation, str],
+    github_credentials: GitHubCredentials,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    **vars,
+) -> Dict[str, Any]:
+    """
+    Helper function for sending a single GraphQL request and returning the
+    raw result, including its errors.
+    """
+    # getting the client may block, e.g. to mint a GitHub App installation token
+    endpoint = await to_thread.run_sync(github_credentials.get_client)
+    points = _estimate_points(op, vars)
+    fingerprints = _get_budget_fingerprints(github_credentials)
+    await wait_for_rate_limit_budget(fingerprints, priority)
+    # pooled clients pick a token per request, and reserve and track the
+    # budget of the token they picked themselves
+    fingerprint = None
+    if isinstance(endpoint, PooledHTTPEndpoint):
+        partial_endpoint = partial(endpoint, op, vars, points=points)
+    else:
+        partial_endpoint = partial(endpoint, op, vars)
+        if len(fingerprints) == 1:
+            fingerprint = fingerprints[0]
+    coordinator = _get_budget_coordinator(github_credentials)
+    if coordinator is not None and fingerprint is not None:
+        await reserve_shared_budget(coordinator, fingerprint, points)
+    limiter = get_concurrency_limiter(github_credentials)
+    if limiter is None:
+        result = await to_thread.run_sync(partial_endpoint)
+    else:
+        await limiter.acquire(priority)
+        started_at = time.monotonic()
+        overloaded = True
+        try:
+            result = await to_thread.run_sync(partial_endpoint)
+            overloaded = is_overloaded(result)
+        finally:
+            limiter.release(started_at, overloaded=overloaded)
+    if fingerprint is not None:
+        feedback = parse_rate_limit_feedback(result)
+        record_token_feedback(fingerprint, feedback)
+        if coordinator is not None:
+            await to_thread.run_sync(coordinator.record, fingerprint, feedback)
+    return result
+
+
+async def _send_graphql_op(
     op: Union[Operation, str],
     github_credentials: GitHubCredentials,
     error_key: str = "errors",
+    priority: RequestPriority = RequestPriority.NORMAL,
     **vars,
 ) -> Dict[str, Any]:
     """
-    Helper function for executing GraphQL operations.
+    Helper function for sending a single GraphQL request.
     """
-    endpoint = github_credentials.get_client()
-    partial_endpoint = partial(endpoint, op, vars)
-    result = await to_thread.run_sync(partial_endpoint)
+    result = await _request_graphql_op(
+        op, github_credentials, priority=priority, **vars
+    )
     if error_key in result:
-        errors = pformat(result[error_key])
-        raise RuntimeError(f"Error encountered:\n{errors}")
+        raise GitHubGraphQLError(result[error_key])
     return result["data"]
 
 
+def _estimate_points(op: Union[Operation, str], vars: Dict[str, Any]) -> int:
+    """
+    Helper function for estimating the rate-limit points a request costs, so
+    that as much of the shared budget is reserved; defaults to one point for
+    operations that cannot be estimated.
+    """
+    document = _parse_graphql_op(op)
+    if document is None:
+        return 1
+    try:
+        return estimate_query_cost(document, **vars).points
+    except (GraphQLError, ValueError):
+        return 1
+
+
+def _get_budget_fingerprints(github_credentials: GitHubCredentials) -> List[str]:
+    """
+    Helper function for listing the tokens whose budget requests draw from.
+    """
+    get_fingerprints = getattr(github_credentials, "_get_budget_fingerprints", None)
+    return get_fingerprints() if get_fingerprints is not None else []
+
+
+def _get_budget_coordinator(
+    github_credentials: GitHubCredentials,
+) -> Optional[BudgetCoordinator]:
+    """
+    Helper function for getting the coordinator of the budget shared with
+    other workers, if the credentials configure one.
+    """
+    get_coordinator = getattr(github_credentials, "_get_budget_coordinator", None)
+    return get_coordinator() if get_coordinator is not None else None
+
+
+def _parse_graphql_op(op: Union[Operation, str]) -> Optional[DocumentNode]:
+    """
+    Helper function for parsing operations; returns None for strings that
+    are not valid GraphQL, leaving it to GitHub to report the error.
+    """
+    try:
+        return parse_graphql_document(op)
+    except GraphQLError:
+        return None
+
+
+async def _execute_graphql_op(
+    op: Union[Operation, str],
+    github_credentials: GitHubCredentials,
+    error_key: str = "errors",
+    priority: RequestPriority = RequestPriority.NORMAL,
+    **vars,
+) -> Dict[str, Any]:
+    """
+    Helper function for executing GraphQL operations.
+
+    Operations that would exceed GitHub's node limit, by local estimate or
+    because GitHub rejected them for it, are split into several requests.
+    Queries sent with credentials that set a `query_batch_window` are merged
+    with the other queries sent during the window.
+    """
+
+    async def send(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Sends one of the requests a split operation was planned into."""
+        return await _send_graphql_op(
+            query,
+            github_credentials,
+            error_key=error_key,
+            priority=priority,
+            **variables,
+        )
+
+    document = _parse_graphql_op(op)
+    if document is not None:
+        node_count = estimate_query_cost(document, **vars).node_count
+        if node_count > MAX_NODE_LIMIT:
+            return await execute_within_node_limit(document, send, vars)
+
+        batcher = get_query_batcher(github_credentials)
+        if batcher is not None and error_key == "errors" and is_batchable(document):
+
+            async def send_batch(
+                query: str, variables: Dict[str, Any], batch_priority: RequestPriority
+            ) -> Dict[str, Any]:
+                """Sends a batch of queries and returns its raw result."""
+                return await _request_graphql_op(
+                    query, github_credentials, priority=batch_priority, **variables
+                )
+
+            return await batcher.submit(document, vars, send_batch, priority=priority)
+
+    try:
+        return await _send_graphql_op(
+            op, github_credentials, error_key=error_key, priority=priority, **vars
+        )
+    except GitHubGraphQLError as exc:
+        if document is None or not exc.has_error_type("MAX_NODE_LIMIT_EXCEEDED"):
+            raise
+        # GitHub counted more nodes than estimated, so aim well below the limit
+        node_limit = max(min(node_count, MAX_NODE_LIMIT) // 2, 1)
+        return await execute_within_node_limit(document, send, vars, node_limit)
+
+
+def _explain_graphql_op(
+    op: Union[Operation, str], return_path: Optional[Sequence[str]] = None, **vars
+) -> Dict[str, Any]:
+    """
+    Helper function for estimating the cost of GraphQL operations
+    without executing them; generated query tasks also pass the response keys
+    leading to what they return.
+    """
+    explanation = estimate_query_cost(op, **vars).to_dict()
+    explanation["query"] = op if isinstance(op, str) else str(op)
+    if return_path is not None:
+        explanation["return_path"] = list(return_path)
+    return explanation
+
+
 def _subset_return_fields(
     op_selection: Selection,
     op_stack: List[str],
@@ -60,11 +286,199 @@ def _subset_return_fields(
     return op_selection
 
 
+def _subset_lean_return_fields(
+    op: Operation, op_selection: Selection, op_stack: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Helper function to select only the `clientMutationId` of a mutation payload
+    and the `id` of the node the mutation affects; returns the response keys
+    leading to that node.
+    """
+    [payload] = op
+    payload.client_mutation_id()
+    if op_selection is payload:  # the node is the payload field with an ID
+        payload_type = get_named_type(payload.__field__.type)
+        [node_field] = [
+            field
+            for field in payload_type
+            if get_schema_field(get_named_type(field.type), "id") is not None
+        ]
+        op_selection = getattr(payload, node_field.name)()
+        op_stack = (*op_stack, node_field.graphql_name)
+    op_selection.id()
+    return op_stack
+
+
+def _get_lean_result(result: Dict[str, Any], op_stack: Tuple[str, ...]):
+    """
+    Helper function to get the `clientMutationId` and node `id` a mutation
+    returns in lean mode.
+    """
+    return {
+        "clientMutationId": get_path(result, (*op_stack[:1], "clientMutationId")),
+        "id": get_path(result, (*op_stack, "id")),
+    }
+
+
+def _subset_node_return_fields(
+    op_selection: Selection,
+    return_fields: Iterable[str],
+) -> Selection:
+    """
+    Helper function to select the page info and node fields of a connection,
+    defaulting to the scalar fields of the nodes.
+    """
+    op_selection.page_info().__fields__("has_next_page", "end_cursor")
+    node_selection = op_selection.nodes()
+    if not return_fields:
+        connection_type = get_named_type(op_selection.__field__.type)
+        node_type = get_named_type(get_schema_field(connection_type, "nodes").type)
+        return_fields = get_scalar_field_names(node_type) or ("__typename__",)
+    elif isinstance(return_fields, str):
+        return_fields = (return_fields,)
+
+    return_fields = tuple(
+        camel_to_snake_case(return_field) for return_field in return_fields
+    )
+    if return_fields == ("__typename__",):
+        node_selection.__typename__()
+    else:
+        node_selection.__fields__(*return_fields)
+    return op_selection
+
+
+def _select_backward_pagination(
+    document: DocumentNode, path: Iterable[str]
+) -> DocumentNode:
+    """
+    Helper function to page a connection backward too, passing `before` and
+    `last` as variables and selecting the start cursor and node IDs.
+    """
+    operation = get_operation_definition(document)
+    declared = {
+        definition.variable.name.value
+        for definition in operation.variable_definitions or ()
+    }
+    for name, type_name in (("before", "String"), ("last", "Int")):
+        if name not in declared:
+            operation.variable_definitions = (
+                *(operation.variable_definitions or ()),
+                VariableDefinitionNode(
+                    variable=VariableNode(name=NameNode(value=name)),
+                    type=NamedTypeNode(name=NameNode(value=type_name)),
+                    directives=(),
+                ),
+            )
+    for field in find_fields(document, path):
+        for name in ("before", "last"):
+            set_argument(field, name, VariableNode(name=NameNode(value=name)))
+        ensure_selected(field, ("pageInfo", "hasPreviousPage"))
+        ensure_selected(field, ("pageInfo", "startCursor"))
+        ensure_selected(field, ("nodes", "id"))
+    return document
+
+
+async def _paginate_graphql_op(
+    op: Operation,
+    path: Iterable[str],
+    github_credentials: GitHubCredentials,
+    after: Optional[str] = None,
+    first: Optional[int] = None,
+    max_items: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    adaptive_page_size: bool = False,
+    bidirectional: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Helper function for iterating over the nodes of a connection, sending the
+    operation with new `after` and `first` variables for every page; its
+    checkpoints are keyed by the operation and path.
+
+    In bidirectional mode, the operation also pages backward with `before`
+    and `last`, meeting the forward pages in the middle; it selects the `id`
+    of the nodes to find where the directions meet, and pages are neither
+    prefetched nor resized.
+    """
+    path = tuple(path)
+    if bidirectional:
+        if checkpoint_store is not None:
+            raise ValueError(
+                "Checkpoints are not supported when paginating in both directions."
+            )
+        op = print_ast(_select_backward_pagination(parse_graphql_document(op), path))
+
+    async def fetch(variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetches a single page of the connection."""
+        return await _execute_graphql_op(
+            op, github_credentials, priority=priority, **variables
+        )
+
+    if bidirectional:
+        nodes = iterate_connection_bidirectional(
+            fetch,
+            path,
+            after=after,
+            page_size=first or MAX_PAGE_SIZE,
+            max_items=max_items,
+        )
+    else:
+        nodes = iterate_connection_nodes(
+            fetch,
+            path,
+            after=after,
+            page_size=first or MAX_PAGE_SIZE,
+            max_items=max_items,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=get_checkpoint_key(op, path),
+            checkpoint_every=checkpoint_every,
+            adaptive_page_size=adaptive_page_size,
+        )
+    try:
+        async for node in nodes:
+            yield node
+    finally:
+        await nodes.aclose()
+
+
+async def _hydrate_graphql_op(
+    op: Union[Operation, str],
+    github_credentials: GitHubCredentials,
+    error_key: str = "errors",
+    priority: RequestPriority = RequestPriority.NORMAL,
+    **vars,
+) -> Dict[str, Any]:
+    """
+    Helper function for executing an operation and then fetching the remaining
+    pages of its inner connections.
+    """
+
+    async def send(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Sends the operation or one of its follow-up requests."""
+        return await _execute_graphql_op(
+            query,
+            github_credentials,
+            error_key=error_key,
+            priority=priority,
+            **variables,
+        )
+
+    document = prepare_hydration(parse_graphql_document(op))
+    data = await send(print_ast(document), vars)
+    return await hydrate_connections(document, data, send, vars)
+
+
 @task
 async def execute_graphql(
     op: Union[Operation, str],
     github_credentials: GitHubCredentials,
     error_key: str = "errors",
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    hydrate: bool = False,
     **vars,
 ) -> Dict[str, Any]:
     # NOTE: Maintainers can update these examples to match their collection!
@@ -76,9 +490,20 @@ async def execute_graphql(
         github_credentials: Credentials to use for authentication with GitHub.
         error_key: The key name to look out for in the response
             that indicates an error has occurred with the request.
+        explain: Return the estimated rate-limit cost and node count of
+            the operation instead of executing it.
+        priority: The lane the request is scheduled in; `high` requests,
+            e.g. interactive ones, are sent ahead of `normal` ones and may
+            use the concurrency and rate-limit budget that `low` ones,
+            e.g. backfills, leave in reserve.
+        hydrate: Fetch every page of the connections nested in another
+            connection, e.g. the comments of every issue, with batched
+            follow-up requests; their `pageInfo` and parent `id` are
+            selected and returned too.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the estimated cost if `explain`
+        is set.
 
     Examples:
         Queries the first three issues from the Prefect repository
@@ -139,8 +564,155 @@ async def execute_graphql(
 
         example_execute_graphql_flow()
         ```
+
+        Estimates the cost of a query before sending it.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.graphql import execute_graphql
+
+        @flow()
+        def example_explain_graphql_flow():
+            op = '''
+                query GitHubRepoIssues($owner: String!, $name: String!) {
+                    repository(owner: $owner, name: $name) {
+                        issues(first: 100) {
+                            nodes {
+                                comments(first: 100) {
+                                    nodes {
+                                        body
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            '''
+            github_credentials = GitHubCredentials.load("github-token")
+            params = dict(owner="PrefectHQ", name="Prefect")
+            explanation = execute_graphql(
+                op, github_credentials, explain=True, **params
+            )
+            return explanation["points"], explanation["node_count"]
+
+        example_explain_graphql_flow()
+        ```
     """
+    if explain:
+        return _explain_graphql_op(op, **vars)
+
+    if hydrate:
+        return await _hydrate_graphql_op(
+            op, github_credentials, error_key=error_key, priority=priority, **vars
+        )
+
     result = await _execute_graphql_op(
-        op, github_credentials, error_key=error_key, **vars
+        op, github_credentials, error_key=error_key, priority=priority, **vars
     )
     return result
+
+
+async def _execute_graphql_mutations(
+    operations: List[Tuple[DocumentNode, Dict[str, Any]]],
+    github_credentials: GitHubCredentials,
+    mutations_per_request: int = MAX_BATCH_MUTATIONS,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    raise_request_errors: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Helper function for sending parsed mutations several to a request, paced
+    under the secondary rate limits, and returning the data and errors of each;
+    unless `raise_request_errors`, the mutations of a request that fails as a
+    whole are returned with empty data and the errors of the request.
+    """
+    pacer = get_mutation_pacer(github_credentials)
+    results = []
+    for start in range(0, len(operations), mutations_per_request):
+        chunk = operations[start : start + mutations_per_request]
+        document, variables, aliases = merge_operations(chunk)
+        await pacer.wait(len(chunk))
+        result = await _request_graphql_op(
+            print_ast(document), github_credentials, priority=priority, **variables
+        )
+        if result.get("data") is None:
+            if raise_request_errors:
+                raise GitHubGraphQLError(result.get("errors"))
+            errors = result.get("errors") or []
+            results.extend({"data": {}, "errors": errors} for _ in chunk)
+            continue
+        results.extend(
+            {"data": data, "errors": errors}
+            for data, errors in split_result(result, aliases)
+        )
+    return results
+
+
+@task
+async def execute_graphql_mutations(
+    ops: Iterable[Union[Operation, str, Tuple[Union[Operation, str], Dict]]],
+    github_credentials: GitHubCredentials,
+    mutations_per_request: int = MAX_BATCH_MUTATIONS,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> List[Dict[str, Any]]:
+    """
+    Executes independent mutations several to a request, each under its own
+    aliases, pacing the requests under GitHub's secondary rate limits.
+
+    GitHub runs the mutations of a request one after another; a mutation that
+    fails does not stop the others, and its errors are returned with it
+    rather than raised.
+
+    Args:
+        ops: The mutations, each a single mutation operation, either as a
+            valid GraphQL string or sgqlc.Operation, optionally paired with
+            a dict of its variables.
+        github_credentials: Credentials to use for authentication with GitHub.
+        mutations_per_request: The most mutations sent in a single request.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        For every mutation, in order, a dict of its returned fields under
+            `data`, and of the errors GitHub reported for it under `errors`.
+
+    Raises:
+        ValueError: If an operation is not a single mutation.
+        GitHubGraphQLError: If a request fails as a whole.
+
+    Example:
+        Comment on many issues, ten comments per request.
+        ```python
+        from prefect import flow
+        from sgqlc.operation import Operation
+        from prefect_github import GitHubCredentials
+        from prefect_github.graphql import execute_graphql_mutations
+        from prefect_github.schemas import graphql_schema
+
+        @flow()
+        async def github_comment_flow(issue_ids):
+            github_credentials = await GitHubCredentials.load("github-token")
+            ops = []
+            for issue_id in issue_ids:
+                op = Operation(graphql_schema.Mutation)
+                op.add_comment(
+                    input=dict(subject_id=issue_id, body="Thanks!")
+                ).comment_edge().node().id()
+                ops.append(op)
+            results = await execute_graphql_mutations(ops, github_credentials)
+            return [result["errors"] for result in results if result["errors"]]
+        ```
+    """
+    operations = []
+    for op in ops:
+        op, variables = op if isinstance(op, tuple) else (op, {})
+        document = parse_graphql_document(op)
+        if not is_batchable(document, OperationType.MUTATION):
+            raise ValueError(f"Expected a single mutation operation, got:\n{op}")
+        operations.append((document, variables))
+
+    return await _execute_graphql_mutations(
+        operations,
+        github_credentials,
+        mutations_per_request=mutations_per_request,
+        priority=priority,
+    )
@@ -0,0 +1,447 @@
+"""
+Hydration of inner connections: fetching the pages of nested connections,
+e.g. the comments of every issue, that the first request left out.
+"""
+
+import asyncio
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from graphql import (
+    ArgumentNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    NamedTypeNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    StringValueNode,
+    Visitor,
+    print_ast,
+    visit,
+)
+
+from prefect_github.cost import MAX_PAGE_SIZE, get_page_size, is_connection_type
+from prefect_github.utils import (
+    ensure_selected,
+    get_fragment_definitions,
+    get_named_type,
+    get_operation_definition,
+    get_root_type,
+    get_schema_field,
+    get_schema_type,
+    prune_unused_variables,
+    remove_argument,
+    set_argument,
+)
+
+# The number of parents whose inner connections are fetched in one request.
+DEFAULT_PARENTS_PER_REQUEST = 50
+
+Send = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class PendingConnection(NamedTuple):
+    """
+    An inner connection with more pages to fetch.
+
+    Attributes:
+        parent_id: The global node ID of the object holding the connection.
+        parent_type: The GraphQL type to select the connection on.
+        field: The field node selecting the connection.
+        connection: The connection result, which the next pages are merged into.
+    """
+
+    parent_id: str
+    parent_type: str
+    field: FieldNode
+    connection: Dict[str, Any]
+
+
+# Stands for the result when walking the selections of an operation alone.
+_NO_DATA = object()
+
+VisitField = Callable[[FieldNode, Optional[type], SelectionSetNode, Any, bool], None]
+
+
+def _walk(
+    selection_set: SelectionSetNode,
+    container_type: Optional[type],
+    fragments: Dict[str, FragmentDefinitionNode],
+    data: Any,
+    visit_field: VisitField,
+    inside_connection: bool = False,
+):
+    """
+    Walks a selection set alongside its result, calling `visit_field` with
+    every field, the type and selection set holding it, the result object
+    holding it, and whether it is a connection nested in another connection.
+    """
+    if isinstance(data, list):
+        for item in data:
+            _walk(
+                selection_set,
+                container_type,
+                fragments,
+                item,
+                visit_field,
+                inside_connection,
+            )
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, (InlineFragmentNode, FragmentSpreadNode)):
+            if isinstance(selection, FragmentSpreadNode):
+                selection = fragments[selection.name.value]
+            fragment_type = container_type
+            if selection.type_condition is not None:
+                fragment_type = get_schema_type(selection.type_condition.name.value)
+            _walk(
+                selection.selection_set,
+                fragment_type,
+                fragments,
+                data,
+                visit_field,
+                inside_connection,
+            )
+            continue
+
+        name = selection.name.value
+        if name.startswith("__"):
+            continue
+        field_type = None
+        if container_type is not None:
+            schema_field = get_schema_field(container_type, name)
+            if schema_field is not None:
+                field_type = get_named_type(schema_field.type)
+        is_connection = (
+            is_connection_type(field_type) or get_page_size(selection, {}) is not None
+        )
+        visit_field(
+            selection,
+            container_type,
+            selection_set,
+            data,
+            inside_connection and is_connection,
+        )
+
+        if selection.selection_set is None:
+            continue
+        value = data
+        if data is not _NO_DATA:
+            if not isinstance(data, dict):
+                continue
+            value = data.get((selection.alias or selection.name).value)
+            if value is None:
+                continue
+        _walk(
+            selection.selection_set,
+            field_type,
+            fragments,
+            value,
+            visit_field,
+            inside_connection or is_connection,
+        )
+
+
+def prepare_hydration(document: DocumentNode) -> DocumentNode:
+    """
+    Selects what hydration needs in an operation: the `hasNextPage` and
+    `endCursor` page info of every inner connection, i.e. one nested in
+    another connection, and the `id` of the objects holding them.
+
+    Args:
+        document: The parsed operation; it is copied, not modified.
+
+    Returns:
+        A copy of the operation selecting the extra fields, which are returned
+            along with the fields the operation asked for.
+    """
+    document = deepcopy(document)
+    operation = get_operation_definition(document)
+
+    def visit_field(field, container_type, selection_set, data, inner):
+        if not inner:
+            return
+        ensure_selected(field, ("pageInfo", "hasNextPage"))
+        ensure_selected(field, ("pageInfo", "endCursor"))
+        if get_schema_field(container_type, "id") is None:
+            return
+        if not any(
+            isinstance(selection, FieldNode)
+            and selection.alias is None
+            and selection.name.value == "id"
+            for selection in selection_set.selections
+        ):
+            id_field = FieldNode(name=NameNode(value="id"), arguments=(), directives=())
+            selection_set.selections = (*selection_set.selections, id_field)
+
+    _walk(
+        operation.selection_set,
+        get_root_type(operation),
+        get_fragment_definitions(document),
+        _NO_DATA,
+        visit_field,
+    )
+    return document
+
+
+def find_inner_connections(document: DocumentNode) -> List[FieldNode]:
+    """
+    Finds the connections of an operation that hydration can follow: those
+    nested in another connection, on a type whose objects have an `id`.
+
+    Args:
+        document: The parsed operation.
+
+    Returns:
+        The field nodes selecting the connections.
+    """
+    operation = get_operation_definition(document)
+    fields = []
+
+    def visit_field(field, container_type, selection_set, data, inner):
+        if inner and get_schema_field(container_type, "id") is not None:
+            fields.append(field)
+
+    _walk(
+        operation.selection_set,
+        get_root_type(operation),
+        get_fragment_definitions(document),
+        _NO_DATA,
+        visit_field,
+    )
+    return fields
+
+
+def find_pending_connections(
+    document: DocumentNode, data: Dict[str, Any]
+) -> List[PendingConnection]:
+    """
+    Finds the inner connections of a result that have more pages to fetch.
+
+    Only connections whose page info selects `hasNextPage` and `endCursor`,
+    and whose parent object selects its `id`, can be found; see
+    `prepare_hydration`.
+
+    Args:
+        document: The parsed operation the result is for.
+        data: The result data.
+
+    Returns:
+        The inner connections with a next page.
+    """
+    operation = get_operation_definition(document)
+    pending = []
+    seen = set()
+
+    def visit_field(field, container_type, selection_set, parent, inner):
+        if not inner or not isinstance(parent, dict) or not parent.get("id"):
+            return
+        connection = parent.get((field.alias or field.name).value)
+        if not isinstance(connection, dict) or id(connection) in seen:
+            return
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            return
+        parent_type = parent.get("__typename")
+        if parent_type is None and container_type is not None:
+            parent_type = container_type.__name__
+        if parent_type is None:
+            return
+        seen.add(id(connection))
+        pending.append(
+            PendingConnection(
+                parent_id=parent["id"],
+                parent_type=parent_type,
+                field=field,
+                connection=connection,
+            )
+        )
+
+    _walk(
+        operation.selection_set,
+        get_root_type(operation),
+        get_fragment_definitions(document),
+        data,
+        visit_field,
+    )
+    return pending
+
+
+def _merge_page(merged: Dict[str, Any], page: Dict[str, Any], forward: bool):
+    """
+    Merges the nodes, edges and page info of a follow-up page into the
+    connection result of the first page.
+    """
+    for key in ("nodes", "edges"):
+        if key in page and page[key] is not None:
+            previous = merged.get(key) or []
+            merged[key] = previous + page[key] if forward else page[key] + previous
+
+    page_info = page.get("pageInfo") or {}
+    merged_page_info = merged.setdefault("pageInfo", {})
+    keys = (
+        ("endCursor", "hasNextPage") if forward else ("startCursor", "hasPreviousPage")
+    )
+    for key in keys:
+        if key in page_info:
+            merged_page_info[key] = page_info[key]
+
+
+def _get_used_fragments(
+    node: Any, fragments: Dict[str, FragmentDefinitionNode]
+) -> List[FragmentDefinitionNode]:
+    """
+    Collects the fragment definitions a node spreads, directly or not.
+    """
+    used: Dict[str, FragmentDefinitionNode] = {}
+    queue = [node]
+
+    class SpreadCollector(Visitor):
+        """Records the fragments spread in a node."""
+
+        def enter_fragment_spread(self, spread: FragmentSpreadNode, *args):
+            """Queues a fragment the first time it is spread."""
+            name = spread.name.value
+            if name not in used and name in fragments:
+                used[name] = fragments[name]
+                queue.append(fragments[name])
+
+    while queue:
+        visit(queue.pop(), SpreadCollector())
+    return list(used.values())
+
+
+def build_hydration_query(
+    document: DocumentNode,
+    pending: List[PendingConnection],
+    page_size: int = MAX_PAGE_SIZE,
+) -> DocumentNode:
+    """
+    Builds an operation fetching the next page of several inner connections,
+    each through an aliased `node(id:)` field selecting its parent.
+
+    Args:
+        document: The parsed operation the connections were fetched with,
+            which provides their variables and fragments.
+        pending: The connections to fetch the next page of; the result of
+            the i-th one is under the `hydrate{i}` key.
+        page_size: The number of nodes to request per connection.
+
+    Returns:
+        The follow-up operation, declaring only the variables it uses.
+    """
+    operation = get_operation_definition(document)
+    selections = []
+    for index, connection in enumerate(pending):
+        field = deepcopy(connection.field)
+        for argument in ("last", "before"):
+            remove_argument(field, argument)
+        set_argument(field, "first", IntValueNode(value=str(page_size)))
+        set_argument(
+            field,
+            "after",
+            StringValueNode(value=connection.connection["pageInfo"]["endCursor"]),
+        )
+        fragment = InlineFragmentNode(
+            type_condition=NamedTypeNode(name=NameNode(value=connection.parent_type)),
+            directives=(),
+            selection_set=SelectionSetNode(selections=(field,)),
+        )
+        selections.append(
+            FieldNode(
+                alias=NameNode(value=f"hydrate{index}"),
+                name=NameNode(value="node"),
+                arguments=(
+                    ArgumentNode(
+                        name=NameNode(value="id"),
+                        value=StringValueNode(value=connection.parent_id),
+                    ),
+                ),
+                directives=(),
+                selection_set=SelectionSetNode(selections=(fragment,)),
+            )
+        )
+
+    hydration = OperationDefinitionNode(
+        operation=OperationType.QUERY,
+        variable_definitions=deepcopy(operation.variable_definitions or ()),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    fragments = _get_used_fragments(hydration, get_fragment_definitions(document))
+    hydration_document = DocumentNode(definitions=(hydration, *fragments))
+    prune_unused_variables(hydration_document, {})
+    return hydration_document
+
+
+async def hydrate_connections(
+    document: DocumentNode,
+    data: Dict[str, Any],
+    send: Send,
+    variables: Optional[Dict[str, Any]] = None,
+    parents_per_request: int = DEFAULT_PARENTS_PER_REQUEST,
+    page_size: int = MAX_PAGE_SIZE,
+    page_sizes: Optional[Callable[[PendingConnection], int]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetches the remaining pages of every inner connection of a result and
+    merges them into it.
+
+    Each round fetches the next page of every pending connection, many
+    parents per request, with the requests of a round sent concurrently.
+    Rounds continue until no inner connection, including those within the
+    nodes fetched along the way, has a next page.
+
+    Args:
+        document: The parsed operation the result is for, e.g. the one
+            returned by `prepare_hydration`.
+        data: The result data, modified in place.
+        send: Coroutine function sending a query string with its variables
+            and returning the result data.
+        variables: The variables the operation was sent with.
+        parents_per_request: The number of connections fetched per request.
+        page_size: The number of nodes to request per connection.
+        page_sizes: Gets the number of nodes to request for the next page of
+            a connection instead of `page_size`, or 0 to stop following it.
+
+    Returns:
+        The result data, with the inner connections complete.
+    """
+
+    async def fetch(pending: List[PendingConnection], page_size: int):
+        """Fetches the next page of some connections and merges them."""
+        hydration = build_hydration_query(document, pending, page_size)
+        hydration_variables = prune_unused_variables(hydration, dict(variables or {}))
+        result = await send(print_ast(hydration), hydration_variables)
+        for index, connection in enumerate(pending):
+            parent = (result or {}).get(f"hydrate{index}")
+            page = (parent or {}).get(
+                (connection.field.alias or connection.field.name).value
+            )
+            if not page or not (page.get("nodes") or page.get("edges")):
+                # the parent or its connection is gone, so stop following it
+                connection.connection["pageInfo"]["hasNextPage"] = False
+                continue
+            _merge_page(connection.connection, page, forward=True)
+
+    while True:
+        groups: Dict[int, List[PendingConnection]] = {}
+        for connection in find_pending_connections(document, data):
+            size = page_size if page_sizes is None else page_sizes(connection)
+            if size > 0:
+                groups.setdefault(size, []).append(connection)
+        if not groups:
+            return data
+        chunks = [
+            (pending[start : start + parents_per_request], size)
+            for size, pending in groups.items()
+            for start in range(0, len(pending), parents_per_request)
+        ]
+        await asyncio.gather(*(fetch(chunk, size) for chunk, size in chunks))
@@ -0,0 +1,289 @@
+"""
+Bulk issue creation: opening many issues from a stream of specs, skipping
+those already created by an earlier, e.g. retried, run.
+"""
+
+import collections
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    OrderedDict,
+    Set,
+    Tuple,
+    Union,
+)
+
+from prefect import task
+from sgqlc.operation import Operation
+
+from prefect_github import GitHubCredentials
+from prefect_github.batching import MAX_BATCH_MUTATIONS
+from prefect_github.bulk import _parse_repository, request_aliased
+from prefect_github.concurrency import RequestPriority
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.graphql import _execute_graphql_mutations
+from prefect_github.resolver import RepositoryRef, resolve_node_id_arguments
+from prefect_github.schemas import graphql_schema
+from prefect_github.utils import parse_graphql_document
+
+# Appended to the body of every issue, so that reruns can find it.
+IDEMPOTENCY_MARKER = "<!-- prefect-github-idempotency-key: {key} -->"
+# The idempotency keys accepted, safe to quote in a search and a comment.
+IDEMPOTENCY_KEY_PATTERN = re.compile(r"[\w.:-]{1,128}")
+# How long, in seconds, an issue created in this process is remembered; long
+# enough for the search index to include it.
+CREATED_KEYS_TTL = 60 * 60
+# The most created issues remembered; the least recently used go first.
+MAX_CREATED_KEYS = 10_000
+
+# The issues created in this process, by repository and idempotency key, with
+# the time they are forgotten at, ordered from least to most recently used;
+# the search index takes a while to include new issues.
+_CREATED_KEYS: OrderedDict[Tuple[str, str], float] = collections.OrderedDict()
+_CREATED_KEYS_LOCK = threading.Lock()
+
+
+def get_idempotency_key(spec: Dict[str, Any]) -> str:
+    """
+    Derives the key identifying the issue a spec creates, unless the spec
+    sets its own `idempotency_key`.
+
+    Args:
+        spec: The issue spec.
+
+    Returns:
+        The `idempotency_key` of the spec, or a digest of its repository,
+            title and body.
+
+    Raises:
+        ValueError: If the `idempotency_key` of the spec holds characters other
+            than letters, digits, `_`, `.`, `:` and `-`, or is over 128 long.
+    """
+    if spec.get("idempotency_key"):
+        key = str(spec["idempotency_key"])
+        if not IDEMPOTENCY_KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"Invalid idempotency key: {key!r}")
+        return key
+    content = json.dumps(
+        [spec["repository"], spec["title"], spec.get("body") or ""]
+    ).encode()
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+def _is_created(created_key: Tuple[str, str]) -> bool:
+    """
+    Gets whether an issue was created in this process and is still
+    remembered; the created keys lock must be held.
+    """
+    expires_at = _CREATED_KEYS.get(created_key, 0.0)
+    if expires_at <= time.monotonic():
+        _CREATED_KEYS.pop(created_key, None)
+        return False
+    _CREATED_KEYS.move_to_end(created_key)
+    return True
+
+
+def _remember_created(created_key: Tuple[str, str]):
+    """
+    Remembers a created issue, forgetting the least recently used ones beyond
+    `MAX_CREATED_KEYS`; the created keys lock must be held.
+    """
+    _CREATED_KEYS[created_key] = time.monotonic() + CREATED_KEYS_TTL
+    _CREATED_KEYS.move_to_end(created_key)
+    while len(_CREATED_KEYS) > MAX_CREATED_KEYS:
+        _CREATED_KEYS.popitem(last=False)
+
+
+async def _iterate_batches(
+    specs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]], size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Groups a stream of specs, sync or async, into lists of `size` specs.
+    """
+    batch = []
+    if hasattr(specs, "__aiter__"):
+        async for spec in specs:
+            batch.append(spec)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    else:
+        for spec in specs:
+            batch.append(spec)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def _find_existing_keys(
+    keyed_specs: List[Tuple[str, Dict[str, Any]]],
+    github_credentials: GitHubCredentials,
+    priority: RequestPriority,
+) -> Set[str]:
+    """
+    Searches, with an aliased search per spec, for issues whose body holds
+    the idempotency keys of some specs, and returns the keys found.
+    """
+    op = Operation(graphql_schema.Query)
+    for index, (key, spec) in enumerate(keyed_specs):
+        op.search(
+            __alias__=f"key{index}",
+            query=f'repo:{spec["repository"]} is:issue in:body "{key}"',
+            type="ISSUE",
+            first=0,
+        ).__fields__("issue_count")
+    data, errors_by_alias = await request_aliased(
+        op, github_credentials, priority=priority
+    )
+    if errors_by_alias:
+        raise GitHubGraphQLError(
+            [error for errors in errors_by_alias.values() for error in errors]
+        )
+    return {
+        key
+        for index, (key, _) in enumerate(keyed_specs)
+        if data[f"key{index}"]["issueCount"]
+    }
+
+
+@task
+async def create_issues(  # noqa
+    specs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    github_credentials: GitHubCredentials,
+    batch_size: int = MAX_BATCH_MUTATIONS,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Any]:
+    """
+    Creates issues from a stream of specs, several per request, skipping the
+    issues an earlier run already created.
+
+    Every issue gets an idempotency key, recorded in a hidden comment at the
+    end of its body. Before a batch is created, one request searches for the
+    keys of all its specs, and the specs whose issue exists are skipped;
+    since GitHub's search index lags behind, issues created earlier in the
+    same process are remembered too, for `CREATED_KEYS_TTL` seconds and up to
+    `MAX_CREATED_KEYS` of them. Requests are paced under GitHub's
+    secondary rate limits for content creation.
+
+    Args:
+        specs: The issue specs, as dicts with the `repository` as
+            `owner/name`, the `title`, and optionally the `body`,
+            `assignee_ids` (node IDs or `UserRef` references), `label_ids`,
+            `milestone_id` and `idempotency_key`; see `get_idempotency_key`.
+            May be an async iterable, consumed a batch at a time.
+        github_credentials: Credentials to use for authentication with GitHub.
+        batch_size: The number of specs checked and created per request.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict with the number of issues `created`, `skipped` because they
+            exist, and `failed`, including those of requests that failed as a
+            whole, and the `errors` of the failed ones, each with the spec it
+            concerns.
+
+    Raises:
+        ValueError: If a spec has an invalid repository or idempotency key.
+
+    Example:
+        Open an issue per scanner finding.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.issues import create_issues
+
+        @flow()
+        async def github_findings_flow(findings):
+            github_credentials = await GitHubCredentials.load("github-token")
+            return await create_issues(
+                (
+                    {
+                        "repository": finding.repository,
+                        "title": f"Vulnerable dependency: {finding.package}",
+                        "body": finding.details,
+                    }
+                    for finding in findings
+                ),
+                github_credentials,
+            )
+        ```
+    """
+    report = {"created": 0, "skipped": 0, "failed": 0, "errors": []}
+    batches = _iterate_batches(specs, batch_size)
+    try:
+        async for batch in batches:
+            keyed_specs = {}
+            for spec in batch:
+                _parse_repository(spec["repository"])
+                key = get_idempotency_key(spec)
+                with _CREATED_KEYS_LOCK:
+                    created = _is_created((spec["repository"], key))
+                if created or (spec["repository"], key) in keyed_specs:
+                    report["skipped"] += 1
+                else:
+                    keyed_specs[(spec["repository"], key)] = spec
+            if not keyed_specs:
+                continue
+
+            pending = [(key, spec) for (_, key), spec in keyed_specs.items()]
+            existing = await _find_existing_keys(pending, github_credentials, priority)
+            report["skipped"] += sum(key in existing for key, _ in pending)
+            pending = [(key, spec) for key, spec in pending if key not in existing]
+            if not pending:
+                continue
+
+            arguments = []
+            for _, spec in pending:
+                arguments.append(RepositoryRef(*_parse_repository(spec["repository"])))
+                arguments.append(spec.get("assignee_ids"))
+            arguments = await resolve_node_id_arguments(
+                arguments, github_credentials, priority=priority
+            )
+
+            operations = []
+            for index, (key, spec) in enumerate(pending):
+                body = spec.get("body") or ""
+                marker = IDEMPOTENCY_MARKER.format(key=key)
+                op = Operation(graphql_schema.Mutation)
+                op.create_issue(
+                    input=dict(
+                        repository_id=arguments[2 * index],
+                        title=spec["title"],
+                        body=f"{body}\n\n{marker}" if body else marker,
+                        assignee_ids=arguments[2 * index + 1],
+                        label_ids=spec.get("label_ids"),
+                        milestone_id=spec.get("milestone_id"),
+                    )
+                ).issue().__fields__("id", "number")
+                operations.append((parse_graphql_document(op), {}))
+
+            results = await _execute_graphql_mutations(
+                operations,
+                github_credentials,
+                mutations_per_request=batch_size,
+                priority=priority,
+                raise_request_errors=False,
+            )
+            for (key, spec), result in zip(pending, results):
+                issue = (result["data"].get("createIssue") or {}).get("issue")
+                if issue is None:
+                    report["failed"] += 1
+                    report["errors"].append({"spec": spec, "errors": result["errors"]})
+                    continue
+                report["created"] += 1
+                with _CREATED_KEYS_LOCK:
+                    _remember_created((spec["repository"], key))
+    finally:
+        await batches.aclose()
+    return report
@@ -0,0 +1,293 @@
+"""
+Merging of generated query tasks on the same root object, e.g. several
+`query_repository_*` tasks for one repository, into a single request whose
+result is split back into what each task returns.
+"""
+
+import asyncio
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    print_ast,
+)
+from prefect import task
+
+from prefect_github import GitHubCredentials
+from prefect_github.concurrency import RequestPriority
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.graphql import _execute_graphql_op
+from prefect_github.utils import (
+    get_operation_definition,
+    get_path,
+    parse_graphql_document,
+)
+
+
+class PlannedQuery(NamedTuple):
+    """
+    The selection of a generated query task, ready to be merged with others.
+
+    Attributes:
+        root: The root field the task selects, e.g. `repository(...)`.
+        return_path: The response keys, from the root field, leading to what
+            the task returns.
+    """
+
+    root: FieldNode
+    return_path: List[str]
+
+
+async def plan_query_task(
+    query_task: Callable, kwargs: Dict[str, Any], github_credentials: GitHubCredentials
+) -> PlannedQuery:
+    """
+    Gets the selection of a generated query task invocation without sending it,
+    through its `explain` mode.
+
+    Args:
+        query_task: The generated task, e.g. `query_repository_languages`.
+        kwargs: The arguments of the invocation, except the credentials.
+        github_credentials: Credentials to use for authentication with GitHub.
+
+    Returns:
+        The root field the task selects and the path to what it returns, as
+            the task built them.
+
+    Raises:
+        ValueError: If the task is not a generated query task.
+    """
+    fn = getattr(query_task, "fn", query_task)
+    if not getattr(fn, "__name__", "").startswith("query_"):
+        raise ValueError(f"Expected a generated query task, got {query_task!r}.")
+    explanation = await fn(
+        **dict(kwargs, github_credentials=github_credentials, explain=True)
+    )
+    if not isinstance(explanation, dict) or "return_path" not in explanation:
+        raise ValueError(f"Expected a generated query task, got {query_task!r}.")
+    operation = get_operation_definition(parse_graphql_document(explanation["query"]))
+    selections = operation.selection_set.selections
+    if len(selections) != 1 or not isinstance(selections[0], FieldNode):
+        raise ValueError(f"Expected a generated query task, got {query_task!r}.")
+    return PlannedQuery(selections[0], explanation["return_path"])
+
+
+def _get_root_key(root: FieldNode) -> str:
+    """
+    Identifies a root object by its field and arguments, e.g.
+    `repository(owner: "PrefectHQ", name: "prefect")`.
+    """
+    root = FieldNode(
+        name=root.name,
+        arguments=tuple(
+            sorted(root.arguments, key=lambda argument: argument.name.value)
+        ),
+        directives=(),
+    )
+    return print_ast(root)
+
+
+def merge_planned_queries(
+    planned: List[PlannedQuery],
+) -> Tuple[DocumentNode, List[Dict[str, str]]]:
+    """
+    Merges the selections of several tasks on the same root object under a
+    single root field, prefixing the fields each task selects on it with
+    `task{i}_` so that none collide.
+
+    Args:
+        planned: The planned tasks, all on the same root object.
+
+    Returns:
+        The merged query and, for every task, the aliases of its fields in
+            the merged query mapped to their original response keys.
+    """
+    root = deepcopy(planned[0].root)
+    selections = []
+    aliases = []
+    for index, query in enumerate(planned):
+        task_aliases = {}
+        for selection in query.root.selection_set.selections:
+            selection = deepcopy(selection)
+            key = (selection.alias or selection.name).value
+            selection.alias = NameNode(value=f"task{index}_{key}")
+            task_aliases[selection.alias.value] = key
+            selections.append(selection)
+        aliases.append(task_aliases)
+    root.alias = None
+    root.selection_set = SelectionSetNode(selections=tuple(selections))
+    operation = OperationDefinitionNode(
+        operation=OperationType.QUERY,
+        variable_definitions=(),
+        directives=(),
+        selection_set=SelectionSetNode(selections=(root,)),
+    )
+    return DocumentNode(definitions=(operation,)), aliases
+
+
+def split_merged_result(
+    data: Dict[str, Any], planned: List[PlannedQuery], aliases: List[Dict[str, str]]
+) -> List[Any]:
+    """
+    Splits the result of a merged query into what each task returns.
+
+    Args:
+        data: The result data of the merged query.
+        planned: The planned tasks the query merged.
+        aliases: The aliases returned by `merge_planned_queries`.
+
+    Returns:
+        What each task would have returned on its own.
+    """
+    root_key = planned[0].root.name.value
+    root_data = data.get(root_key)
+    results = []
+    for query, task_aliases in zip(planned, aliases):
+        task_data = None
+        if root_data is not None:
+            task_data = {
+                key: root_data.get(alias) for alias, key in task_aliases.items()
+            }
+        task_result = {(query.root.alias or query.root.name).value: task_data}
+        results.append(get_path(task_result, query.return_path))
+    return results
+
+
+def split_merged_errors(
+    errors: List[Any], planned: List[PlannedQuery], aliases: List[Dict[str, str]]
+) -> Optional[List[List[Dict[str, Any]]]]:
+    """
+    Assigns the errors of a merged query to the tasks whose fields they
+    concern, with their path rewritten to what each task would have reported
+    on its own; errors on the root field concern every task.
+
+    Args:
+        errors: The errors GitHub reported for the merged query.
+        planned: The planned tasks the query merged.
+        aliases: The aliases returned by `merge_planned_queries`.
+
+    Returns:
+        The errors of each task, or None if an error concerns no field of the
+            root object, e.g. because the query is invalid.
+    """
+    root_key = planned[0].root.name.value
+    task_errors: List[List[Dict[str, Any]]] = [[] for _ in planned]
+    for error in errors if isinstance(errors, list) else [errors]:
+        path = error.get("path") if isinstance(error, dict) else None
+        if not path or path[0] != root_key:
+            return None
+        for query, task_aliases, query_errors in zip(planned, aliases, task_errors):
+            if len(path) > 1 and path[1] not in task_aliases:
+                continue
+            task_path = [(query.root.alias or query.root.name).value]
+            if len(path) > 1:
+                task_path += [task_aliases[path[1]], *path[2:]]
+            query_errors.append(dict(error, path=task_path))
+    return task_errors
+
+
+@task
+async def query_merged(  # noqa
+    invocations: Iterable[Tuple[Callable, Dict[str, Any]]],
+    github_credentials: GitHubCredentials,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> List[Any]:
+    """
+    Runs several generated query tasks with a request per root object rather
+    than per task, e.g. fetching a repository, its languages and its license
+    in a single request.
+
+    Invocations are grouped by their root field and its arguments, e.g. the
+    owner and name of the repository; the selections of each group are
+    merged under one root field and the groups are sent concurrently. When
+    GitHub reports errors for the fields of some tasks, the other tasks of
+    the group are sent again without them.
+
+    Args:
+        invocations: The `(task, kwargs)` pairs of the generated query tasks,
+            e.g. `(query_repository_languages, {"owner": ..., "name": ...})`,
+            with the keyword arguments of each call except the credentials.
+        github_credentials: Credentials to use for authentication with GitHub.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        What each task returns, in the order of the invocations, or the
+            `GitHubGraphQLError` of the errors GitHub reported for the task.
+
+    Raises:
+        ValueError: If a task is not a generated query task.
+        GitHubGraphQLError: If GitHub reported errors that concern no task,
+            e.g. because a request was rejected as a whole.
+
+    Example:
+        Fetch a repository along with its languages and latest release.
+        ```python
+        from prefect import flow
+        from prefect_github import GitHubCredentials
+        from prefect_github.merging import query_merged
+        from prefect_github.repository import (
+            query_repository,
+            query_repository_languages,
+            query_repository_latest_release,
+        )
+
+        @flow()
+        async def github_repository_flow():
+            github_credentials = await GitHubCredentials.load("github-token")
+            repository = dict(owner="PrefectHQ", name="prefect")
+            return await query_merged(
+                [
+                    (query_repository, repository),
+                    (query_repository_languages, dict(repository, first=10)),
+                    (query_repository_latest_release, repository),
+                ],
+                github_credentials,
+            )
+        ```
+    """
+    invocations = list(invocations)
+    planned = await asyncio.gather(
+        *(
+            plan_query_task(query_task, kwargs, github_credentials)
+            for query_task, kwargs in invocations
+        )
+    )
+    groups: Dict[str, List[int]] = {}
+    for index, query in enumerate(planned):
+        groups.setdefault(_get_root_key(query.root), []).append(index)
+
+    results: List[Any] = [None] * len(planned)
+
+    async def fetch(indexes: List[int]):
+        """Fetches the tasks on one root object in a single request."""
+        group = [planned[index] for index in indexes]
+        document, aliases = merge_planned_queries(group)
+        try:
+            data = await _execute_graphql_op(
+                print_ast(document), github_credentials, priority=priority
+            )
+        except GitHubGraphQLError as exc:
+            task_errors = split_merged_errors(exc.errors, group, aliases)
+            if task_errors is None or not any(task_errors):
+                raise
+            remaining = []
+            for index, errors in zip(indexes, task_errors):
+                if errors:
+                    results[index] = GitHubGraphQLError(errors)
+                else:
+                    remaining.append(index)
+            if remaining:
+                await fetch(remaining)
+            return
+        for index, result in zip(indexes, split_merged_result(data, group, aliases)):
+            results[index] = result
+
+    await asyncio.gather(*(fetch(indexes) for indexes in groups.values()))
+    return results
@@ -10,13 +10,21 @@ GitHub mutation tasks
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Union
 
 from prefect import task
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.concurrency import RequestPriority
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _get_lean_result,
+    _subset_lean_return_fields,
+    _subset_return_fields,
+)
+from prefect_github.resolver import NodeReference, resolve_node_id_arguments
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -28,24 +36,41 @@ for config_path in config_dir.glob("*.json"):
 
 @task
 async def add_comment_subject(  # noqa
-    subject_id: str,
+    subject_id: Union[str, NodeReference],
     body: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Adds a comment to an Issue or Pull Request.
 
     Args:
-        subject_id: The Node ID of the subject to modify.
+        subject_id: The Node ID of the subject to modify. May be given as an
+            `IssueRef`; see `prefect_github.resolver`.
         body: The contents of the comment.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the comment added, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields of the subject, or of the
+            `clientMutationId` and the comment `id` if lean.
     """
+    [subject_id] = await resolve_node_id_arguments(
+        [subject_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.add_comment(
         **strip_kwargs(
@@ -54,23 +79,39 @@ async def add_comment_subject(  # noqa
                 body=body,
             )
         )
-    ).subject(**strip_kwargs())
-
-    op_stack = (
-        "addComment",
-        "subject",
-    )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if lean:
+        # the comment added rather than its subject
+        op_selection = op_selection.comment_edge().node()
+        op_stack = (
+            "addComment",
+            "commentEdge",
+            "node",
+        )
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = op_selection.subject(**strip_kwargs())
+        op_stack = (
+            "addComment",
+            "subject",
+        )
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
+
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["addComment"]["subject"]
 
 
 @task
 async def create_pull_request(  # noqa
-    repository_id: str,
+    repository_id: Union[str, NodeReference],
     base_ref_name: str,
     head_ref_name: str,
     title: str,
@@ -79,12 +120,16 @@ async def create_pull_request(  # noqa
     maintainer_can_modify: bool = None,
     draft: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Create a new pull request.
 
     Args:
-        repository_id: The Node ID of the repository.
+        repository_id: The Node ID of the repository. May be given as a
+            `RepositoryRef`; see `prefect_github.resolver`.
         base_ref_name: The name of the branch you want your changes pulled into.
             This should be an existing branch on the current repository.
             You cannot update the base branch on a pull request to point
@@ -101,10 +146,23 @@ async def create_pull_request(  # noqa
         draft: Indicates whether this pull request should be a draft.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [repository_id] = await resolve_node_id_arguments(
+        [repository_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.create_pull_request(
         **strip_kwargs(
@@ -124,32 +182,57 @@ async def create_pull_request(  # noqa
         "createPullRequest",
         "pullRequest",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["createPullRequest"]["pullRequest"]
 
 
 @task
 async def close_pull_request(  # noqa
-    pull_request_id: str,
+    pull_request_id: Union[str, NodeReference],
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Close a pull request.
 
     Args:
-        pull_request_id: ID of the pull request to be closed.
+        pull_request_id: ID of the pull request to be closed. May be given as a
+            `PullRequestRef`; see `prefect_github.resolver`.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [pull_request_id] = await resolve_node_id_arguments(
+        [pull_request_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.close_pull_request(
         **strip_kwargs(
@@ -163,19 +246,27 @@ async def close_pull_request(  # noqa
         "closePullRequest",
         "pullRequest",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["closePullRequest"]["pullRequest"]
 
 
 @task
 async def create_issue(  # noqa
-    repository_id: str,
+    repository_id: Union[str, NodeReference],
     title: str,
-    assignee_ids: Iterable[str],
+    assignee_ids: Iterable[Union[str, NodeReference]],
     label_ids: Iterable[str],
     project_ids: Iterable[str],
     github_credentials: GitHubCredentials,
@@ -183,14 +274,19 @@ async def create_issue(  # noqa
     milestone_id: str = None,
     issue_template: str = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Creates a new issue.
 
     Args:
-        repository_id: The Node ID of the repository.
+        repository_id: The Node ID of the repository. May be given as a
+            `RepositoryRef`; see `prefect_github.resolver`.
         title: The title for the issue.
-        assignee_ids: The Node ID for the user assignee for this issue.
+        assignee_ids: The Node ID for the user assignee for this issue. May
+            contain `UserRef` references; see `prefect_github.resolver`.
         label_ids: An array of Node IDs of labels for this issue.
         project_ids: An array of Node IDs for projects associated with this
             issue.
@@ -201,10 +297,23 @@ async def create_issue(  # noqa
             labels and assignees from the template to the issue.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    repository_id, assignee_ids = await resolve_node_id_arguments(
+        (repository_id, assignee_ids),
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.create_issue(
         **strip_kwargs(
@@ -225,34 +334,59 @@ async def create_issue(  # noqa
         "createIssue",
         "issue",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["createIssue"]["issue"]
 
 
 @task
 async def close_issue(  # noqa
-    issue_id: str,
+    issue_id: Union[str, NodeReference],
     github_credentials: GitHubCredentials,
     state_reason: graphql_schema.IssueClosedStateReason = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Close an issue.
 
     Args:
-        issue_id: ID of the issue to be closed.
+        issue_id: ID of the issue to be closed. May be given as an `IssueRef`;
+            see `prefect_github.resolver`.
         github_credentials: Credentials to use for authentication with GitHub.
         state_reason: The reason the issue is to be closed.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [issue_id] = await resolve_node_id_arguments(
+        [issue_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.close_issue(
         **strip_kwargs(
@@ -267,32 +401,57 @@ async def close_issue(  # noqa
         "closeIssue",
         "issue",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["closeIssue"]["issue"]
 
 
 @task
 async def add_star_starrable(  # noqa
-    starrable_id: str,
+    starrable_id: Union[str, NodeReference],
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Adds a star to a Starrable.
 
     Args:
-        starrable_id: The Starrable ID to star.
+        starrable_id: The Starrable ID to star. May be given as a
+            `RepositoryRef`; see `prefect_github.resolver`.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [starrable_id] = await resolve_node_id_arguments(
+        [starrable_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.add_star(
         **strip_kwargs(
@@ -306,32 +465,57 @@ async def add_star_starrable(  # noqa
         "addStar",
         "starrable",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["addStar"]["starrable"]
 
 
 @task
 async def remove_star_starrable(  # noqa
-    starrable_id: str,
+    starrable_id: Union[str, NodeReference],
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Removes a star from a Starrable.
 
     Args:
-        starrable_id: The Starrable ID to unstar.
+        starrable_id: The Starrable ID to unstar. May be given as a
+            `RepositoryRef`; see `prefect_github.resolver`.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [starrable_id] = await resolve_node_id_arguments(
+        [starrable_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.remove_star(
         **strip_kwargs(
@@ -345,34 +529,59 @@ async def remove_star_starrable(  # noqa
         "removeStar",
         "starrable",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["removeStar"]["starrable"]
 
 
 @task
 async def add_reaction_subject(  # noqa
-    subject_id: str,
+    subject_id: Union[str, NodeReference],
     content: graphql_schema.ReactionContent,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Adds a reaction to a subject.
 
     Args:
-        subject_id: The Node ID of the subject to modify.
+        subject_id: The Node ID of the subject to modify. May be given as an
+            `IssueRef`; see `prefect_github.resolver`.
         content: The name of the emoji to react with.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [subject_id] = await resolve_node_id_arguments(
+        [subject_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.add_reaction(
         **strip_kwargs(
@@ -387,34 +596,59 @@ async def add_reaction_subject(  # noqa
         "addReaction",
         "subject",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["addReaction"]["subject"]
 
 
 @task
 async def add_reaction(  # noqa
-    subject_id: str,
+    subject_id: Union[str, NodeReference],
     content: graphql_schema.ReactionContent,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Adds a reaction to a subject.
 
     Args:
-        subject_id: The Node ID of the subject to modify.
+        subject_id: The Node ID of the subject to modify. May be given as an
+            `IssueRef`; see `prefect_github.resolver`.
         content: The name of the emoji to react with.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [subject_id] = await resolve_node_id_arguments(
+        [subject_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.add_reaction(
         **strip_kwargs(
@@ -429,34 +663,59 @@ async def add_reaction(  # noqa
         "addReaction",
         "reaction",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["addReaction"]["reaction"]
 
 
 @task
 async def remove_reaction_subject(  # noqa
-    subject_id: str,
+    subject_id: Union[str, NodeReference],
     content: graphql_schema.ReactionContent,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Removes a reaction from a subject.
 
     Args:
-        subject_id: The Node ID of the subject to modify.
+        subject_id: The Node ID of the subject to modify. May be given as an
+            `IssueRef`; see `prefect_github.resolver`.
         content: The name of the emoji reaction to remove.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [subject_id] = await resolve_node_id_arguments(
+        [subject_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.remove_reaction(
         **strip_kwargs(
@@ -471,34 +730,59 @@ async def remove_reaction_subject(  # noqa
         "removeReaction",
         "subject",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["removeReaction"]["subject"]
 
 
 @task
 async def remove_reaction(  # noqa
-    subject_id: str,
+    subject_id: Union[str, NodeReference],
     content: graphql_schema.ReactionContent,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Removes a reaction from a subject.
 
     Args:
-        subject_id: The Node ID of the subject to modify.
+        subject_id: The Node ID of the subject to modify. May be given as an
+            `IssueRef`; see `prefect_github.resolver`.
         content: The name of the emoji reaction to remove.
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [subject_id] = await resolve_node_id_arguments(
+        [subject_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.remove_reaction(
         **strip_kwargs(
@@ -513,38 +797,64 @@ async def remove_reaction(  # noqa
         "removeReaction",
         "reaction",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["removeReaction"]["reaction"]
 
 
 @task
 async def request_reviews(  # noqa
-    pull_request_id: str,
-    user_ids: Iterable[str],
+    pull_request_id: Union[str, NodeReference],
+    user_ids: Iterable[Union[str, NodeReference]],
     team_ids: Iterable[str],
     github_credentials: GitHubCredentials,
     union: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Set review requests on a pull request.
 
     Args:
-        pull_request_id: The Node ID of the pull request to modify.
-        user_ids: The Node IDs of the user to request.
+        pull_request_id: The Node ID of the pull request to modify. May be given
+            as a `PullRequestRef`; see `prefect_github.resolver`.
+        user_ids: The Node IDs of the user to request. May contain `UserRef`
+            references; see `prefect_github.resolver`.
         team_ids: The Node IDs of the team to request.
         github_credentials: Credentials to use for authentication with GitHub.
         union: Add users to the set rather than replace.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    pull_request_id, user_ids = await resolve_node_id_arguments(
+        (pull_request_id, user_ids),
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.request_reviews(
         **strip_kwargs(
@@ -558,38 +868,64 @@ async def request_reviews(  # noqa
     )
 
     op_stack = ("requestReviews",)
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["requestReviews"]
 
 
 @task
 async def request_reviews_pull_request(  # noqa
-    pull_request_id: str,
-    user_ids: Iterable[str],
+    pull_request_id: Union[str, NodeReference],
+    user_ids: Iterable[Union[str, NodeReference]],
     team_ids: Iterable[str],
     github_credentials: GitHubCredentials,
     union: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Set review requests on a pull request.
 
     Args:
-        pull_request_id: The Node ID of the pull request to modify.
-        user_ids: The Node IDs of the user to request.
+        pull_request_id: The Node ID of the pull request to modify. May be given
+            as a `PullRequestRef`; see `prefect_github.resolver`.
+        user_ids: The Node IDs of the user to request. May contain `UserRef`
+            references; see `prefect_github.resolver`.
         team_ids: The Node IDs of the team to request.
         github_credentials: Credentials to use for authentication with GitHub.
         union: Add users to the set rather than replace.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    pull_request_id, user_ids = await resolve_node_id_arguments(
+        (pull_request_id, user_ids),
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.request_reviews(
         **strip_kwargs(
@@ -606,17 +942,25 @@ async def request_reviews_pull_request(  # noqa
         "requestReviews",
         "pullRequest",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["requestReviews"]["pullRequest"]
 
 
 @task
 async def add_pull_request_review(  # noqa
-    pull_request_id: str,
+    pull_request_id: Union[str, NodeReference],
     github_credentials: GitHubCredentials,
     commit_oid: datetime = None,
     body: str = None,
@@ -624,12 +968,16 @@ async def add_pull_request_review(  # noqa
     comments: Iterable[graphql_schema.DraftPullRequestReviewComment] = None,
     threads: Iterable[graphql_schema.DraftPullRequestReviewThread] = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    lean: bool = False,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Adds a review to a Pull Request.
 
     Args:
-        pull_request_id: The Node ID of the pull request to modify.
+        pull_request_id: The Node ID of the pull request to modify. May be given
+            as a `PullRequestRef`; see `prefect_github.resolver`.
         github_credentials: Credentials to use for authentication with GitHub.
         commit_oid: The commit OID the review pertains to.
         body: The contents of the review body comment.
@@ -638,10 +986,23 @@ async def add_pull_request_review(  # noqa
         threads: The review line comment threads.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/mutation/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        lean: Select only the `clientMutationId` of the payload and the `id`
+            of the affected node, ignoring `return_fields`.
 
     Returns:
-        A dict of the returned fields.
+        A dict of the returned fields, or of the `clientMutationId` and `id`
+            if lean.
     """
+    [pull_request_id] = await resolve_node_id_arguments(
+        [pull_request_id],
+        github_credentials,
+        priority=priority,
+        placeholders=explain,
+    )
     op = Operation(graphql_schema.Mutation)
     op_selection = op.add_pull_request_review(
         **strip_kwargs(
@@ -660,9 +1021,17 @@ async def add_pull_request_review(  # noqa
         "addPullRequestReview",
         "pullRequestReview",
     )
-    op_selection = _subset_return_fields(
-        op_selection, op_stack, return_fields, return_fields_defaults
-    )
+    if lean:
+        op_stack = _subset_lean_return_fields(op, op_selection, op_stack)
+    else:
+        op_selection = _subset_return_fields(
+            op_selection, op_stack, return_fields, return_fields_defaults
+        )
+
+    if explain:
+        return _explain_graphql_op(op)
 
-    result = await _execute_graphql_op(op, github_credentials)
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
+    if lean:
+        return _get_lean_result(result, op_stack)
     return result["addPullRequestReview"]["pullRequestReview"]
@@ -14,7 +14,12 @@ from prefect import task
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.concurrency import RequestPriority
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _subset_return_fields,
+)
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -29,6 +34,8 @@ async def query_organization(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The query root of GitHub's GraphQL interface.
@@ -38,6 +45,10 @@ async def query_organization(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -54,7 +65,10 @@ async def query_organization(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]
 
 
@@ -64,6 +78,8 @@ async def query_organization_team(  # noqa
     slug: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find an organization's team by its slug.
@@ -74,6 +90,10 @@ async def query_organization_team(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -93,7 +113,10 @@ async def query_organization_team(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["team"]
 
 
@@ -113,6 +136,8 @@ async def query_organization_teams(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of teams in this organization.
@@ -138,6 +163,10 @@ async def query_organization_teams(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -167,7 +196,10 @@ async def query_organization_teams(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["teams"]
 
 
@@ -177,6 +209,8 @@ async def query_organization_project(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find project by number.
@@ -187,6 +221,10 @@ async def query_organization_project(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -206,7 +244,10 @@ async def query_organization_project(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["project"]
 
 
@@ -225,6 +266,8 @@ async def query_organization_domains(  # noqa
         "direction": "ASC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of domains owned by the organization.
@@ -243,6 +286,10 @@ async def query_organization_domains(  # noqa
         order_by: Ordering options for verifiable domains returned.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -268,7 +315,10 @@ async def query_organization_domains(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["domains"]
 
 
@@ -288,6 +338,8 @@ async def query_organization_packages(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of packages under the owner.
@@ -307,6 +359,10 @@ async def query_organization_packages(  # noqa
         order_by: Ordering of the returned packages.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -333,7 +389,10 @@ async def query_organization_packages(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["packages"]
 
 
@@ -349,6 +408,8 @@ async def query_organization_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -369,6 +430,10 @@ async def query_organization_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -394,7 +459,10 @@ async def query_organization_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["projects"]
 
 
@@ -409,6 +477,8 @@ async def query_organization_sponsors(  # noqa
     tier_id: str = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsors for this user or organization.
@@ -429,6 +499,10 @@ async def query_organization_sponsors(  # noqa
             connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -453,7 +527,10 @@ async def query_organization_sponsors(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsors"]
 
 
@@ -471,6 +548,8 @@ async def query_organization_audit_log(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Audit log entries of the organization.
@@ -488,6 +567,10 @@ async def query_organization_audit_log(  # noqa
         order_by: Ordering options for the returned audit log entries.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -512,7 +595,10 @@ async def query_organization_audit_log(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["auditLog"]
 
 
@@ -522,6 +608,8 @@ async def query_organization_project_v2(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by number.
@@ -532,6 +620,10 @@ async def query_organization_project_v2(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -551,7 +643,10 @@ async def query_organization_project_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["projectV2"]
 
 
@@ -566,6 +661,8 @@ async def query_organization_projects_v2(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -583,6 +680,10 @@ async def query_organization_projects_v2(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -607,7 +708,10 @@ async def query_organization_projects_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["projectsV2"]
 
 
@@ -618,6 +722,8 @@ async def query_organization_repository(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find Repository.
@@ -630,6 +736,10 @@ async def query_organization_repository(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -650,7 +760,10 @@ async def query_organization_repository(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["repository"]
 
 
@@ -664,6 +777,8 @@ async def query_organization_sponsoring(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of users and organizations this entity is sponsoring.
@@ -681,6 +796,10 @@ async def query_organization_sponsoring(  # noqa
             returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -704,7 +823,10 @@ async def query_organization_sponsoring(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsoring"]
 
 
@@ -714,6 +836,8 @@ async def query_organization_project_next(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by project (beta) number.
@@ -724,6 +848,10 @@ async def query_organization_project_next(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -743,7 +871,10 @@ async def query_organization_project_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["projectNext"]
 
 
@@ -757,6 +888,8 @@ async def query_organization_pinned_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner has pinned to their profile.
@@ -773,6 +906,10 @@ async def query_organization_pinned_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -796,7 +933,10 @@ async def query_organization_pinned_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["pinnedItems"]
 
 
@@ -811,6 +951,8 @@ async def query_organization_projects_next(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects (beta) under the owner.
@@ -828,6 +970,10 @@ async def query_organization_projects_next(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -852,7 +998,10 @@ async def query_organization_projects_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["projectsNext"]
 
 
@@ -874,6 +1023,8 @@ async def query_organization_repositories(  # noqa
     last: int = None,
     is_fork: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user owns.
@@ -905,6 +1056,10 @@ async def query_organization_repositories(  # noqa
             whether they are forks of another repository.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -933,7 +1088,10 @@ async def query_organization_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["repositories"]
 
 
@@ -942,6 +1100,8 @@ async def query_organization_item_showcase(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Showcases a selection of repositories and gists that the profile owner has
@@ -952,6 +1112,10 @@ async def query_organization_item_showcase(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -971,7 +1135,10 @@ async def query_organization_item_showcase(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["itemShowcase"]
 
 
@@ -985,6 +1152,8 @@ async def query_organization_pinnable_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner can pin to their profile.
@@ -1002,6 +1171,10 @@ async def query_organization_pinnable_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1025,7 +1198,10 @@ async def query_organization_pinnable_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["pinnableItems"]
 
 
@@ -1038,6 +1214,8 @@ async def query_organization_recent_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Recent projects that this user has modified in the context of the owner.
@@ -1053,6 +1231,10 @@ async def query_organization_recent_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1075,7 +1257,10 @@ async def query_organization_recent_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["recentProjects"]
 
 
@@ -1092,6 +1277,8 @@ async def query_organization_member_statuses(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Get the status messages members of this entity have set that are either public
@@ -1110,6 +1297,10 @@ async def query_organization_member_statuses(  # noqa
             from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1133,7 +1324,10 @@ async def query_organization_member_statuses(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["memberStatuses"]
 
 
@@ -1146,6 +1340,8 @@ async def query_organization_pending_members(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users who have been invited to join this organization.
@@ -1161,6 +1357,10 @@ async def query_organization_pending_members(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1183,7 +1383,10 @@ async def query_organization_pending_members(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["pendingMembers"]
 
 
@@ -1192,6 +1395,8 @@ async def query_organization_sponsors_listing(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The GitHub Sponsors listing for this user or organization.
@@ -1201,6 +1406,10 @@ async def query_organization_sponsors_listing(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1220,7 +1429,10 @@ async def query_organization_sponsors_listing(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorsListing"]
 
 
@@ -1233,6 +1445,8 @@ async def query_organization_members_with_role(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users who are members of this organization.
@@ -1248,6 +1462,10 @@ async def query_organization_members_with_role(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1270,7 +1488,10 @@ async def query_organization_members_with_role(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["membersWithRole"]
 
 
@@ -1289,6 +1510,8 @@ async def query_organization_enterprise_owners(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of owners of the organization's enterprise account.
@@ -1308,6 +1531,10 @@ async def query_organization_enterprise_owners(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1333,7 +1560,10 @@ async def query_organization_enterprise_owners(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["enterpriseOwners"]
 
 
@@ -1352,6 +1582,8 @@ async def query_organization_sponsors_activities(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Events involving this sponsorable, such as new sponsorships.
@@ -1374,6 +1606,10 @@ async def query_organization_sponsors_activities(  # noqa
             from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1399,7 +1635,10 @@ async def query_organization_sponsors_activities(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorsActivities"]
 
 
@@ -1408,6 +1647,8 @@ async def query_organization_interaction_ability(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The interaction ability settings for this organization.
@@ -1417,6 +1658,10 @@ async def query_organization_interaction_ability(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1436,7 +1681,10 @@ async def query_organization_interaction_ability(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["interactionAbility"]
 
 
@@ -1453,6 +1701,8 @@ async def query_organization_ip_allow_list_entries(  # noqa
         "direction": "ASC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The IP addresses that are allowed to access resources owned by the organization.
@@ -1471,6 +1721,10 @@ async def query_organization_ip_allow_list_entries(  # noqa
             entries returned.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1494,7 +1748,10 @@ async def query_organization_ip_allow_list_entries(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["ipAllowListEntries"]
 
 
@@ -1513,6 +1770,8 @@ async def query_organization_repository_migrations(  # noqa
         "direction": "ASC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of all repository migrations for this organization.
@@ -1534,6 +1793,10 @@ async def query_organization_repository_migrations(  # noqa
             migrations returned.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1559,7 +1822,10 @@ async def query_organization_repository_migrations(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["repositoryMigrations"]
 
 
@@ -1568,6 +1834,8 @@ async def query_organization_saml_identity_provider(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The Organization's SAML identity providers.
@@ -1577,6 +1845,10 @@ async def query_organization_saml_identity_provider(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1596,7 +1868,10 @@ async def query_organization_saml_identity_provider(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["samlIdentityProvider"]
 
 
@@ -1615,6 +1890,8 @@ async def query_organization_repository_discussions(  # noqa
     repository_id: str = None,
     answered: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussions this user has started.
@@ -1639,6 +1916,10 @@ async def query_organization_repository_discussions(  # noqa
             answered and unanswered discussions.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1664,7 +1945,10 @@ async def query_organization_repository_discussions(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["repositoryDiscussions"]
 
 
@@ -1678,6 +1962,8 @@ async def query_organization_sponsorships_as_sponsor(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the sponsor.
@@ -1699,6 +1985,10 @@ async def query_organization_sponsorships_as_sponsor(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1726,7 +2016,10 @@ async def query_organization_sponsorships_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorshipsAsSponsor"]
 
 
@@ -1743,6 +2036,8 @@ async def query_organization_sponsorship_newsletters(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsorship updates sent from this sponsorable to sponsors.
@@ -1762,6 +2057,10 @@ async def query_organization_sponsorship_newsletters(  # noqa
             updates returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1789,7 +2088,10 @@ async def query_organization_sponsorship_newsletters(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorshipNewsletters"]
 
 
@@ -1804,6 +2106,8 @@ async def query_organization_sponsorships_as_maintainer(  # noqa
     include_private: bool = False,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the maintainer.
@@ -1827,6 +2131,10 @@ async def query_organization_sponsorships_as_maintainer(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1855,7 +2163,10 @@ async def query_organization_sponsorships_as_maintainer(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorshipsAsMaintainer"]
 
 
@@ -1870,6 +2181,8 @@ async def query_organization_repository_discussion_comments(  # noqa
     repository_id: str = None,
     only_answers: bool = False,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussion comments this user has authored.
@@ -1891,6 +2204,10 @@ async def query_organization_repository_discussion_comments(  # noqa
             to only those that were marked as the answer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1919,7 +2236,10 @@ async def query_organization_repository_discussion_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["repositoryDiscussionComments"]
 
 
@@ -1928,6 +2248,8 @@ async def query_organization_sponsorship_for_viewer_as_sponsor(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from the viewer to this user/organization; that is, the
@@ -1939,6 +2261,10 @@ async def query_organization_sponsorship_for_viewer_as_sponsor(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1958,7 +2284,10 @@ async def query_organization_sponsorship_for_viewer_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorshipForViewerAsSponsor"]
 
 
@@ -1967,6 +2296,8 @@ async def query_organization_sponsorship_for_viewer_as_sponsorable(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from this user/organization to the viewer; that is, the
@@ -1977,6 +2308,10 @@ async def query_organization_sponsorship_for_viewer_as_sponsorable(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1996,5 +2331,8 @@ async def query_organization_sponsorship_for_viewer_as_sponsorable(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["organization"]["sponsorshipForViewerAsSponsorable"]
@@ -0,0 +1,678 @@
+"""
+Cursor-following pagination of GitHub GraphQL connections.
+"""
+
+import asyncio
+import inspect
+import math
+import socket
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from sgqlc.operation import Operation
+from sgqlc.types import Arg, Int, String, Variable
+
+from prefect_github import GitHubCredentials
+from prefect_github.checkpoints import (
+    DEFAULT_CHECKPOINT_EVERY,
+    Checkpoint,
+    CheckpointStore,
+)
+from prefect_github.concurrency import RequestPriority
+from prefect_github.cost import MAX_PAGE_SIZE
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.schemas import graphql_schema
+from prefect_github.utils import (
+    get_named_type,
+    get_path,
+    get_schema_field,
+    strip_kwargs,
+)
+
+FetchPage = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+T = TypeVar("T")
+# The number of pages fetched ahead of the one being consumed by default.
+DEFAULT_PREFETCH = 1
+# The smallest page adaptive page sizing shrinks to before giving up.
+MIN_PAGE_SIZE = 1
+# Pages fetched faster than this many seconds let adaptive page sizing grow.
+FAST_PAGE_SECONDS = 2.0
+# HTTP statuses GitHub answers with when a query timed out.
+TIMEOUT_STATUSES = (502, 504)
+# The arguments of the query tasks that `iterate_connection` sets itself.
+TASK_PAGINATION_ARGUMENTS = (
+    "github_credentials",
+    "after",
+    "before",
+    "first",
+    "last",
+    "return_fields",
+    "explain",
+    "priority",
+)
+
+
+class ConnectionPage(NamedTuple):
+    """
+    A page of nodes fetched from a connection.
+
+    Attributes:
+        nodes: The nodes of the page, without the null ones GitHub returns for
+            nodes the token cannot access.
+        end_cursor: The cursor to fetch the next page after.
+        has_next_page: Whether the connection has more nodes after the page.
+    """
+
+    nodes: List[Dict[str, Any]]
+    end_cursor: Optional[str]
+    has_next_page: bool
+
+
+async def read_ahead(iterator: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """
+    Advances an async iterator in the background, so that up to `depth` items
+    are ready or being produced while the consumer handles the current one.
+
+    Errors raised by the iterator are raised to the consumer once it reaches
+    the item that failed, and the iterator is cancelled if the consumer stops.
+
+    Args:
+        iterator: The iterator to read ahead of.
+        depth: The number of items to produce ahead; zero disables read-ahead.
+
+    Yields:
+        The items of the iterator, in order.
+    """
+    if depth < 1:
+        async for item in iterator:
+            yield item
+        return
+
+    slots = asyncio.Semaphore(depth)
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def produce():
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    queue.put_nowait((done, None))
+                    return
+                queue.put_nowait((item, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            queue.put_nowait((done, exc))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield item
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def is_page_too_large(exc: BaseException) -> bool:
+    """
+    Checks whether a failed page request may succeed with fewer nodes, i.e.
+    whether it timed out or exceeded GitHub's resource limits.
+
+    Args:
+        exc: The error raised while fetching the page.
+
+    Returns:
+        True for timeouts and `RESOURCE_LIMITS_EXCEEDED` errors.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, socket.timeout, TimeoutError)):
+        return True
+    if not isinstance(exc, GitHubGraphQLError):
+        return False
+    if exc.has_error_type("RESOURCE_LIMITS_EXCEEDED"):
+        return True
+    errors = exc.errors if isinstance(exc.errors, list) else [exc.errors]
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        message = str(error.get("message", "")).lower()
+        if error.get("status") in TIMEOUT_STATUSES or "timeout" in message:
+            return True
+    return False
+
+
+class AdaptivePageSize:
+    """
+    Adapts the number of nodes requested per page to how quickly GitHub
+    serves them.
+
+    The page size is halved whenever a page times out or exceeds GitHub's
+    resource limits, and grows by `growth_factor` after every page fetched in
+    less than `fast_threshold` seconds, up to `maximum`. Slower pages hold it
+    steady.
+
+    Attributes:
+        size: The number of nodes to request for the next page.
+        minimum: The smallest page size.
+        maximum: The largest page size.
+        growth_factor: The factor the page size grows by after a fast page.
+        fast_threshold: The duration, in seconds, under which a page is fast.
+    """
+
+    def __init__(
+        self,
+        size: int = MAX_PAGE_SIZE,
+        minimum: int = MIN_PAGE_SIZE,
+        maximum: int = MAX_PAGE_SIZE,
+        growth_factor: float = 1.5,
+        fast_threshold: float = FAST_PAGE_SECONDS,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.size = max(min(size, maximum), minimum)
+        self.growth_factor = growth_factor
+        self.fast_threshold = fast_threshold
+
+    def record_success(self, duration: float):
+        """
+        Records a page fetched successfully.
+
+        Args:
+            duration: How long the page took to fetch, in seconds.
+        """
+        if duration < self.fast_threshold:
+            grown = math.ceil(self.size * self.growth_factor)
+            self.size = min(grown, self.maximum)
+
+    def shrink(self) -> bool:
+        """
+        Halves the page size after a page was too large to serve.
+
+        Returns:
+            False if the page size was already at its minimum.
+        """
+        if self.size <= self.minimum:
+            return False
+        self.size = max(self.size // 2, self.minimum)
+        return True
+
+
+async def _fetch_connection_pages(
+    fetch: FetchPage,
+    path: Sequence[str],
+    after: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    page_sizer: Optional[AdaptivePageSize] = None,
+) -> AsyncIterator[ConnectionPage]:
+    """
+    Fetches the pages of a connection strictly one after another, retrying
+    pages that were too large with a smaller size if a page sizer is given.
+    """
+    fetched = 0
+    cursor = after
+    while max_items is None or fetched < max_items:
+        if page_sizer is not None:
+            page_size = page_sizer.size
+        first = page_size if max_items is None else min(page_size, max_items - fetched)
+        started = time.monotonic()
+        try:
+            data = await fetch({"after": cursor, "first": first})
+        except Exception as exc:
+            if page_sizer is None or not is_page_too_large(exc):
+                raise
+            if not page_sizer.shrink():
+                raise
+            continue
+        if page_sizer is not None:
+            page_sizer.record_success(time.monotonic() - started)
+
+        connection = get_path(data, path)
+        if connection is None:
+            return
+
+        page_info = connection.get("pageInfo") or {}
+        nodes = connection.get("nodes") or []
+        fetched += len(nodes)
+        cursor = page_info.get("endCursor")
+        has_next_page = bool(page_info.get("hasNextPage")) and cursor is not None
+        yield ConnectionPage(
+            nodes=[node for node in nodes if node is not None],
+            end_cursor=cursor,
+            has_next_page=has_next_page,
+        )
+        if not has_next_page or not nodes:
+            return
+
+
+async def iterate_connection_pages(
+    fetch: FetchPage,
+    path: Sequence[str],
+    after: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    adaptive_page_size: bool = False,
+) -> AsyncIterator[ConnectionPage]:
+    """
+    Fetches the pages of a connection, following the end cursor of each page
+    until the connection is exhausted.
+
+    Since a page's cursor is needed to request the next one, pages are fetched
+    in order, but the request for the next pages is sent while the consumer
+    handles the current one.
+
+    With a checkpoint store, the cursor and progress are saved once the
+    consumer has handled every `checkpoint_every` pages, a traversal resumes
+    from its saved cursor, and the checkpoint is deleted once the traversal
+    completes. Pages handled after the last checkpoint are fetched again
+    on resumption.
+
+    Args:
+        fetch: Coroutine function sending the operation with the `after` and
+            `first` variables it is passed and returning the result data.
+        path: The response keys leading to the connection.
+        after: The cursor to start after; defaults to the start of the list.
+        page_size: The number of nodes to request per page.
+        max_items: The number of nodes to stop after; defaults to all of them.
+        prefetch: The number of pages to fetch ahead of the one being consumed,
+            bounding the pages held in memory; zero fetches a page only once
+            the previous one was consumed.
+        checkpoint_store: The store to save progress to and resume from.
+        checkpoint_key: The key of the traversal in the checkpoint store.
+        checkpoint_every: The number of pages handled between checkpoints.
+        adaptive_page_size: Start at `page_size` but shrink pages that time
+            out or exceed GitHub's resource limits, retrying them, and grow
+            them back toward 100 nodes while they are served quickly.
+
+    Yields:
+        The pages of the connection.
+
+    Raises:
+        ValueError: If a checkpoint store is given without a key.
+    """
+    checkpoint = None
+    if checkpoint_store is not None:
+        if checkpoint_key is None:
+            raise ValueError("A checkpoint key is required to save checkpoints.")
+        checkpoint = await checkpoint_store.load(checkpoint_key)
+    if checkpoint is not None:
+        after = checkpoint.cursor
+        if max_items is not None:
+            max_items = max(max_items - checkpoint.items, 0)
+    pages_handled = checkpoint.pages if checkpoint is not None else 0
+    items_handled = checkpoint.items if checkpoint is not None else 0
+
+    pages = _fetch_connection_pages(
+        fetch,
+        path,
+        after=after,
+        page_size=page_size,
+        max_items=max_items,
+        page_sizer=AdaptivePageSize(page_size) if adaptive_page_size else None,
+    )
+    ahead = read_ahead(pages, prefetch)
+    try:
+        async for page in ahead:
+            yield page
+            # the consumer asked for the next page, so it has handled this one
+            pages_handled += 1
+            items_handled += len(page.nodes)
+            if checkpoint_store is not None and pages_handled % checkpoint_every == 0:
+                checkpoint = Checkpoint(
+                    cursor=page.end_cursor,
+                    pages=pages_handled,
+                    items=items_handled,
+                    updated_at=time.time(),
+                )
+                await checkpoint_store.save(checkpoint_key, checkpoint)
+    finally:
+        await ahead.aclose()
+
+    if checkpoint_store is not None:
+        await checkpoint_store.delete(checkpoint_key)
+
+
+async def iterate_connection_nodes(
+    fetch: FetchPage,
+    path: Sequence[str],
+    after: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    adaptive_page_size: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fetches the nodes of a connection page by page, following cursors.
+
+    Args:
+        fetch: Coroutine function sending the operation with the `after` and
+            `first` variables it is passed and returning the result data.
+        path: The response keys leading to the connection.
+        after: The cursor to start after; defaults to the start of the list.
+        page_size: The number of nodes to request per page.
+        max_items: The number of nodes to stop after; defaults to all of them.
+        prefetch: The number of pages to fetch ahead of the one being consumed.
+        checkpoint_store: The store to save progress to and resume from.
+        checkpoint_key: The key of the traversal in the checkpoint store.
+        checkpoint_every: The number of pages handled between checkpoints.
+        adaptive_page_size: Start at `page_size` but shrink pages that time
+            out or exceed GitHub's resource limits, retrying them, and grow
+            them back toward 100 nodes while they are served quickly.
+
+    Yields:
+        The nodes of the connection, as pages arrive.
+
+    Example:
+        Iterate over every issue of a repository with a string query.
+        ```python
+        from prefect_github import GitHubCredentials
+        from prefect_github.graphql import execute_graphql
+        from prefect_github.pagination import iterate_connection_nodes
+
+        query = '''
+            query($after: String, $first: Int) {
+                repository(owner: "PrefectHQ", name: "prefect") {
+                    issues(after: $after, first: $first) {
+                        pageInfo { hasNextPage endCursor }
+                        nodes { number title }
+                    }
+                }
+            }
+        '''
+        github_credentials = GitHubCredentials.load("github-token")
+
+        async def fetch(variables):
+            return await execute_graphql.fn(query, github_credentials, **variables)
+
+        async for issue in iterate_connection_nodes(
+            fetch, ("repository", "issues")
+        ):
+            print(issue["number"], issue["title"])
+        ```
+    """
+    pages = iterate_connection_pages(
+        fetch,
+        path,
+        after=after,
+        page_size=page_size,
+        max_items=max_items,
+        prefetch=prefetch,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=checkpoint_key,
+        checkpoint_every=checkpoint_every,
+        adaptive_page_size=adaptive_page_size,
+    )
+    try:
+        async for page in pages:
+            for node in page.nodes:
+                yield node
+    finally:
+        await pages.aclose()
+
+
+async def iterate_connection_bidirectional(
+    fetch: FetchPage,
+    path: Sequence[str],
+    after: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    key: str = "id",
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fetches the nodes of a connection from both ends at once, paging forward
+    from the start and backward from the end until the two meet.
+
+    Each round requests the next page of both directions concurrently, so a
+    full traversal takes about half the round trips at the same point cost.
+    The directions met once a page of one holds a node the other already
+    returned, or once either reaches the other end; the overlap is dropped.
+
+    Args:
+        fetch: Coroutine function sending the operation with the `after` and
+            `first`, or `before` and `last`, variables it is passed and
+            returning the result data.
+        path: The response keys leading to the connection.
+        after: The cursor to start the forward direction after.
+        page_size: The number of nodes to request per page and direction.
+        max_items: The number of nodes to stop after; defaults to all of them.
+        key: The node field identifying the nodes the directions both return.
+
+    Yields:
+        The nodes of the connection, the forward and backward ones of each
+            round in turn rather than in connection order.
+    """
+    forward_cursor, backward_cursor = after, None
+    seen = set()
+    yielded = 0
+    while True:
+        forward_data, backward_data = await asyncio.gather(
+            fetch(
+                {
+                    "after": forward_cursor,
+                    "first": page_size,
+                    "before": None,
+                    "last": None,
+                }
+            ),
+            fetch(
+                {
+                    "after": None,
+                    "first": None,
+                    "before": backward_cursor,
+                    "last": page_size,
+                }
+            ),
+        )
+        forward = get_path(forward_data, path)
+        backward = get_path(backward_data, path)
+        if forward is None or backward is None:
+            return
+
+        forward_nodes = [node for node in forward.get("nodes") or [] if node]
+        backward_nodes = [node for node in backward.get("nodes") or [] if node]
+        backward_keys = {node.get(key) for node in backward_nodes} - {None}
+        met = any(
+            node.get(key) in seen or node.get(key) in backward_keys
+            for node in forward_nodes
+        ) or any(node.get(key) in seen for node in backward_nodes)
+        # backward pages list their nodes in connection order
+        for node in forward_nodes + backward_nodes[::-1]:
+            node_key = node.get(key)
+            if node_key is not None:
+                if node_key in seen:
+                    continue
+                seen.add(node_key)
+            yield node
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+
+        forward_info = forward.get("pageInfo") or {}
+        backward_info = backward.get("pageInfo") or {}
+        forward_cursor = forward_info.get("endCursor")
+        backward_cursor = backward_info.get("startCursor")
+        if (
+            met
+            or not forward_info.get("hasNextPage")
+            or not backward_info.get("hasPreviousPage")
+            or forward_cursor is None
+            or backward_cursor is None
+        ):
+            return
+
+
+async def iterate_connection(
+    task: Callable,
+    path: Sequence[str],
+    github_credentials: GitHubCredentials,
+    after: Optional[str] = None,
+    first: int = MAX_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    adaptive_page_size: bool = False,
+    bidirectional: bool = False,
+    return_fields: Optional[Sequence[str]] = None,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterates over every node of the connection a generated query task returns
+    a page of, following its cursors until the connection is exhausted or
+    `max_items` nodes were yielded.
+
+    The operation is built from the query path of the task: `kwargs` are the
+    other arguments of the task, checked against its signature and completed
+    with its defaults, and each is passed to the field along `path` taking it.
+
+    Args:
+        task: The query task of the connection, e.g.
+            `prefect_github.repository.query_repository_issues`.
+        path: The response keys leading to the connection, i.e. the
+            `op_stack` of the task, e.g. `("repository", "issues")`.
+        github_credentials: Credentials to use for authentication with GitHub.
+        after: The cursor to start after; defaults to the start of the list.
+        first: The number of nodes to request per page.
+        max_items: The number of nodes to stop after; defaults to all of them.
+        prefetch: The number of pages to fetch ahead of the one being consumed.
+        checkpoint_store: The store to save the cursor to every
+            `checkpoint_every` pages and to resume from on reruns.
+        checkpoint_every: The number of pages handled between checkpoints.
+        adaptive_page_size: Shrink `first` on timeouts and resource limit
+            errors, and grow it back toward 100 while pages are fast;
+            otherwise every page requests `first` nodes.
+        bidirectional: Page backward from the end at the same time as
+            forward from the start, meeting in the middle; nodes are not
+            yielded in order, their `id` is always selected, `prefetch` and
+            `adaptive_page_size` are ignored, and checkpoints are not
+            supported.
+        return_fields: Subset the node return fields (as snake_case);
+            defaults to the scalar fields of the nodes.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        **kwargs: The other arguments of the task, e.g. `owner` and `name`.
+
+    Yields:
+        A dict of the returned fields of each node.
+
+    Raises:
+        TypeError: If `kwargs` do not match the arguments of the task.
+        ValueError: If `path` does not lead to a connection taking `kwargs`.
+
+    Example:
+        Iterate over the open issues of a repository.
+        ```python
+        from prefect_github import GitHubCredentials
+        from prefect_github.pagination import iterate_connection
+        from prefect_github.repository import query_repository_issues
+
+        github_credentials = await GitHubCredentials.load("github-token")
+        async for issue in iterate_connection(
+            query_repository_issues,
+            ("repository", "issues"),
+            github_credentials,
+            owner="PrefectHQ",
+            name="prefect",
+            states=["OPEN"],
+            return_fields=["number", "title"],
+        ):
+            print(issue["number"], issue["title"])
+        ```
+    """
+    # graphql.py paginates through this module
+    from prefect_github.graphql import (
+        _paginate_graphql_op,
+        _subset_node_return_fields,
+    )
+
+    path = tuple(path)
+    signature = inspect.signature(getattr(task, "fn", task))
+    for name in kwargs:
+        if name in TASK_PAGINATION_ARGUMENTS:
+            raise TypeError(f"iterate_connection sets {name!r} itself.")
+    arguments = signature.bind(github_credentials=github_credentials, **kwargs)
+    arguments.apply_defaults()
+    arguments = strip_kwargs(
+        **{
+            name: value
+            for name, value in arguments.arguments.items()
+            if name not in TASK_PAGINATION_ARGUMENTS
+        }
+    )
+
+    op = Operation(
+        graphql_schema.Query, variables=dict(after=Arg(String), first=Arg(Int))
+    )
+    op_selection, container_type = op, graphql_schema.Query
+    for depth, key in enumerate(path):
+        field = get_schema_field(container_type, key)
+        if field is None:
+            raise ValueError(f"{container_type.__name__} has no field {key!r}.")
+        field_arguments = {}
+        for name in field.args:
+            if name in arguments:
+                field_arguments[name] = arguments.pop(name)
+            elif name in ("after", "first") and depth == len(path) - 1:
+                field_arguments[name] = Variable(name)
+        op_selection = getattr(op_selection, field.name)(**field_arguments)
+        container_type = get_named_type(field.type)
+    if not path or get_schema_field(container_type, "pageInfo") is None:
+        raise ValueError(f"The path {path!r} does not lead to a connection.")
+    if arguments:
+        raise ValueError(
+            f"No field along the path {path!r} takes {', '.join(arguments)}."
+        )
+    _subset_node_return_fields(op_selection, return_fields)
+
+    nodes = _paginate_graphql_op(
+        op,
+        path,
+        github_credentials,
+        after=after,
+        first=first,
+        max_items=max_items,
+        prefetch=prefetch,
+        checkpoint_store=checkpoint_store,
+        checkpoint_every=checkpoint_every,
+        adaptive_page_size=adaptive_page_size,
+        bidirectional=bidirectional,
+        priority=priority,
+    )
+    try:
+        async for node in nodes:
+            yield node
+    finally:
+        await nodes.aclose()
@@ -0,0 +1,369 @@
+"""
+Partitioned pagination: splitting a large result into time windows that are
+paged through concurrently, since the pages of a single cursor cannot be.
+"""
+
+import asyncio
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Union
+
+from prefect.logging import get_logger
+from sgqlc.operation import Operation
+from sgqlc.types import Arg, Int, String, Variable
+
+from prefect_github import GitHubCredentials
+from prefect_github.concurrency import RequestPriority
+from prefect_github.cost import MAX_PAGE_SIZE
+from prefect_github.exceptions import SearchResultLimitError
+from prefect_github.graphql import _execute_graphql_op, _paginate_graphql_op
+from prefect_github.schemas import graphql_schema
+from prefect_github.utils import camel_to_snake_case, get_scalar_field_names
+
+# GitHub returns at most this many results for a single search query.
+SEARCH_RESULT_LIMIT = 1000
+# The number of windows a time range is split into before counting them.
+DEFAULT_PARTITIONS = 8
+# The number of partitions paged through at the same time by default.
+DEFAULT_MAX_CONCURRENCY = 4
+# The number of windows counted per request while planning partitions.
+WINDOWS_PER_COUNT_REQUEST = 50
+
+# The node types, and the count field, of each type of search.
+SEARCH_TYPES = {
+    "ISSUE": (("Issue", "PullRequest"), "issueCount"),
+    "REPOSITORY": (("Repository",), "repositoryCount"),
+    "USER": (("User", "Organization"), "userCount"),
+    "DISCUSSION": (("Discussion",), "discussionCount"),
+}
+
+logger = get_logger(__name__)
+
+
+class TimeWindow(NamedTuple):
+    """
+    A half-open range of time, from `start` included to `end` excluded.
+
+    Attributes:
+        start: The start of the window, in UTC.
+        end: The end of the window, in UTC.
+    """
+
+    start: datetime
+    end: datetime
+
+    def split(self, parts: int) -> List["TimeWindow"]:
+        """
+        Splits the window into consecutive windows of equal length, rounded to
+        whole seconds, the smallest range search qualifiers express.
+
+        Args:
+            parts: The number of windows to split into.
+
+        Returns:
+            The windows, fewer than `parts` if the window is too short.
+        """
+        seconds = math.ceil((self.end - self.start).total_seconds())
+        parts = max(1, min(parts, seconds))
+        bounds = [
+            self.start + timedelta(seconds=seconds * index // parts)
+            for index in range(parts)
+        ]
+        return [
+            TimeWindow(start, end)
+            for start, end in zip(bounds, bounds[1:] + [self.end])
+        ]
+
+    def to_qualifier(self, field: str) -> str:
+        """
+        Formats the window as a search qualifier.
+
+        Args:
+            field: The date qualifier to restrict, e.g. `created` or `updated`.
+
+        Returns:
+            An inclusive range qualifier, e.g.
+                `created:2023-01-01T00:00:00Z..2023-01-31T23:59:59Z`.
+        """
+        last = self.end - timedelta(seconds=1)
+        return f"{field}:{_format_timestamp(self.start)}..{_format_timestamp(last)}"
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """
+    Formats a UTC timestamp the way search qualifiers expect.
+    """
+    return timestamp.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _to_utc(timestamp: Union[datetime, str]) -> datetime:
+    """
+    Parses a timestamp, assuming UTC if it has no offset.
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+async def merge_partitions(
+    partitions: Iterable[AsyncIterator[Dict[str, Any]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    key: str = "id",
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterates over several partitions of a result concurrently, yielding their
+    nodes as they arrive, each once.
+
+    Partitions may overlap, e.g. when a node is updated while an export by
+    update time runs, so nodes are deduplicated by `key`; nodes without it
+    are always yielded. Errors raised by a partition stop every partition.
+
+    Args:
+        partitions: The async iterators over the nodes of each partition.
+        max_concurrency: The number of partitions iterated at the same time.
+        key: The node field identifying duplicates.
+
+    Yields:
+        The nodes of every partition, in no particular order.
+    """
+    partitions = list(partitions)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * MAX_PAGE_SIZE)
+    slots = asyncio.Semaphore(max_concurrency)
+    done = object()
+
+    async def drain(partition: AsyncIterator[Dict[str, Any]]):
+        error = None
+        async with slots:
+            try:
+                async for node in partition:
+                    await queue.put((node, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = exc
+            finally:
+                aclose = getattr(partition, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        await queue.put((done, error))
+
+    tasks = [asyncio.ensure_future(drain(partition)) for partition in partitions]
+    seen = set()
+    remaining = len(tasks)
+    try:
+        while remaining:
+            node, error = await queue.get()
+            if node is done:
+                if error is not None:
+                    raise error
+                remaining -= 1
+                continue
+            node_key = node.get(key) if isinstance(node, dict) else None
+            if node_key is not None:
+                if node_key in seen:
+                    continue
+                seen.add(node_key)
+            yield node
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def plan_search_partitions(
+    query: str,
+    type: graphql_schema.SearchType,
+    github_credentials: GitHubCredentials,
+    window: TimeWindow,
+    field: str = "created",
+    partitions: int = DEFAULT_PARTITIONS,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    allow_truncated: bool = False,
+) -> List[TimeWindow]:
+    """
+    Splits a time range into windows whose searches each return fewer results
+    than GitHub's limit, counting the results of many windows per request.
+
+    Args:
+        query: The search query, without the date qualifier.
+        type: The type of search, e.g. `ISSUE`.
+        github_credentials: Credentials to use for authentication with GitHub.
+        window: The time range to split.
+        field: The date qualifier to split on, e.g. `created` or `updated`.
+        partitions: The number of windows to split into at first.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        allow_truncated: Whether to keep, with a warning, a window still
+            exceeding the limit after it was split down to a second, of
+            which only the first results can be fetched.
+
+    Returns:
+        The non-empty windows, in order.
+
+    Raises:
+        SearchResultLimitError: If a window of a second exceeds the limit,
+            unless `allow_truncated`.
+    """
+    count_field = SEARCH_TYPES[str(type)][1]
+    planned = []
+    windows = window.split(partitions)
+    while windows:
+        batch = windows[:WINDOWS_PER_COUNT_REQUEST]
+        windows = windows[WINDOWS_PER_COUNT_REQUEST:]
+        op = Operation(graphql_schema.Query)
+        for index, batch_window in enumerate(batch):
+            op.search(
+                __alias__=f"window{index}",
+                query=f"{query} {batch_window.to_qualifier(field)}",
+                type=type,
+                first=0,
+            ).__fields__(camel_to_snake_case(count_field))
+        result = await _execute_graphql_op(op, github_credentials, priority=priority)
+
+        for index, batch_window in enumerate(batch):
+            count = result[f"window{index}"][count_field]
+            if count == 0:
+                continue
+            smaller = []
+            if count > SEARCH_RESULT_LIMIT:
+                smaller = batch_window.split(math.ceil(count / SEARCH_RESULT_LIMIT) + 1)
+            if len(smaller) > 1:
+                windows.extend(smaller)
+                continue
+            if count > SEARCH_RESULT_LIMIT:
+                window_query = f"{query} {batch_window.to_qualifier(field)}"
+                if not allow_truncated:
+                    raise SearchResultLimitError(window_query, count)
+                logger.warning(
+                    "The search %r returns %s results; only the first %s are "
+                    "fetched.",
+                    window_query,
+                    count,
+                    SEARCH_RESULT_LIMIT,
+                )
+            planned.append(batch_window)
+    return sorted(planned)
+
+
+def _select_search_nodes(
+    op: Operation, query: str, type: graphql_schema.SearchType, return_fields
+):
+    """
+    Selects the page info and the node fields of a search, for every node
+    type the search can return.
+    """
+    search = op.search(
+        query=query, type=type, after=Variable("after"), first=Variable("first")
+    )
+    search.page_info().__fields__("has_next_page", "end_cursor")
+    nodes = search.nodes()
+    for type_name in SEARCH_TYPES[str(type)][0]:
+        node_type = getattr(graphql_schema, type_name)
+        fields = return_fields or get_scalar_field_names(node_type)
+        fields = {camel_to_snake_case(field) for field in fields} | {"id"}
+        nodes.__as__(node_type).__fields__(
+            *(field for field in fields if field in node_type.__field_names__)
+        )
+
+
+async def iterate_partitioned_search(
+    query: str,
+    type: graphql_schema.SearchType,
+    github_credentials: GitHubCredentials,
+    start: Union[datetime, str],
+    end: Union[datetime, str, None] = None,
+    field: str = "created",
+    partitions: int = DEFAULT_PARTITIONS,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    first: int = 100,
+    return_fields: Iterable[str] = None,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    allow_truncated: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterates over every result of a search, split into time windows that are
+    paged through concurrently.
+
+    The time range is split into `partitions` windows by the `field` date
+    qualifier, and windows with more results than GitHub's search limit are
+    split further, down to a second. Results are deduplicated by `id`, so
+    `updated` windows may be used while results change.
+
+    Args:
+        query: The search query, without the date qualifier, e.g.
+            `repo:PrefectHQ/prefect is:pr`.
+        type: The type of search, e.g. `ISSUE`.
+        github_credentials: Credentials to use for authentication with GitHub.
+        start: The start of the time range.
+        end: The end of the time range; defaults to now.
+        field: The date qualifier to split on, e.g. `created` or `updated`.
+        partitions: The number of windows to split into at first.
+        max_concurrency: The number of windows paged through at the same time.
+        first: The number of nodes to request per page.
+        return_fields: Subset the node return fields (as snake_case), for
+            each node type the search returns; defaults to their scalar fields.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        allow_truncated: Whether to yield, with a warning, the results GitHub
+            returns for a window of a second exceeding the search limit,
+            rather than raise.
+
+    Yields:
+        A dict of the returned fields of each result, in no particular order.
+
+    Raises:
+        SearchResultLimitError: If a window of a second exceeds the search
+            limit, unless `allow_truncated`; raised before any result is
+            yielded.
+
+    Example:
+        Export every pull request of a repository, four windows at a time.
+        ```python
+        from prefect_github import GitHubCredentials
+        from prefect_github.partitions import iterate_partitioned_search
+
+        github_credentials = GitHubCredentials.load("github-token")
+        async for pull_request in iterate_partitioned_search(
+            "repo:PrefectHQ/prefect is:pr",
+            "ISSUE",
+            github_credentials,
+            start="2018-01-01",
+            return_fields=["number", "title"],
+        ):
+            export(pull_request)
+        ```
+    """
+    window = TimeWindow(
+        _to_utc(start), _to_utc(end) if end is not None else datetime.now(timezone.utc)
+    )
+    windows = await plan_search_partitions(
+        query,
+        type,
+        github_credentials,
+        window,
+        field=field,
+        partitions=partitions,
+        priority=priority,
+        allow_truncated=allow_truncated,
+    )
+
+    def iterate_window(window: TimeWindow) -> AsyncIterator[Dict[str, Any]]:
+        op = Operation(
+            graphql_schema.Query, variables=dict(after=Arg(String), first=Arg(Int))
+        )
+        window_query = f"{query} {window.to_qualifier(field)}"
+        _select_search_nodes(op, window_query, type, return_fields)
+        return _paginate_graphql_op(
+            op, ("search",), github_credentials, first=first, priority=priority
+        )
+
+    nodes = merge_partitions(
+        (iterate_window(window) for window in windows), max_concurrency=max_concurrency
+    )
+    try:
+        async for node in nodes:
+            yield node
+    finally:
+        await nodes.aclose()
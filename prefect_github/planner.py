@@ -0,0 +1,351 @@
+"""
+Planning of GraphQL operations that GitHub would reject as a single request
+because they could return more than `MAX_NODE_LIMIT` nodes.
+"""
+
+from copy import deepcopy
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from graphql import DocumentNode, FieldNode, IntValueNode, StringValueNode, print_ast
+
+from prefect_github.cost import MAX_NODE_LIMIT, estimate_query_cost
+from prefect_github.hydration import (
+    DEFAULT_PARENTS_PER_REQUEST,
+    PendingConnection,
+    Send,
+    _merge_page,
+    find_inner_connections,
+    hydrate_connections,
+    prepare_hydration,
+)
+from prefect_github.utils import (
+    ensure_selected,
+    find_fields,
+    get_path,
+    prune_unused_variables,
+    set_argument,
+)
+
+
+class SplitPlan(NamedTuple):
+    """
+    A plan to fetch an outer connection in several smaller pages.
+
+    Attributes:
+        path: The response keys leading to the outer connection.
+        page_argument: The argument that sets the page size, first or last.
+        total: The number of nodes the caller asked for.
+        chunk_size: The page size that keeps each request within the limit.
+    """
+
+    path: List[str]
+    page_argument: str
+    total: int
+    chunk_size: int
+
+
+def get_page_argument(field: FieldNode) -> str:
+    """
+    Gets the argument that sets the page size of a connection field.
+
+    Args:
+        field: The connection field node.
+
+    Returns:
+        `last` if the field pages backward, otherwise `first`.
+    """
+    names = {argument.name.value for argument in field.arguments or ()}
+    return "last" if "last" in names and "first" not in names else "first"
+
+
+def plan_node_limit_split(
+    document: DocumentNode,
+    variables: Optional[Dict[str, Any]] = None,
+    node_limit: int = MAX_NODE_LIMIT,
+) -> Optional[SplitPlan]:
+    """
+    Plans how to split an operation along its largest outer connection, so
+    that each request stays within the node limit while the merged results
+    keep the shape the caller asked for.
+
+    Args:
+        document: The parsed operation.
+        variables: The variables the operation is sent with.
+        node_limit: The number of nodes a single request may return.
+
+    Returns:
+        The split plan, or None if the operation is within the limit or cannot
+        be split this way because a single outer node already exceeds it.
+    """
+    cost = estimate_query_cost(document, **(variables or {}))
+    if cost.node_count <= node_limit:
+        return None
+
+    plan = None
+    largest_subtree = 0
+    for connection in cost.connections:
+        if connection.parent_count != 1:
+            continue
+        subtree = sum(
+            other.node_count
+            for other in cost.connections
+            if other.path == connection.path
+            or other.path.startswith(f"{connection.path}.")
+        )
+        if subtree <= largest_subtree:
+            continue
+        largest_subtree = subtree
+        # nodes under the connection grow linearly with its page size
+        chunk_size = (
+            (node_limit - (cost.node_count - subtree)) * connection.page_size
+        ) // subtree
+        path = connection.path.split(".")
+        fields = find_fields(document, path)
+        plan = SplitPlan(
+            path=path,
+            page_argument=get_page_argument(fields[0]) if fields else "first",
+            total=connection.page_size,
+            chunk_size=chunk_size,
+        )
+    if plan is None or plan.chunk_size < 1:
+        return None
+    return plan
+
+
+def shrink_inner_page_sizes(
+    document: DocumentNode,
+    variables: Optional[Dict[str, Any]] = None,
+    node_limit: int = MAX_NODE_LIMIT,
+) -> DocumentNode:
+    """
+    Halves the page sizes of the largest inner connections until the operation
+    fits within the node limit. The shrunk connections hold fewer nodes than
+    asked for; see `execute_shrunk_operation` to fetch the rest.
+
+    Args:
+        document: The parsed operation; it is copied, not modified.
+        variables: The variables the operation is sent with.
+        node_limit: The number of nodes a single request may return.
+
+    Returns:
+        A copy of the operation that fits within the node limit.
+
+    Raises:
+        ValueError: If the operation exceeds the limit even with pages of one.
+    """
+    document = deepcopy(document)
+    while True:
+        cost = estimate_query_cost(document, **(variables or {}))
+        if cost.node_count <= node_limit:
+            return document
+        candidates = [
+            connection for connection in cost.connections if connection.page_size > 1
+        ]
+        if not candidates:
+            raise ValueError(
+                f"The operation requests {cost.node_count} nodes, which exceeds "
+                f"the limit of {node_limit} even with one node per page."
+            )
+        # prefer inner connections, which multiply the nodes of the ones above
+        target = max(
+            candidates,
+            key=lambda connection: (connection.parent_count > 1, connection.node_count),
+        )
+        for field in find_fields(document, target.path.split(".")):
+            set_argument(
+                field,
+                get_page_argument(field),
+                IntValueNode(value=str(target.page_size // 2)),
+            )
+
+
+def _selects_field(field: FieldNode, name: str) -> bool:
+    """
+    Checks whether a field node directly selects a nested field, unaliased.
+    """
+    return field.selection_set is not None and any(
+        isinstance(selection, FieldNode)
+        and selection.alias is None
+        and selection.name.value == name
+        for selection in field.selection_set.selections
+    )
+
+
+async def execute_split_plan(
+    document: DocumentNode,
+    plan: SplitPlan,
+    send: Send,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetches the outer connection of a split plan page by page and merges the
+    pages into a single result.
+
+    Args:
+        document: The parsed operation; it is copied, not modified.
+        plan: The plan returned by `plan_node_limit_split`.
+        send: Coroutine function sending a query string with its variables
+            and returning the result data.
+        variables: The variables the operation is sent with.
+
+    Returns:
+        The result data, shaped as if the operation had been sent at once.
+    """
+    document = deepcopy(document)
+    fields = find_fields(document, plan.path)
+    forward = plan.page_argument == "first"
+    if forward:
+        cursor_argument, cursor_key, more_key = "after", "endCursor", "hasNextPage"
+    else:
+        cursor_argument, cursor_key, more_key = (
+            "before",
+            "startCursor",
+            "hasPreviousPage",
+        )
+    had_page_info = all(_selects_field(field, "pageInfo") for field in fields)
+    injected = [
+        key
+        for key in (cursor_key, more_key)
+        if any([ensure_selected(field, ("pageInfo", key)) for field in fields])
+    ]
+
+    merged = merged_connection = cursor = None
+    fetched = 0
+    while fetched < plan.total:
+        page_size = min(plan.chunk_size, plan.total - fetched)
+        for field in fields:
+            set_argument(field, plan.page_argument, IntValueNode(value=str(page_size)))
+            if cursor is not None:
+                set_argument(field, cursor_argument, StringValueNode(value=cursor))
+        page_variables = prune_unused_variables(document, dict(variables or {}))
+        data = await send(print_ast(document), page_variables)
+        connection = get_path(data, plan.path)
+        fetched += page_size
+
+        if merged is None:
+            merged, merged_connection = data, connection
+        elif connection is not None:
+            _merge_page(merged_connection, connection, forward)
+        if connection is None or not (connection.get("pageInfo") or {}).get(more_key):
+            break
+        cursor = connection["pageInfo"][cursor_key]
+
+    if merged_connection is not None:
+        if not had_page_info:
+            merged_connection.pop("pageInfo", None)
+        for key in injected:
+            (merged_connection.get("pageInfo") or {}).pop(key, None)
+    return merged
+
+
+async def execute_shrunk_operation(
+    document: DocumentNode,
+    shrunk: DocumentNode,
+    send: Send,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Executes an operation whose inner page sizes were shrunk, then fetches the
+    next pages of every shrunk connection until it holds as many nodes as the
+    original operation asked for.
+
+    The follow-up requests select the connections through their parent's
+    `id`, a page of the shrunk size at a time, for no more parents than the
+    shrunk operation did, so that each stays within the same node limit.
+    The page info and parent `id` hydration needs are returned too.
+
+    Args:
+        document: The parsed operation, as the caller wrote it.
+        shrunk: The operation returned by `shrink_inner_page_sizes`.
+        send: Coroutine function sending a query string with its variables
+            and returning the result data.
+        variables: The variables the operation is sent with.
+
+    Returns:
+        The result data, with the page sizes of the original operation.
+
+    Raises:
+        ValueError: If a shrunk connection cannot be followed up: it is not
+            nested in another connection, its parent has no `id`, or it
+            pages backward.
+    """
+    requested = {
+        connection.path: connection.page_size
+        for connection in estimate_query_cost(document, **(variables or {})).connections
+    }
+    shrunk_connections = [
+        connection
+        for connection in estimate_query_cost(shrunk, **(variables or {})).connections
+        if connection.page_size < requested.get(connection.path, 0)
+    ]
+    prepared = prepare_hydration(shrunk)
+    followed = {id(field) for field in find_inner_connections(prepared)}
+    limits = {}
+    for connection in shrunk_connections:
+        for field in find_fields(prepared, connection.path.split(".")):
+            if id(field) not in followed or get_page_argument(field) == "last":
+                raise ValueError(
+                    f"The operation exceeds the node limit unless `{connection.path}` "
+                    f"is shrunk from {requested[connection.path]} to "
+                    f"{connection.page_size} nodes, whose remaining pages cannot be "
+                    "fetched; split the operation or lower its page sizes."
+                )
+            limits[id(field)] = (requested[connection.path], connection.page_size)
+
+    variables = prune_unused_variables(prepared, dict(variables or {}))
+    data = await send(print_ast(prepared), variables)
+    if not limits:
+        return data
+
+    def get_next_page_size(pending: PendingConnection) -> int:
+        """Requests at most the nodes still missing from a shrunk connection."""
+        total, page_size = limits.get(id(pending.field), (0, 0))
+        fetched = pending.connection.get("nodes") or pending.connection.get("edges")
+        return max(min(page_size, total - len(fetched or ())), 0)
+
+    parents_per_request = min(
+        DEFAULT_PARENTS_PER_REQUEST,
+        *(connection.parent_count for connection in shrunk_connections),
+    )
+    return await hydrate_connections(
+        prepared,
+        data,
+        send,
+        variables,
+        parents_per_request=parents_per_request,
+        page_sizes=get_next_page_size,
+    )
+
+
+async def execute_within_node_limit(
+    document: DocumentNode,
+    send: Send,
+    variables: Optional[Dict[str, Any]] = None,
+    node_limit: int = MAX_NODE_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Executes an operation that could exceed the node limit, splitting its
+    largest outer connection into several requests when possible and
+    otherwise shrinking the page sizes of its inner connections and fetching
+    their remaining pages with follow-up requests.
+
+    Args:
+        document: The parsed operation.
+        send: Coroutine function sending a query string with its variables
+            and returning the result data.
+        variables: The variables the operation is sent with.
+        node_limit: The number of nodes a single request may return.
+
+    Returns:
+        The result data.
+
+    Raises:
+        ValueError: If the operation cannot be brought within the limit, or a
+            connection it had to shrink cannot be followed up; see
+            `execute_shrunk_operation`.
+    """
+    plan = plan_node_limit_split(document, variables, node_limit)
+    if plan is not None:
+        return await execute_split_plan(document, plan, send, variables)
+    shrunk = shrink_inner_page_sizes(document, variables, node_limit)
+    return await execute_shrunk_operation(document, shrunk, send, variables)
@@ -0,0 +1,441 @@
+"""Helpers for tracking GitHub rate-limit feedback."""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+DEFAULT_POINTS_PER_HOUR = 5000
+SECONDARY_RATE_LIMIT_COOLDOWN = 60
+
+# OAuth scopes that GitHub grants implicitly alongside a broader scope.
+IMPLIED_SCOPES = {
+    "repo": {
+        "repo:status",
+        "repo_deployment",
+        "public_repo",
+        "repo:invite",
+        "security_events",
+    },
+    "admin:org": {"write:org", "read:org"},
+    "write:org": {"read:org"},
+    "admin:public_key": {"write:public_key", "read:public_key"},
+    "write:public_key": {"read:public_key"},
+    "admin:repo_hook": {"write:repo_hook", "read:repo_hook"},
+    "write:repo_hook": {"read:repo_hook"},
+    "admin:gpg_key": {"write:gpg_key", "read:gpg_key"},
+    "write:gpg_key": {"read:gpg_key"},
+    "user": {"read:user", "user:email", "user:follow"},
+    "write:packages": {"read:packages"},
+    "write:discussion": {"read:discussion"},
+    "project": {"read:project"},
+}
+
+
+class RateLimitFeedback(NamedTuple):
+    """
+    Rate-limit information reported by GitHub alongside a response.
+
+    Attributes:
+        status: The HTTP status code of the response.
+        limit: The number of points allotted per window, if reported.
+        remaining: The number of points left in the window, if reported.
+        reset_at: The epoch time at which the window resets, if reported.
+        retry_after: The number of seconds GitHub asked to wait, if reported.
+        scopes: The OAuth scopes granted to the token, if reported.
+        throttled: Whether the request was rejected for exceeding a limit.
+    """
+
+    status: int
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[float]
+    retry_after: Optional[float]
+    scopes: Optional[FrozenSet[str]]
+    throttled: bool
+
+
+def token_fingerprint(token: Optional[str]) -> str:
+    """
+    Derives a stable, non-secret key for a token so that its budget can be
+    tracked without keeping the token itself around.
+
+    Args:
+        token: The token to fingerprint; None stands for anonymous access.
+
+    Returns:
+        A short hex digest identifying the token.
+    """
+    if token is None:
+        return "anonymous"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_error_details(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Finds the HTTP details that sgqlc attaches to a failed response, either at
+    the top level or on the first error.
+    """
+    if "status" in result:
+        return result
+    errors = result.get("errors")
+    if isinstance(errors, list) and errors and isinstance(errors[0], dict):
+        return errors[0]
+    return {}
+
+
+def get_response_headers(result: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Extracts the HTTP response headers from a raw sgqlc endpoint result.
+
+    Args:
+        result: The dict returned by calling an sgqlc endpoint.
+
+    Returns:
+        The response headers with lowercased names; empty if unavailable.
+    """
+    headers = result.get("headers") or _get_error_details(result).get("headers")
+    if not headers:
+        return {}
+    return {str(key).lower(): str(value) for key, value in dict(headers).items()}
+
+
+def get_response_status(result: Dict[str, Any]) -> int:
+    """
+    Extracts the HTTP status code from a raw sgqlc endpoint result.
+
+    Args:
+        result: The dict returned by calling an sgqlc endpoint.
+
+    Returns:
+        The HTTP status code, assuming 200 when sgqlc did not record one.
+    """
+    return int(_get_error_details(result).get("status") or 200)
+
+
+def _to_number(value: Optional[str], cast=int):
+    """
+    Converts a header value to a number, returning None if it is missing or
+    malformed.
+    """
+    try:
+        return cast(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _has_error_type(result: Dict[str, Any], error_type: str) -> bool:
+    """
+    Checks whether any GraphQL error in the result has the given type.
+    """
+    errors = result.get("errors")
+    if not isinstance(errors, list):
+        return False
+    return any(
+        isinstance(error, dict) and error.get("type") == error_type for error in errors
+    )
+
+
+def parse_rate_limit_feedback(result: Dict[str, Any]) -> RateLimitFeedback:
+    """
+    Parses the rate-limit headers and errors of a raw sgqlc endpoint result.
+
+    Args:
+        result: The dict returned by calling an sgqlc endpoint.
+
+    Returns:
+        The rate-limit feedback contained in the response.
+    """
+    headers = get_response_headers(result)
+    status = get_response_status(result)
+    remaining = _to_number(headers.get("x-ratelimit-remaining"))
+    retry_after = _to_number(headers.get("retry-after"), float)
+
+    scopes = headers.get("x-oauth-scopes")
+    if scopes is not None:
+        granted = {scope.strip() for scope in scopes.split(",") if scope.strip()}
+        for scope in tuple(granted):
+            granted |= IMPLIED_SCOPES.get(scope, set())
+        scopes = frozenset(granted)
+
+    body = str(_get_error_details(result).get("body", "")).lower()
+    throttled = _has_error_type(result, "RATE_LIMITED") or (
+        status in (403, 429)
+        and (remaining == 0 or retry_after is not None or "rate limit" in body)
+    )
+    return RateLimitFeedback(
+        status=status,
+        limit=_to_number(headers.get("x-ratelimit-limit")),
+        remaining=remaining,
+        reset_at=_to_number(headers.get("x-ratelimit-reset"), float),
+        retry_after=retry_after,
+        scopes=scopes,
+        throttled=throttled,
+    )
+
+
+def get_cooldown_until(
+    feedback: RateLimitFeedback, now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Works out until when a token must not be used after a response.
+
+    Args:
+        feedback: The feedback parsed from the response.
+        now: The current epoch time; defaults to `time.time()`.
+
+    Returns:
+        The epoch time at which GitHub allows the token again, or None if the
+        response was not throttled.
+    """
+    if not feedback.throttled:
+        return None
+    now = time.time() if now is None else now
+    if feedback.retry_after is not None:
+        return now + feedback.retry_after
+    if feedback.remaining == 0 and feedback.reset_at is not None:
+        return feedback.reset_at
+    return now + SECONDARY_RATE_LIMIT_COOLDOWN
+
+
+class TokenBudget:
+    """
+    In-process view of the rate-limit budget left on a single token.
+
+    The budget is updated from the feedback of every response and keeps track
+    of requests that are still in flight, so that concurrent callers do not
+    all pile onto the same token before its feedback arrives.
+
+    Attributes:
+        limit: The number of points allotted per window.
+        remaining: The number of points GitHub last reported as left.
+        reset_at: The epoch time at which the window resets.
+        cooldown_until: The epoch time before which the token is out of rotation.
+        in_flight: The number of requests currently using the token.
+        scopes: The OAuth scopes last reported for the token, if known.
+    """
+
+    def __init__(self, limit: int = DEFAULT_POINTS_PER_HOUR):
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = 0.0
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.scopes: Optional[FrozenSet[str]] = None
+
+    def available(self, now: Optional[float] = None) -> int:
+        """
+        Estimates the points that can still be spent on the token.
+
+        Args:
+            now: The current epoch time; defaults to `time.time()`.
+
+        Returns:
+            The reported remaining points minus the requests in flight.
+        """
+        now = time.time() if now is None else now
+        if self.reset_at and now >= self.reset_at:
+            return self.limit - self.in_flight
+        return self.remaining - self.in_flight
+
+    def is_cooling_down(self, now: Optional[float] = None) -> bool:
+        """
+        Checks whether the token is temporarily out of rotation.
+
+        Args:
+            now: The current epoch time; defaults to `time.time()`.
+
+        Returns:
+            True if the token was throttled and its cooldown has not elapsed.
+        """
+        now = time.time() if now is None else now
+        return now < self.cooldown_until
+
+    def has_scopes(self, scopes: FrozenSet[str]) -> bool:
+        """
+        Checks whether the token is known, or assumed, to carry the scopes.
+
+        Args:
+            scopes: The OAuth scopes a request needs.
+
+        Returns:
+            False only if GitHub reported scopes that do not cover the request.
+        """
+        return self.scopes is None or scopes <= self.scopes
+
+    def record(self, feedback: RateLimitFeedback, now: Optional[float] = None):
+        """
+        Updates the budget from the feedback of a response.
+
+        Args:
+            feedback: The feedback parsed from the response.
+            now: The current epoch time; defaults to `time.time()`.
+        """
+        now = time.time() if now is None else now
+        if feedback.limit is not None:
+            self.limit = feedback.limit
+        if feedback.remaining is not None:
+            self.remaining = feedback.remaining
+        if feedback.reset_at is not None:
+            self.reset_at = feedback.reset_at
+        if feedback.scopes is not None:
+            self.scopes = feedback.scopes
+
+        cooldown_until = get_cooldown_until(feedback, now)
+        if cooldown_until is not None:
+            self.cooldown_until = cooldown_until
+
+
+_TOKEN_BUDGETS: Dict[str, TokenBudget] = {}
+_TOKEN_BUDGETS_LOCK = threading.Lock()
+
+
+def get_token_budget(fingerprint: str) -> TokenBudget:
+    """
+    Gets the process-wide budget tracked for a token, creating it if needed.
+
+    Args:
+        fingerprint: The fingerprint of the token, see `token_fingerprint`.
+
+    Returns:
+        The budget shared by every client using the token in this process.
+    """
+    with _TOKEN_BUDGETS_LOCK:
+        budget = _TOKEN_BUDGETS.get(fingerprint)
+        if budget is None:
+            budget = _TOKEN_BUDGETS[fingerprint] = TokenBudget()
+        return budget
+
+
+def acquire_token_budget(
+    fingerprints: Iterable[str],
+    scopes: FrozenSet[str] = frozenset(),
+    exclude: Iterable[str] = (),
+) -> str:
+    """
+    Picks the token with the most remaining budget and marks one request as
+    in flight on it.
+
+    Tokens that are cooling down after being throttled are only picked if
+    every other eligible token is cooling down too, in which case the one
+    that comes back first is used.
+
+    Args:
+        fingerprints: The fingerprints of the tokens to choose from.
+        scopes: The OAuth scopes the request needs.
+        exclude: Fingerprints that must not be picked, e.g. already tried.
+
+    Returns:
+        The fingerprint of the selected token.
+
+    Raises:
+        ValueError: If no token is left to choose from, or none of the
+            remaining tokens carries the requested scopes.
+    """
+    exclude = set(exclude)
+    now = time.time()
+    with _TOKEN_BUDGETS_LOCK:
+        candidates = [
+            fingerprint for fingerprint in fingerprints if fingerprint not in exclude
+        ]
+        if not candidates:
+            raise ValueError("No tokens left to send the request with.")
+
+        for fingerprint in candidates:
+            if fingerprint not in _TOKEN_BUDGETS:
+                _TOKEN_BUDGETS[fingerprint] = TokenBudget()
+        candidates = [
+            fingerprint
+            for fingerprint in candidates
+            if _TOKEN_BUDGETS[fingerprint].has_scopes(scopes)
+        ]
+        if not candidates:
+            raise ValueError(
+                f"None of the tokens carries the required scopes: {sorted(scopes)}"
+            )
+
+        ready = [
+            fingerprint
+            for fingerprint in candidates
+            if not _TOKEN_BUDGETS[fingerprint].is_cooling_down(now)
+        ]
+        if ready:
+            selected = max(
+                ready,
+                key=lambda fingerprint: _TOKEN_BUDGETS[fingerprint].available(now),
+            )
+        else:
+            selected = min(
+                candidates,
+                key=lambda fingerprint: _TOKEN_BUDGETS[fingerprint].cooldown_until,
+            )
+        _TOKEN_BUDGETS[selected].in_flight += 1
+        return selected
+
+
+def release_token_budget(
+    fingerprint: str, feedback: Optional[RateLimitFeedback] = None
+):
+    """
+    Marks a request on the token as finished and records its feedback.
+
+    Args:
+        fingerprint: The fingerprint returned by `acquire_token_budget`.
+        feedback: The feedback parsed from the response, if one was received.
+    """
+    with _TOKEN_BUDGETS_LOCK:
+        budget = _TOKEN_BUDGETS.setdefault(fingerprint, TokenBudget())
+        budget.in_flight = max(budget.in_flight - 1, 0)
+        if feedback is not None:
+            budget.record(feedback)
+
+
+def record_token_feedback(fingerprint: str, feedback: RateLimitFeedback):
+    """
+    Records the feedback of a response on the budget of the token it was sent
+    with, without touching the requests in flight.
+
+    Args:
+        fingerprint: The fingerprint of the token.
+        feedback: The feedback parsed from the response.
+    """
+    with _TOKEN_BUDGETS_LOCK:
+        _TOKEN_BUDGETS.setdefault(fingerprint, TokenBudget()).record(feedback)
+
+
+def defer_token_budget(fingerprint: str, until: float):
+    """
+    Takes a token out of rotation, e.g. because workers in other processes
+    have used up its shared budget.
+
+    Args:
+        fingerprint: The fingerprint of the token.
+        until: The epoch time at which the token may be used again.
+    """
+    with _TOKEN_BUDGETS_LOCK:
+        budget = _TOKEN_BUDGETS.setdefault(fingerprint, TokenBudget())
+        budget.cooldown_until = max(budget.cooldown_until, until)
+
+
+def get_budget_summary(fingerprints: Iterable[str]) -> Tuple[int, int, float]:
+    """
+    Sums up the budget left on several tokens.
+
+    Args:
+        fingerprints: The fingerprints of the tokens.
+
+    Returns:
+        The points available, the points allotted per window, and the earliest
+        time at which one of the windows resets.
+    """
+    now = time.time()
+    available = limit = 0
+    reset_at = float("inf")
+    with _TOKEN_BUDGETS_LOCK:
+        for fingerprint in fingerprints:
+            budget = _TOKEN_BUDGETS.setdefault(fingerprint, TokenBudget())
+            available += budget.available(now)
+            limit += budget.limit
+            if budget.reset_at > now:
+                reset_at = min(reset_at, budget.reset_at)
+    return available, limit, reset_at
@@ -24,8 +24,13 @@ from pydantic import Field, validator
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
+from prefect_github.concurrency import RequestPriority
 from prefect_github.exceptions import InvalidRepositoryURLError
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _subset_return_fields,
+)
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -163,6 +168,8 @@ async def query_repository(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The query root of GitHub's GraphQL interface.
@@ -175,6 +182,10 @@ async def query_repository(  # noqa
             referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -193,7 +204,10 @@ async def query_repository(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]
 
 
@@ -205,6 +219,8 @@ async def query_repository_ref(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Fetch a given ref from the repository.
@@ -220,6 +236,10 @@ async def query_repository_ref(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -245,7 +265,10 @@ async def query_repository_ref(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["ref"]
 
 
@@ -264,6 +287,8 @@ async def query_repository_refs(  # noqa
     direction: graphql_schema.OrderDirection = None,
     order_by: graphql_schema.RefOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Fetch a list of refs from the repository.
@@ -287,6 +312,10 @@ async def query_repository_refs(  # noqa
         order_by: Ordering options for refs returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -319,7 +348,10 @@ async def query_repository_refs(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["refs"]
 
 
@@ -330,6 +362,8 @@ async def query_repository_owner(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The User owner of the repository.
@@ -342,6 +376,10 @@ async def query_repository_owner(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -363,7 +401,10 @@ async def query_repository_owner(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["owner"]
 
 
@@ -386,6 +427,8 @@ async def query_repository_forks(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of direct forked repositories.
@@ -417,6 +460,10 @@ async def query_repository_forks(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -450,7 +497,10 @@ async def query_repository_forks(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["forks"]
 
 
@@ -462,6 +512,8 @@ async def query_repository_issue(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single issue from the current repository by number.
@@ -475,6 +527,10 @@ async def query_repository_issue(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -500,7 +556,10 @@ async def query_repository_issue(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["issue"]
 
 
@@ -512,6 +571,8 @@ async def query_repository_label(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single label by name.
@@ -525,6 +586,10 @@ async def query_repository_label(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -550,7 +615,10 @@ async def query_repository_label(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["label"]
 
 
@@ -569,6 +637,8 @@ async def query_repository_issues(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of issues that have been opened in the repository.
@@ -593,6 +663,10 @@ async def query_repository_issues(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -625,7 +699,10 @@ async def query_repository_issues(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["issues"]
 
 
@@ -642,6 +719,8 @@ async def query_repository_labels(  # noqa
     last: int = None,
     query: str = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of labels associated with the repository.
@@ -663,6 +742,10 @@ async def query_repository_labels(  # noqa
         query: If provided, searches labels by name and description.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -693,7 +776,10 @@ async def query_repository_labels(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["labels"]
 
 
@@ -706,6 +792,8 @@ async def query_repository_object(  # noqa
     oid: datetime = None,
     expression: str = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A Git object in the repository.
@@ -720,6 +808,10 @@ async def query_repository_object(  # noqa
         expression: A Git revision expression suitable for rev-parse.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -746,7 +838,10 @@ async def query_repository_object(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["object"]
 
 
@@ -758,6 +853,8 @@ async def query_repository_project(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find project by number.
@@ -771,6 +868,10 @@ async def query_repository_project(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -796,7 +897,10 @@ async def query_repository_project(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["project"]
 
 
@@ -808,6 +912,8 @@ async def query_repository_release(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Lookup a single release given various criteria.
@@ -821,6 +927,10 @@ async def query_repository_release(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -846,7 +956,10 @@ async def query_repository_release(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["release"]
 
 
@@ -864,6 +977,8 @@ async def query_repository_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -887,6 +1002,10 @@ async def query_repository_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -918,7 +1037,10 @@ async def query_repository_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["projects"]
 
 
@@ -940,6 +1062,8 @@ async def query_repository_packages(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of packages under the owner.
@@ -962,6 +1086,10 @@ async def query_repository_packages(  # noqa
         order_by: Ordering of the returned packages.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -994,7 +1122,10 @@ async def query_repository_packages(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["packages"]
 
 
@@ -1010,6 +1141,8 @@ async def query_repository_releases(  # noqa
     last: int = None,
     order_by: graphql_schema.ReleaseOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of releases which are dependent on this repository.
@@ -1029,6 +1162,10 @@ async def query_repository_releases(  # noqa
         order_by: Order for connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1058,7 +1195,10 @@ async def query_repository_releases(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["releases"]
 
 
@@ -1073,6 +1213,8 @@ async def query_repository_watchers(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users watching the repository.
@@ -1091,6 +1233,10 @@ async def query_repository_watchers(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1119,7 +1265,10 @@ async def query_repository_watchers(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["watchers"]
 
 
@@ -1135,6 +1284,8 @@ async def query_repository_languages(  # noqa
     last: int = None,
     order_by: graphql_schema.LanguageOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list containing a breakdown of the language composition of the repository.
@@ -1154,6 +1305,10 @@ async def query_repository_languages(  # noqa
         order_by: Order for connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1183,7 +1338,10 @@ async def query_repository_languages(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["languages"]
 
 
@@ -1195,6 +1353,8 @@ async def query_repository_milestone(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single milestone from the current repository by number.
@@ -1208,6 +1368,10 @@ async def query_repository_milestone(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1233,7 +1397,10 @@ async def query_repository_milestone(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["milestone"]
 
 
@@ -1245,6 +1412,8 @@ async def query_repository_project_v2(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Finds and returns the Project according to the provided Project number.
@@ -1258,6 +1427,10 @@ async def query_repository_project_v2(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1283,7 +1456,10 @@ async def query_repository_project_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["projectV2"]
 
 
@@ -1299,6 +1475,8 @@ async def query_repository_stargazers(  # noqa
     last: int = None,
     order_by: graphql_schema.StarOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users who have starred this starrable.
@@ -1318,6 +1496,10 @@ async def query_repository_stargazers(  # noqa
         order_by: Order for connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1347,7 +1529,10 @@ async def query_repository_stargazers(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["stargazers"]
 
 
@@ -1362,6 +1547,8 @@ async def query_repository_deploy_keys(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of deploy keys that are on this repository.
@@ -1380,6 +1567,10 @@ async def query_repository_deploy_keys(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1408,7 +1599,10 @@ async def query_repository_deploy_keys(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["deployKeys"]
 
 
@@ -1420,6 +1614,8 @@ async def query_repository_discussion(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single discussion from the current repository by number.
@@ -1433,6 +1629,10 @@ async def query_repository_discussion(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1458,7 +1658,10 @@ async def query_repository_discussion(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["discussion"]
 
 
@@ -1476,6 +1679,8 @@ async def query_repository_milestones(  # noqa
     order_by: graphql_schema.MilestoneOrder = None,
     query: str = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of milestones associated with the repository.
@@ -1497,6 +1702,10 @@ async def query_repository_milestones(  # noqa
         query: Filters milestones with a query on the title.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1528,7 +1737,10 @@ async def query_repository_milestones(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["milestones"]
 
 
@@ -1545,6 +1757,8 @@ async def query_repository_projects_v2(  # noqa
     query: str = None,
     order_by: graphql_schema.ProjectV2Order = {"field": "NUMBER", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of projects linked to this repository.
@@ -1565,6 +1779,10 @@ async def query_repository_projects_v2(  # noqa
         order_by: How to order the returned projects.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1595,7 +1813,10 @@ async def query_repository_projects_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["projectsV2"]
 
 
@@ -1610,6 +1831,8 @@ async def query_repository_submodules(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a list of all submodules in this repository parsed from the .gitmodules
@@ -1629,6 +1852,10 @@ async def query_repository_submodules(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1657,7 +1884,10 @@ async def query_repository_submodules(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["submodules"]
 
 
@@ -1668,6 +1898,8 @@ async def query_repository_license_info(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The license associated with the repository.
@@ -1680,6 +1912,10 @@ async def query_repository_license_info(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1701,7 +1937,10 @@ async def query_repository_license_info(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["licenseInfo"]
 
 
@@ -1721,6 +1960,8 @@ async def query_repository_deployments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Deployments associated with the repository.
@@ -1742,6 +1983,10 @@ async def query_repository_deployments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1772,7 +2017,10 @@ async def query_repository_deployments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["deployments"]
 
 
@@ -1792,6 +2040,8 @@ async def query_repository_discussions(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of discussions that have been opened in the repository.
@@ -1814,6 +2064,10 @@ async def query_repository_discussions(  # noqa
             connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1844,7 +2098,10 @@ async def query_repository_discussions(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["discussions"]
 
 
@@ -1856,6 +2113,8 @@ async def query_repository_environment(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single active environment from the current repository by name.
@@ -1869,6 +2128,10 @@ async def query_repository_environment(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1894,7 +2157,10 @@ async def query_repository_environment(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["environment"]
 
 
@@ -1906,6 +2172,8 @@ async def query_repository_project_next(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Finds and returns the Project (beta) according to the provided Project (beta)
@@ -1920,6 +2188,10 @@ async def query_repository_project_next(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1945,7 +2217,10 @@ async def query_repository_project_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["projectNext"]
 
 
@@ -1957,6 +2232,8 @@ async def query_repository_pull_request(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single pull request from the current repository by number.
@@ -1970,6 +2247,10 @@ async def query_repository_pull_request(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1995,7 +2276,10 @@ async def query_repository_pull_request(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["pullRequest"]
 
 
@@ -2006,6 +2290,8 @@ async def query_repository_contact_links(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a list of contact links associated to the repository.
@@ -2018,6 +2304,10 @@ async def query_repository_contact_links(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2039,7 +2329,10 @@ async def query_repository_contact_links(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["contactLinks"]
 
 
@@ -2054,6 +2347,8 @@ async def query_repository_environments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of environments that are in this repository.
@@ -2072,6 +2367,10 @@ async def query_repository_environments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2100,7 +2399,10 @@ async def query_repository_environments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["environments"]
 
 
@@ -2111,6 +2413,8 @@ async def query_repository_funding_links(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The funding links for this repository.
@@ -2123,6 +2427,10 @@ async def query_repository_funding_links(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2144,7 +2452,10 @@ async def query_repository_funding_links(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["fundingLinks"]
 
 
@@ -2159,6 +2470,8 @@ async def query_repository_pinned_issues(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of pinned issues for this repository.
@@ -2177,6 +2490,10 @@ async def query_repository_pinned_issues(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2205,7 +2522,10 @@ async def query_repository_pinned_issues(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["pinnedIssues"]
 
 
@@ -2222,6 +2542,8 @@ async def query_repository_projects_next(  # noqa
     query: str = None,
     sort_by: graphql_schema.ProjectNextOrderField = "TITLE",
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of projects (beta) linked to this repository.
@@ -2242,6 +2564,10 @@ async def query_repository_projects_next(  # noqa
         sort_by: How to order the returned project (beta) objects.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2272,7 +2598,10 @@ async def query_repository_projects_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["projectsNext"]
 
 
@@ -2292,6 +2621,8 @@ async def query_repository_pull_requests(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of pull requests that have been opened in the repository.
@@ -2319,6 +2650,10 @@ async def query_repository_pull_requests(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2352,7 +2687,10 @@ async def query_repository_pull_requests(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["pullRequests"]
 
 
@@ -2363,6 +2701,8 @@ async def query_repository_code_of_conduct(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns the code of conduct for this repository.
@@ -2375,6 +2715,10 @@ async def query_repository_code_of_conduct(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2396,7 +2740,10 @@ async def query_repository_code_of_conduct(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["codeOfConduct"]
 
 
@@ -2413,6 +2760,8 @@ async def query_repository_collaborators(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of collaborators associated with the repository.
@@ -2434,6 +2783,10 @@ async def query_repository_collaborators(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2464,7 +2817,10 @@ async def query_repository_collaborators(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["collaborators"]
 
 
@@ -2475,6 +2831,8 @@ async def query_repository_latest_release(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Get the latest release for the repository if one exists.
@@ -2487,6 +2845,10 @@ async def query_repository_latest_release(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2508,7 +2870,10 @@ async def query_repository_latest_release(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["latestRelease"]
 
 
@@ -2523,6 +2888,8 @@ async def query_repository_recent_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Recent projects that this user has modified in the context of the owner.
@@ -2541,6 +2908,10 @@ async def query_repository_recent_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2569,7 +2940,10 @@ async def query_repository_recent_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["recentProjects"]
 
 
@@ -2584,6 +2958,8 @@ async def query_repository_commit_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of commit comments associated with the repository.
@@ -2602,6 +2978,10 @@ async def query_repository_commit_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2630,7 +3010,10 @@ async def query_repository_commit_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["commitComments"]
 
 
@@ -2641,6 +3024,8 @@ async def query_repository_issue_templates(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a list of issue templates associated to the repository.
@@ -2653,6 +3038,10 @@ async def query_repository_issue_templates(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2674,7 +3063,10 @@ async def query_repository_issue_templates(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["issueTemplates"]
 
 
@@ -2690,6 +3082,8 @@ async def query_repository_assignable_users(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users that can be assigned to issues in this repository.
@@ -2709,6 +3103,10 @@ async def query_repository_assignable_users(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2738,7 +3136,10 @@ async def query_repository_assignable_users(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["assignableUsers"]
 
 
@@ -2749,6 +3150,8 @@ async def query_repository_primary_language(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The primary language of the repository's code.
@@ -2761,6 +3164,10 @@ async def query_repository_primary_language(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2782,7 +3189,10 @@ async def query_repository_primary_language(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["primaryLanguage"]
 
 
@@ -2793,6 +3203,8 @@ async def query_repository_default_branch_ref(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The Ref associated with the repository's default branch.
@@ -2805,6 +3217,10 @@ async def query_repository_default_branch_ref(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2826,7 +3242,10 @@ async def query_repository_default_branch_ref(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["defaultBranchRef"]
 
 
@@ -2842,6 +3261,8 @@ async def query_repository_mentionable_users(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of Users that can be mentioned in the context of the repository.
@@ -2861,6 +3282,10 @@ async def query_repository_mentionable_users(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2890,7 +3315,10 @@ async def query_repository_mentionable_users(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["mentionableUsers"]
 
 
@@ -2905,6 +3333,8 @@ async def query_repository_repository_topics(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of applied repository-topic associations for this repository.
@@ -2923,6 +3353,10 @@ async def query_repository_repository_topics(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2951,7 +3385,10 @@ async def query_repository_repository_topics(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["repositoryTopics"]
 
 
@@ -2966,6 +3403,8 @@ async def query_repository_pinned_discussions(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of discussions that have been pinned in this repository.
@@ -2984,6 +3423,10 @@ async def query_repository_pinned_discussions(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3012,7 +3455,10 @@ async def query_repository_pinned_discussions(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["pinnedDiscussions"]
 
 
@@ -3024,6 +3470,8 @@ async def query_repository_discussion_category(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A discussion category by slug.
@@ -3038,6 +3486,10 @@ async def query_repository_discussion_category(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3063,7 +3515,10 @@ async def query_repository_discussion_category(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["discussionCategory"]
 
 
@@ -3074,6 +3529,8 @@ async def query_repository_interaction_ability(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The interaction ability settings for this repository.
@@ -3086,6 +3543,10 @@ async def query_repository_interaction_ability(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3107,7 +3568,10 @@ async def query_repository_interaction_ability(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["interactionAbility"]
 
 
@@ -3119,6 +3583,8 @@ async def query_repository_issue_or_pull_request(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a single issue-like object from the current repository by number.
@@ -3132,6 +3598,10 @@ async def query_repository_issue_or_pull_request(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3157,7 +3627,10 @@ async def query_repository_issue_or_pull_request(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["issueOrPullRequest"]
 
 
@@ -3176,6 +3649,8 @@ async def query_repository_vulnerability_alerts(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of vulnerability alerts that are on this repository.
@@ -3198,6 +3673,10 @@ async def query_repository_vulnerability_alerts(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3228,7 +3707,10 @@ async def query_repository_vulnerability_alerts(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["vulnerabilityAlerts"]
 
 
@@ -3244,6 +3726,8 @@ async def query_repository_discussion_categories(  # noqa
     last: int = None,
     filter_by_assignable: bool = False,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of discussion categories that are available in the repository.
@@ -3265,6 +3749,10 @@ async def query_repository_discussion_categories(  # noqa
             are assignable by the viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3294,7 +3782,10 @@ async def query_repository_discussion_categories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["discussionCategories"]
 
 
@@ -3305,6 +3796,8 @@ async def query_repository_pull_request_templates(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Returns a list of pull request templates associated to the repository.
@@ -3317,6 +3810,10 @@ async def query_repository_pull_request_templates(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3338,7 +3835,10 @@ async def query_repository_pull_request_templates(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["pullRequestTemplates"]
 
 
@@ -3353,6 +3853,8 @@ async def query_repository_branch_protection_rules(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of branch protection rules for this repository.
@@ -3373,6 +3875,10 @@ async def query_repository_branch_protection_rules(  # noqa
             list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -3401,5 +3907,8 @@ async def query_repository_branch_protection_rules(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repository"]["branchProtectionRules"]
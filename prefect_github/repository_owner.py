@@ -14,7 +14,12 @@ from prefect import task
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.concurrency import RequestPriority
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _subset_return_fields,
+)
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -29,6 +34,8 @@ async def query_repository_owner(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The query root of GitHub's GraphQL interface.
@@ -38,6 +45,10 @@ async def query_repository_owner(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -54,7 +65,10 @@ async def query_repository_owner(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repositoryOwner"]
 
 
@@ -65,6 +79,8 @@ async def query_repository_owner_repository(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find Repository.
@@ -77,6 +93,10 @@ async def query_repository_owner_repository(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -97,7 +117,10 @@ async def query_repository_owner_repository(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repositoryOwner"]["repository"]
 
 
@@ -119,6 +142,8 @@ async def query_repository_owner_repositories(  # noqa
     last: int = None,
     is_fork: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user owns.
@@ -150,6 +175,10 @@ async def query_repository_owner_repositories(  # noqa
             whether they are forks of another repository.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -178,5 +207,8 @@ async def query_repository_owner_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["repositoryOwner"]["repositories"]
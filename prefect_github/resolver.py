@@ -0,0 +1,339 @@
+"""
+Resolution of human identifiers, e.g. a repository's owner and name or an
+issue's number, to the global node IDs mutations take.
+"""
+
+import collections
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    OrderedDict,
+    Tuple,
+    Union,
+)
+
+from sgqlc.operation import Operation
+
+from prefect_github import GitHubCredentials
+from prefect_github.bulk import MAX_ALIASES_PER_REQUEST, is_missing, request_aliased
+from prefect_github.concurrency import RequestPriority, get_credentials_key
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.schemas import graphql_schema
+
+# How long, in seconds, a resolved node ID is kept; node IDs never change,
+# but renames and transfers can point a name at another object.
+DEFAULT_NODE_ID_TTL = 24 * 60 * 60
+# The most node IDs kept; the least recently used go first.
+DEFAULT_MAX_NODE_IDS = 100_000
+
+
+class RepositoryRef(NamedTuple):
+    """
+    A repository, by its owner and name.
+
+    Attributes:
+        owner: The login of the user or organization owning the repository.
+        name: The name of the repository.
+    """
+
+    owner: str
+    name: str
+
+
+class IssueRef(NamedTuple):
+    """
+    An issue, by its repository and number.
+
+    Attributes:
+        owner: The login of the user or organization owning the repository.
+        name: The name of the repository.
+        number: The number of the issue.
+    """
+
+    owner: str
+    name: str
+    number: int
+
+
+class PullRequestRef(NamedTuple):
+    """
+    A pull request, by its repository and number.
+
+    Attributes:
+        owner: The login of the user or organization owning the repository.
+        name: The name of the repository.
+        number: The number of the pull request.
+    """
+
+    owner: str
+    name: str
+    number: int
+
+
+class UserRef(NamedTuple):
+    """
+    A user, by login.
+
+    Attributes:
+        login: The login of the user.
+    """
+
+    login: str
+
+
+class OrganizationRef(NamedTuple):
+    """
+    An organization, by login.
+
+    Attributes:
+        login: The login of the organization.
+    """
+
+    login: str
+
+
+NodeReference = Union[RepositoryRef, IssueRef, PullRequestRef, UserRef, OrganizationRef]
+NODE_REFERENCE_TYPES = (
+    RepositoryRef,
+    IssueRef,
+    PullRequestRef,
+    UserRef,
+    OrganizationRef,
+)
+
+
+def _select_reference(op: Operation, alias: str, reference: NodeReference):
+    """
+    Selects the `id` of the object a reference points at under an alias.
+    """
+    if isinstance(reference, (UserRef, OrganizationRef)):
+        root = "user" if isinstance(reference, UserRef) else "organization"
+        getattr(op, root)(__alias__=alias, login=reference.login).id()
+        return
+    repository = op.repository(
+        __alias__=alias, owner=reference.owner, name=reference.name
+    )
+    if isinstance(reference, IssueRef):
+        repository.issue(number=reference.number).id()
+    elif isinstance(reference, PullRequestRef):
+        repository.pull_request(number=reference.number).id()
+    else:
+        repository.id()
+
+
+def _get_reference_id(reference: NodeReference, data: Optional[Dict[str, Any]]):
+    """
+    Gets the node ID of the object a reference points at from its result.
+    """
+    if isinstance(reference, IssueRef):
+        data = (data or {}).get("issue")
+    elif isinstance(reference, PullRequestRef):
+        data = (data or {}).get("pullRequest")
+    return (data or {}).get("id")
+
+
+class NodeIdResolver:
+    """
+    Resolves references to node IDs, many per request, and keeps the node IDs
+    it resolved for `ttl` seconds, up to `max_size` of them.
+
+    Attributes:
+        ttl: How long, in seconds, a resolved node ID is kept.
+        max_aliases: The most references resolved per request.
+        max_size: The most node IDs kept; the least recently used are
+            forgotten first.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_NODE_ID_TTL,
+        max_aliases: int = MAX_ALIASES_PER_REQUEST,
+        max_size: int = DEFAULT_MAX_NODE_IDS,
+    ):
+        self.ttl = ttl
+        self.max_aliases = max_aliases
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # ordered from least to most recently used
+        self._cache: OrderedDict[Tuple, Tuple[str, float]] = collections.OrderedDict()
+
+    def clear(self):
+        """
+        Forgets every resolved node ID.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def _get_cached(self, key: Tuple) -> Optional[str]:
+        """
+        Gets a resolved node ID unless it expired.
+        """
+        node_id, expires_at = self._cache.get(key, (None, 0.0))
+        if expires_at <= time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return node_id
+
+    def _set_cached(self, key: Tuple, node_id: str, expires_at: float):
+        """
+        Keeps a resolved node ID, forgetting the least recently used ones
+        beyond `max_size`.
+        """
+        self._cache[key] = (node_id, expires_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def resolve(
+        self,
+        references: Iterable[NodeReference],
+        github_credentials: GitHubCredentials,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> List[Optional[str]]:
+        """
+        Resolves references to node IDs, fetching only those not kept yet.
+
+        Args:
+            references: The references to resolve.
+            github_credentials: Credentials to use for authentication with
+                GitHub.
+            priority: The lane the requests are scheduled in; see
+                `prefect_github.concurrency.RequestPriority`.
+
+        Returns:
+            The node ID of each reference, in order; references to objects
+                that do not exist, or that the credentials cannot see, map to
+                None.
+
+        Raises:
+            GitHubGraphQLError: If GitHub reported other errors.
+        """
+        credentials_key = get_credentials_key(github_credentials)
+        references = list(references)
+        # references of different types may compare equal as tuples
+        keys = [
+            (credentials_key, type(reference).__name__, *reference)
+            for reference in references
+        ]
+        node_ids: Dict[Tuple, Optional[str]] = {}
+        with self._lock:
+            for key in keys:
+                node_id = self._get_cached(key)
+                if node_id is not None:
+                    node_ids[key] = node_id
+        unresolved = list(
+            {
+                key: reference
+                for key, reference in zip(keys, references)
+                if key not in node_ids
+            }.items()
+        )
+
+        for start in range(0, len(unresolved), self.max_aliases):
+            chunk = unresolved[start : start + self.max_aliases]
+            op = Operation(graphql_schema.Query)
+            for index, (_, reference) in enumerate(chunk):
+                _select_reference(op, f"ref{index}", reference)
+            data, errors_by_alias = await request_aliased(
+                op, github_credentials, priority=priority
+            )
+            errors = [
+                error
+                for errors in errors_by_alias.values()
+                if not is_missing(errors)
+                for error in errors
+            ]
+            if errors:
+                raise GitHubGraphQLError(errors)
+            expires_at = time.monotonic() + self.ttl
+            for index, (key, reference) in enumerate(chunk):
+                node_id = _get_reference_id(reference, data.get(f"ref{index}"))
+                node_ids[key] = node_id
+                if node_id is not None:
+                    with self._lock:
+                        self._set_cached(key, node_id, expires_at)
+        return [node_ids[key] for key in keys]
+
+
+_RESOLVER = NodeIdResolver()
+
+
+def get_node_id_resolver() -> NodeIdResolver:
+    """
+    Gets the process-wide resolver the mutation tasks resolve references with.
+
+    Returns:
+        The resolver, whose cache is shared by every task in the process.
+    """
+    return _RESOLVER
+
+
+async def resolve_node_id_arguments(
+    arguments: Iterable[Any],
+    github_credentials: GitHubCredentials,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    placeholders: bool = False,
+) -> List[Any]:
+    """
+    Replaces the references among the node ID arguments of a mutation with
+    the node IDs they point at, resolving all of them at once.
+
+    Args:
+        arguments: The arguments, each a node ID, a reference, a list of node
+            IDs and references, or None.
+        github_credentials: Credentials to use for authentication with GitHub.
+        priority: The lane the requests are scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+        placeholders: Replace the references with placeholders spelling them
+            out, e.g. `RepositoryRef(owner='PrefectHQ', name='prefect')`,
+            without sending any request; used to explain mutations.
+
+    Returns:
+        The arguments, in order, with their references replaced.
+
+    Raises:
+        ValueError: If a reference points at no object.
+    """
+    arguments = list(arguments)
+
+    def is_list(argument: Any) -> bool:
+        return isinstance(argument, (list, tuple, set)) and not isinstance(
+            argument, NODE_REFERENCE_TYPES
+        )
+
+    references = [
+        item
+        for argument in arguments
+        for item in (argument if is_list(argument) else (argument,))
+        if isinstance(item, NODE_REFERENCE_TYPES)
+    ]
+    if not references:
+        return arguments
+
+    if placeholders:
+        node_ids = [repr(reference) for reference in references]
+    else:
+        node_ids = await get_node_id_resolver().resolve(
+            references, github_credentials, priority=priority
+        )
+    missing = [
+        reference for reference, node_id in zip(references, node_ids) if node_id is None
+    ]
+    if missing:
+        raise ValueError(f"Could not resolve {missing} to node IDs.")
+    resolved = iter(node_ids)
+
+    def replace(item: Any) -> Any:
+        return next(resolved) if isinstance(item, NODE_REFERENCE_TYPES) else item
+
+    return [
+        [replace(item) for item in argument] if is_list(argument) else replace(argument)
+        for argument in arguments
+    ]
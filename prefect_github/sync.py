@@ -0,0 +1,232 @@
+"""
+Incremental sync of issues and pull requests, fetching only the nodes updated
+since the watermark of the previous run.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from prefect import task
+
+from prefect_github import GitHubCredentials
+from prefect_github.concurrency import RequestPriority
+from prefect_github.pagination import iterate_connection
+from prefect_github.repository import (
+    query_repository_issues,
+    query_repository_pull_requests,
+)
+from prefect_github.schemas import graphql_schema
+from prefect_github.utils import camel_to_snake_case
+
+# Newest updates first, so that pagination can stop at the watermark.
+UPDATED_AT_DESC = {"field": "UPDATED_AT", "direction": "DESC"}
+
+
+def _parse_timestamp(timestamp: Union[datetime, str]) -> datetime:
+    """
+    Parses a GitHub ISO 8601 timestamp, assuming UTC if it has no offset.
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def _with_updated_at(return_fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    Adds `updated_at` to the requested node fields, which the watermark needs.
+    """
+    if not return_fields:
+        return None  # the scalar node fields include it
+    if isinstance(return_fields, str):
+        return_fields = (return_fields,)
+    return_fields = [camel_to_snake_case(field) for field in return_fields]
+    if "updated_at" not in return_fields:
+        return_fields.append("updated_at")
+    return return_fields
+
+
+async def collect_updated_nodes(
+    nodes: AsyncIterator[Dict[str, Any]],
+    watermark: Optional[Union[datetime, str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Collects the nodes of a connection ordered by `updatedAt` descending until
+    they get older than the watermark.
+
+    Nodes updated exactly at the watermark are collected again, so that none
+    updated within the same second as the last one of the previous run are
+    missed; the sync is at-least-once.
+
+    Args:
+        nodes: The nodes, newest update first, each with an `updatedAt` field.
+        watermark: The `updatedAt` of the newest node of the previous run;
+            every node is collected if unset.
+
+    Returns:
+        The updated nodes and the new watermark, the `updatedAt` of the newest
+            node, or the previous watermark if no node was updated.
+    """
+    since = _parse_timestamp(watermark) if watermark is not None else None
+    updated_nodes = []
+    try:
+        async for node in nodes:
+            if since is not None and _parse_timestamp(node["updatedAt"]) < since:
+                break
+            updated_nodes.append(node)
+    finally:
+        aclose = getattr(nodes, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    if updated_nodes:
+        new_watermark = updated_nodes[0]["updatedAt"]
+    elif isinstance(watermark, datetime):
+        new_watermark = _parse_timestamp(watermark).isoformat()
+    else:
+        new_watermark = watermark
+    return updated_nodes, new_watermark
+
+
+@task
+async def sync_repository_issues(
+    owner: str,
+    name: str,
+    github_credentials: GitHubCredentials,
+    watermark: Optional[Union[datetime, str]] = None,
+    labels: Iterable[str] = None,
+    states: Iterable[graphql_schema.IssueState] = None,
+    use_since_filter: bool = True,
+    first: int = 100,
+    return_fields: Iterable[str] = None,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Any]:
+    """
+    Fetches the issues of a repository updated since the previous sync.
+
+    Args:
+        owner: The login field of a user or organization.
+        name: The name of the repository.
+        github_credentials: Credentials to use for authentication with GitHub.
+        watermark: The watermark returned by the previous sync; every issue is
+            fetched if unset.
+        labels: A list of label names to filter the issues by.
+        states: A list of states to filter the issues by.
+        use_since_filter: Also pass the watermark as `filterBy.since`, so that
+            GitHub filters the issues server-side.
+        first: The number of nodes to request per page.
+        return_fields: Subset the node return fields (as snake_case);
+            `updated_at` is always included.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict with the updated issues, newest first, under `nodes` and the
+            watermark to pass to the next sync under `watermark`.
+
+    Example:
+        Sync the issues updated since the previous flow run.
+        ```python
+        from prefect import flow
+        from prefect.blocks.system import String
+        from prefect_github import GitHubCredentials
+        from prefect_github.sync import sync_repository_issues
+
+        @flow()
+        async def github_sync_issues_flow():
+            github_credentials = await GitHubCredentials.load("github-token")
+            watermark = await String.load("prefect-issues-watermark")
+            result = await sync_repository_issues(
+                "PrefectHQ",
+                "prefect",
+                github_credentials,
+                watermark=watermark.value,
+                return_fields=["number", "title", "state"],
+            )
+            watermark.value = result["watermark"]
+            await watermark.save("prefect-issues-watermark", overwrite=True)
+            return result["nodes"]
+        ```
+    """
+    filter_by = None
+    if use_since_filter and watermark is not None:
+        filter_by = {"since": _parse_timestamp(watermark)}
+
+    nodes = iterate_connection(
+        query_repository_issues,
+        ("repository", "issues"),
+        github_credentials,
+        owner=owner,
+        name=name,
+        labels=labels,
+        states=states,
+        order_by=UPDATED_AT_DESC,
+        filter_by=filter_by,
+        first=first,
+        prefetch=0,
+        return_fields=_with_updated_at(return_fields),
+        priority=priority,
+    )
+    updated_nodes, new_watermark = await collect_updated_nodes(nodes, watermark)
+    return {"nodes": updated_nodes, "watermark": new_watermark}
+
+
+@task
+async def sync_repository_pull_requests(
+    owner: str,
+    name: str,
+    github_credentials: GitHubCredentials,
+    watermark: Optional[Union[datetime, str]] = None,
+    states: Iterable[graphql_schema.PullRequestState] = None,
+    labels: Iterable[str] = None,
+    head_ref_name: str = None,
+    base_ref_name: str = None,
+    first: int = 100,
+    return_fields: Iterable[str] = None,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> Dict[str, Any]:
+    """
+    Fetches the pull requests of a repository updated since the previous sync.
+
+    The pull requests connection has no `since` filter, so pagination stops
+    at the first page reaching past the watermark instead.
+
+    Args:
+        owner: The login field of a user or organization.
+        name: The name of the repository.
+        github_credentials: Credentials to use for authentication with GitHub.
+        watermark: The watermark returned by the previous sync; every pull
+            request is fetched if unset.
+        states: A list of states to filter the pull requests by.
+        labels: A list of label names to filter the pull requests by.
+        head_ref_name: The head ref name to filter the pull requests by.
+        base_ref_name: The base ref name to filter the pull requests by.
+        first: The number of nodes to request per page.
+        return_fields: Subset the node return fields (as snake_case);
+            `updated_at` is always included.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
+
+    Returns:
+        A dict with the updated pull requests, newest first, under `nodes` and
+            the watermark to pass to the next sync under `watermark`.
+    """
+    nodes = iterate_connection(
+        query_repository_pull_requests,
+        ("repository", "pullRequests"),
+        github_credentials,
+        owner=owner,
+        name=name,
+        states=states,
+        labels=labels,
+        head_ref_name=head_ref_name,
+        base_ref_name=base_ref_name,
+        order_by=UPDATED_AT_DESC,
+        first=first,
+        prefetch=0,
+        return_fields=_with_updated_at(return_fields),
+        priority=priority,
+    )
+    updated_nodes, new_watermark = await collect_updated_nodes(nodes, watermark)
+    return {"nodes": updated_nodes, "watermark": new_watermark}
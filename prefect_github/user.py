@@ -15,7 +15,12 @@ from prefect import task
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.concurrency import RequestPriority
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _subset_return_fields,
+)
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -28,6 +33,8 @@ async def query_user(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The query root of GitHub's GraphQL interface.
@@ -37,6 +44,10 @@ async def query_user(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -53,7 +64,10 @@ async def query_user(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]
 
 
@@ -63,6 +77,8 @@ async def query_user_gist(  # noqa
     name: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find gist by repo name.
@@ -73,6 +89,10 @@ async def query_user_gist(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -92,7 +112,10 @@ async def query_user_gist(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["gist"]
 
 
@@ -107,6 +130,8 @@ async def query_user_gists(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of the Gists the user has created.
@@ -124,6 +149,10 @@ async def query_user_gists(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -148,7 +177,10 @@ async def query_user_gists(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["gists"]
 
 
@@ -165,6 +197,8 @@ async def query_user_issues(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of issues associated with this user.
@@ -186,6 +220,10 @@ async def query_user_issues(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -212,7 +250,10 @@ async def query_user_issues(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["issues"]
 
 
@@ -221,6 +262,8 @@ async def query_user_status(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The user's description of what they're currently doing.
@@ -230,6 +273,10 @@ async def query_user_status(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -249,7 +296,10 @@ async def query_user_status(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["status"]
 
 
@@ -259,6 +309,8 @@ async def query_user_project(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find project by number.
@@ -269,6 +321,10 @@ async def query_user_project(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -288,7 +344,10 @@ async def query_user_project(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["project"]
 
 
@@ -308,6 +367,8 @@ async def query_user_packages(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of packages under the owner.
@@ -327,6 +388,10 @@ async def query_user_packages(  # noqa
         order_by: Ordering of the returned packages.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -353,7 +418,10 @@ async def query_user_packages(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["packages"]
 
 
@@ -369,6 +437,8 @@ async def query_user_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -389,6 +459,10 @@ async def query_user_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -414,7 +488,10 @@ async def query_user_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["projects"]
 
 
@@ -429,6 +506,8 @@ async def query_user_sponsors(  # noqa
     tier_id: str = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsors for this user or organization.
@@ -449,6 +528,10 @@ async def query_user_sponsors(  # noqa
             connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -473,7 +556,10 @@ async def query_user_sponsors(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsors"]
 
 
@@ -494,6 +580,8 @@ async def query_user_watching(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories the given user is watching.
@@ -522,6 +610,10 @@ async def query_user_watching(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -549,7 +641,10 @@ async def query_user_watching(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["watching"]
 
 
@@ -559,6 +654,8 @@ async def query_user_project_v2(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by number.
@@ -569,6 +666,10 @@ async def query_user_project_v2(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -588,7 +689,10 @@ async def query_user_project_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["projectV2"]
 
 
@@ -601,6 +705,8 @@ async def query_user_followers(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users the given user is followed by.
@@ -616,6 +722,10 @@ async def query_user_followers(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -638,7 +748,10 @@ async def query_user_followers(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["followers"]
 
 
@@ -651,6 +764,8 @@ async def query_user_following(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users the given user is following.
@@ -666,6 +781,10 @@ async def query_user_following(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -688,7 +807,10 @@ async def query_user_following(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["following"]
 
 
@@ -703,6 +825,8 @@ async def query_user_projects_v2(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -720,6 +844,10 @@ async def query_user_projects_v2(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -744,7 +872,10 @@ async def query_user_projects_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["projectsV2"]
 
 
@@ -755,6 +886,8 @@ async def query_user_repository(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find Repository.
@@ -767,6 +900,10 @@ async def query_user_repository(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -787,7 +924,10 @@ async def query_user_repository(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["repository"]
 
 
@@ -801,6 +941,8 @@ async def query_user_sponsoring(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of users and organizations this entity is sponsoring.
@@ -818,6 +960,10 @@ async def query_user_sponsoring(  # noqa
             returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -841,7 +987,10 @@ async def query_user_sponsoring(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsoring"]
 
 
@@ -854,6 +1003,8 @@ async def query_user_public_keys(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of public keys associated with this user.
@@ -869,6 +1020,10 @@ async def query_user_public_keys(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -891,7 +1046,10 @@ async def query_user_public_keys(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["publicKeys"]
 
 
@@ -901,6 +1059,8 @@ async def query_user_project_next(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by project (beta) number.
@@ -911,6 +1071,10 @@ async def query_user_project_next(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -930,7 +1094,10 @@ async def query_user_project_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["projectNext"]
 
 
@@ -944,6 +1111,8 @@ async def query_user_pinned_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner has pinned to their profile.
@@ -960,6 +1129,10 @@ async def query_user_pinned_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -983,7 +1156,10 @@ async def query_user_pinned_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["pinnedItems"]
 
 
@@ -998,6 +1174,8 @@ async def query_user_projects_next(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects (beta) under the owner.
@@ -1015,6 +1193,10 @@ async def query_user_projects_next(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1039,7 +1221,10 @@ async def query_user_projects_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["projectsNext"]
 
 
@@ -1061,6 +1246,8 @@ async def query_user_repositories(  # noqa
     last: int = None,
     is_fork: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user owns.
@@ -1092,6 +1279,10 @@ async def query_user_repositories(  # noqa
             whether they are forks of another repository.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1120,7 +1311,10 @@ async def query_user_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["repositories"]
 
 
@@ -1129,6 +1323,8 @@ async def query_user_item_showcase(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Showcases a selection of repositories and gists that the profile owner has
@@ -1139,6 +1335,10 @@ async def query_user_item_showcase(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1158,7 +1358,10 @@ async def query_user_item_showcase(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["itemShowcase"]
 
 
@@ -1171,6 +1374,8 @@ async def query_user_gist_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of gist comments made by this user.
@@ -1186,6 +1391,10 @@ async def query_user_gist_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1208,7 +1417,10 @@ async def query_user_gist_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["gistComments"]
 
 
@@ -1218,6 +1430,8 @@ async def query_user_organization(  # noqa
     organization_login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find an organization by its login that the user belongs to.
@@ -1228,6 +1442,10 @@ async def query_user_organization(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1247,7 +1465,10 @@ async def query_user_organization(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["organization"]
 
 
@@ -1265,6 +1486,8 @@ async def query_user_pull_requests(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of pull requests associated with this user.
@@ -1289,6 +1512,10 @@ async def query_user_pull_requests(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1316,7 +1543,10 @@ async def query_user_pull_requests(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["pullRequests"]
 
 
@@ -1333,6 +1563,8 @@ async def query_user_saved_replies(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Replies this user has saved.
@@ -1349,6 +1581,10 @@ async def query_user_saved_replies(  # noqa
         order_by: The field to order saved replies by.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1372,7 +1608,10 @@ async def query_user_saved_replies(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["savedReplies"]
 
 
@@ -1386,6 +1625,8 @@ async def query_user_pinnable_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner can pin to their profile.
@@ -1403,6 +1644,10 @@ async def query_user_pinnable_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1426,7 +1671,10 @@ async def query_user_pinnable_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["pinnableItems"]
 
 
@@ -1440,6 +1688,8 @@ async def query_user_issue_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of issue comments made by this user.
@@ -1457,6 +1707,10 @@ async def query_user_issue_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1480,7 +1734,10 @@ async def query_user_issue_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["issueComments"]
 
 
@@ -1493,6 +1750,8 @@ async def query_user_organizations(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of organizations the user belongs to.
@@ -1508,6 +1767,10 @@ async def query_user_organizations(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1530,7 +1793,10 @@ async def query_user_organizations(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["organizations"]
 
 
@@ -1543,6 +1809,8 @@ async def query_user_recent_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Recent projects that this user has modified in the context of the owner.
@@ -1558,6 +1826,10 @@ async def query_user_recent_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1580,7 +1852,10 @@ async def query_user_recent_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["recentProjects"]
 
 
@@ -1593,6 +1868,8 @@ async def query_user_commit_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of commit comments made by this user.
@@ -1608,6 +1885,10 @@ async def query_user_commit_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1630,7 +1911,10 @@ async def query_user_commit_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["commitComments"]
 
 
@@ -1639,6 +1923,8 @@ async def query_user_sponsors_listing(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The GitHub Sponsors listing for this user or organization.
@@ -1648,6 +1934,10 @@ async def query_user_sponsors_listing(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1667,7 +1957,10 @@ async def query_user_sponsors_listing(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorsListing"]
 
 
@@ -1682,6 +1975,8 @@ async def query_user_top_repositories(  # noqa
     last: int = None,
     since: datetime = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Repositories the user has contributed to, ordered by contribution rank, plus
@@ -1702,6 +1997,10 @@ async def query_user_top_repositories(  # noqa
             repositories.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1726,7 +2025,10 @@ async def query_user_top_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["topRepositories"]
 
 
@@ -1745,6 +2047,8 @@ async def query_user_sponsors_activities(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Events involving this sponsorable, such as new sponsorships.
@@ -1767,6 +2071,10 @@ async def query_user_sponsors_activities(  # noqa
             from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1792,7 +2100,10 @@ async def query_user_sponsors_activities(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorsActivities"]
 
 
@@ -1801,6 +2112,8 @@ async def query_user_interaction_ability(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The interaction ability settings for this user.
@@ -1810,6 +2123,10 @@ async def query_user_interaction_ability(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1829,7 +2146,10 @@ async def query_user_interaction_ability(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["interactionAbility"]
 
 
@@ -1844,6 +2164,8 @@ async def query_user_starred_repositories(  # noqa
     owned_by_viewer: bool = None,
     order_by: graphql_schema.StarOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Repositories the user has starred.
@@ -1863,6 +2185,10 @@ async def query_user_starred_repositories(  # noqa
         order_by: Order for connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1887,7 +2213,10 @@ async def query_user_starred_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["starredRepositories"]
 
 
@@ -1906,6 +2235,8 @@ async def query_user_repository_discussions(  # noqa
     repository_id: str = None,
     answered: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussions this user has started.
@@ -1930,6 +2261,10 @@ async def query_user_repository_discussions(  # noqa
             answered and unanswered discussions.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1955,7 +2290,10 @@ async def query_user_repository_discussions(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["repositoryDiscussions"]
 
 
@@ -1969,6 +2307,8 @@ async def query_user_sponsorships_as_sponsor(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the sponsor.
@@ -1990,6 +2330,10 @@ async def query_user_sponsorships_as_sponsor(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2013,7 +2357,10 @@ async def query_user_sponsorships_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorshipsAsSponsor"]
 
 
@@ -2030,6 +2377,8 @@ async def query_user_sponsorship_newsletters(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsorship updates sent from this sponsorable to sponsors.
@@ -2049,6 +2398,10 @@ async def query_user_sponsorship_newsletters(  # noqa
             updates returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2072,7 +2425,10 @@ async def query_user_sponsorship_newsletters(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorshipNewsletters"]
 
 
@@ -2084,6 +2440,8 @@ async def query_user_contributions_collection(  # noqa
     from_: datetime = None,
     to: datetime = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The collection of contributions this user has made to different repositories.
@@ -2101,6 +2459,10 @@ async def query_user_contributions_collection(  # noqa
             argument.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2122,7 +2484,10 @@ async def query_user_contributions_collection(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["contributionsCollection"]
 
 
@@ -2137,6 +2502,8 @@ async def query_user_sponsorships_as_maintainer(  # noqa
     include_private: bool = False,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the maintainer.
@@ -2160,6 +2527,10 @@ async def query_user_sponsorships_as_maintainer(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2184,7 +2555,10 @@ async def query_user_sponsorships_as_maintainer(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorshipsAsMaintainer"]
 
 
@@ -2202,6 +2576,8 @@ async def query_user_repositories_contributed_to(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user recently contributed to.
@@ -2230,6 +2606,10 @@ async def query_user_repositories_contributed_to(  # noqa
             list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2257,7 +2637,10 @@ async def query_user_repositories_contributed_to(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["repositoriesContributedTo"]
 
 
@@ -2272,6 +2655,8 @@ async def query_user_repository_discussion_comments(  # noqa
     repository_id: str = None,
     only_answers: bool = False,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussion comments this user has authored.
@@ -2293,6 +2678,10 @@ async def query_user_repository_discussion_comments(  # noqa
             to only those that were marked as the answer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2317,7 +2706,10 @@ async def query_user_repository_discussion_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["repositoryDiscussionComments"]
 
 
@@ -2326,6 +2718,8 @@ async def query_user_sponsorship_for_viewer_as_sponsor(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from the viewer to this user/organization; that is, the
@@ -2337,6 +2731,10 @@ async def query_user_sponsorship_for_viewer_as_sponsor(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2356,7 +2754,10 @@ async def query_user_sponsorship_for_viewer_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorshipForViewerAsSponsor"]
 
 
@@ -2365,6 +2766,8 @@ async def query_user_sponsorship_for_viewer_as_sponsorable(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from this user/organization to the viewer; that is, the
@@ -2375,6 +2778,10 @@ async def query_user_sponsorship_for_viewer_as_sponsorable(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2394,5 +2801,8 @@ async def query_user_sponsorship_for_viewer_as_sponsorable(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["user"]["sponsorshipForViewerAsSponsorable"]
@@ -3,8 +3,30 @@
 import json
 import re
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from graphql import (
+    ArgumentNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    NameNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValueNode,
+    VariableNode,
+    Visitor,
+    parse,
+    visit,
+)
+from sgqlc import types as sgqlc_types
+from sgqlc.operation import Operation
+
+from prefect_github.schemas import graphql_schema
 
 SNAKE_CASE_REGEX1 = re.compile("(.)([A-Z][a-z]+)")
 SNAKE_CASE_REGEX2 = re.compile("([a-z0-9])([A-Z])")
@@ -64,3 +86,299 @@ def strip_kwargs(**kwargs: Dict) -> Dict:
         if v is not None:
             stripped_dict[k] = v
     return stripped_dict or {}
+
+
+def parse_graphql_document(op: Union[Operation, str]) -> DocumentNode:
+    """
+    Parses an operation into a GraphQL syntax tree.
+    Args:
+        op: The operation, either as a valid GraphQL string or sgqlc.Operation.
+    Returns:
+        The parsed GraphQL document.
+    """
+    if not isinstance(op, str):
+        op = bytes(op).decode("utf-8")
+    return parse(op)
+
+
+def get_operation_definition(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> OperationDefinitionNode:
+    """
+    Finds the operation to run within a GraphQL document.
+    Args:
+        document: The parsed GraphQL document.
+        operation_name: The name of the operation, required if the document
+            defines several operations.
+    Returns:
+        The definition of the operation.
+    """
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    for operation in operations:
+        if operation_name is None or (
+            operation.name is not None and operation.name.value == operation_name
+        ):
+            return operation
+    raise ValueError(f"Operation {operation_name!r} not found in the document.")
+
+
+def get_root_type(operation: OperationDefinitionNode) -> type:
+    """
+    Gets the schema type at the root of an operation.
+    Args:
+        operation: The definition of the operation.
+    Returns:
+        The `graphql_schema` type that the operation selects from.
+    """
+    if operation.operation.value == "mutation":
+        return graphql_schema.Mutation
+    return graphql_schema.Query
+
+
+def get_named_type(field_type: type) -> type:
+    """
+    Strips the non-null and list wrappers off a `graphql_schema` field type.
+    Args:
+        field_type: The type of a field, e.g. `[Issue]!`.
+    Returns:
+        The underlying named type, e.g. `Issue`.
+    """
+    for base in field_type.__mro__:
+        if not any(char in base.__name__ for char in "[]!"):
+            return base
+    return field_type
+
+
+def get_schema_type(type_name: str) -> Optional[type]:
+    """
+    Looks up a named type of the GitHub GraphQL schema.
+    Args:
+        type_name: The GraphQL name of the type, e.g. `Issue`.
+    Returns:
+        The `graphql_schema` type, or None if the schema does not define it.
+    """
+    schema_type = getattr(graphql_schema, type_name, None)
+    return schema_type if isinstance(schema_type, type) else None
+
+
+@lru_cache(maxsize=None)
+def get_schema_field(container_type: type, field_name: str) -> Optional[Any]:
+    """
+    Looks up a field of a `graphql_schema` type by its GraphQL name.
+    Args:
+        container_type: The type containing the field.
+        field_name: The GraphQL (lowerCamelCase) name of the field.
+    Returns:
+        The sgqlc field, or None if the type has no such field.
+    """
+    try:
+        fields = iter(container_type)
+    except TypeError:
+        return None
+    for field in fields:
+        # unions iterate over their member types rather than fields
+        if getattr(field, "graphql_name", None) == field_name:
+            return field
+    return None
+
+
+def get_scalar_field_names(container_type: type) -> List[str]:
+    """
+    Lists the fields of a `graphql_schema` type that hold scalars or enums and
+    can be selected without arguments.
+    Args:
+        container_type: The object or interface type.
+    Returns:
+        The snake_case names of the fields, in schema order.
+    """
+    try:
+        fields = list(container_type)
+    except TypeError:
+        return []
+    names = []
+    for field in fields:
+        if not hasattr(field, "graphql_name"):  # member type of a union
+            continue
+        field_type = get_named_type(field.type)
+        if not issubclass(field_type, (sgqlc_types.Scalar, sgqlc_types.Enum)):
+            continue
+        if any(
+            str(arg.type).endswith("!") and arg.default is None
+            for arg in (field.args or {}).values()
+        ):
+            continue
+        names.append(field.name)
+    return names
+
+
+def get_fragment_definitions(
+    document: DocumentNode,
+) -> Dict[str, FragmentDefinitionNode]:
+    """
+    Collects the named fragments defined in a GraphQL document.
+    Args:
+        document: The parsed GraphQL document.
+    Returns:
+        The fragment definitions keyed by name.
+    """
+    return {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+
+def find_fields(
+    document: DocumentNode,
+    path: Iterable[str],
+    operation_name: Optional[str] = None,
+) -> List[FieldNode]:
+    """
+    Finds the field nodes selected at a path of an operation, looking through
+    inline fragments and fragment spreads.
+    Args:
+        document: The parsed GraphQL document.
+        path: The response keys (aliases or field names) leading to the field.
+        operation_name: The operation to search if the document has several.
+    Returns:
+        Every field node selected at the path.
+    """
+    fragments = get_fragment_definitions(document)
+    selection_sets = [get_operation_definition(document, operation_name).selection_set]
+    fields = []
+    for key in path:
+        fields = []
+        while selection_sets:
+            selection_set = selection_sets.pop(0)
+            for selection in selection_set.selections:
+                if isinstance(selection, FragmentSpreadNode):
+                    selection_sets.append(fragments[selection.name.value].selection_set)
+                elif isinstance(selection, InlineFragmentNode):
+                    selection_sets.append(selection.selection_set)
+                elif (selection.alias or selection.name).value == key:
+                    fields.append(selection)
+        selection_sets = [
+            field.selection_set for field in fields if field.selection_set is not None
+        ]
+    return fields
+
+
+def set_argument(field: FieldNode, name: str, value: ValueNode):
+    """
+    Sets, or replaces, an argument of a field node in place.
+    Args:
+        field: The field node to modify.
+        name: The name of the argument.
+        value: The value node of the argument.
+    """
+    arguments = [
+        argument for argument in field.arguments or () if argument.name.value != name
+    ]
+    arguments.append(ArgumentNode(name=NameNode(value=name), value=value))
+    field.arguments = tuple(arguments)
+
+
+def remove_argument(field: FieldNode, name: str):
+    """
+    Removes an argument from a field node in place, if present.
+    Args:
+        field: The field node to modify.
+        name: The name of the argument.
+    """
+    field.arguments = tuple(
+        argument for argument in field.arguments or () if argument.name.value != name
+    )
+
+
+def ensure_selected(field: FieldNode, path: Iterable[str]) -> bool:
+    """
+    Makes sure a field node selects a nested field, adding it if needed.
+    Args:
+        field: The field node to modify.
+        path: The names of the nested fields to select, e.g.
+            `("pageInfo", "endCursor")`.
+    Returns:
+        True if any field along the path had to be added.
+    """
+    added = False
+    for name in path:
+        if field.selection_set is None:
+            field.selection_set = SelectionSetNode(selections=())
+        for selection in field.selection_set.selections:
+            if (
+                isinstance(selection, FieldNode)
+                and selection.alias is None
+                and selection.name.value == name
+            ):
+                field = selection
+                break
+        else:
+            selection = FieldNode(
+                name=NameNode(value=name), arguments=(), directives=()
+            )
+            field.selection_set.selections = (
+                *field.selection_set.selections,
+                selection,
+            )
+            field = selection
+            added = True
+    return added
+
+
+def prune_unused_variables(
+    document: DocumentNode, variables: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Removes variable definitions, and values, that no field uses anymore, e.g.
+    after an argument was replaced by a literal; GitHub rejects operations
+    that declare unused variables.
+    Args:
+        document: The parsed GraphQL document, modified in place.
+        variables: The variables the operation is sent with.
+    Returns:
+        The variables that are still used.
+    """
+    used = set()
+
+    class VariableCollector(Visitor):
+        """Collects the names of the variables used as values."""
+
+        def enter_variable_definition(self, node, *args):
+            """Skips the variables being declared."""
+            return self.SKIP
+
+        def enter_variable(self, node: VariableNode, *args):
+            """Records a variable used as a value."""
+            used.add(node.name.value)
+
+    visit(document, VariableCollector())
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            definition.variable_definitions = tuple(
+                variable_definition
+                for variable_definition in definition.variable_definitions or ()
+                if variable_definition.variable.name.value in used
+            )
+    return {name: value for name, value in variables.items() if name in used}
+
+
+def get_path(data: Any, path: Iterable[str]) -> Any:
+    """
+    Follows response keys through nested result dicts.
+    Args:
+        data: The result data.
+        path: The response keys to follow.
+    Returns:
+        The value at the path, or None if a parent along it is null.
+    """
+    for key in path:
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            raise ValueError(f"Cannot follow {key!r} into a list of results.")
+        data = data.get(key)
+    return data
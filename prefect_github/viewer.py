@@ -15,7 +15,12 @@ from prefect import task
 from sgqlc.operation import Operation
 
 from prefect_github import GitHubCredentials
-from prefect_github.graphql import _execute_graphql_op, _subset_return_fields
+from prefect_github.concurrency import RequestPriority
+from prefect_github.graphql import (
+    _execute_graphql_op,
+    _explain_graphql_op,
+    _subset_return_fields,
+)
 from prefect_github.schemas import graphql_schema
 from prefect_github.utils import initialize_return_fields_defaults, strip_kwargs
 
@@ -27,6 +32,8 @@ return_fields_defaults = initialize_return_fields_defaults(config_path)
 async def query_viewer(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The query root of GitHub's GraphQL interface.
@@ -35,6 +42,10 @@ async def query_viewer(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -47,7 +58,10 @@ async def query_viewer(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]
 
 
@@ -56,6 +70,8 @@ async def query_viewer_gist(  # noqa
     name: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find gist by repo name.
@@ -65,6 +81,10 @@ async def query_viewer_gist(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -84,7 +104,10 @@ async def query_viewer_gist(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["gist"]
 
 
@@ -98,6 +121,8 @@ async def query_viewer_gists(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of the Gists the user has created.
@@ -114,6 +139,10 @@ async def query_viewer_gists(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -138,7 +167,10 @@ async def query_viewer_gists(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["gists"]
 
 
@@ -154,6 +186,8 @@ async def query_viewer_issues(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of issues associated with this user.
@@ -174,6 +208,10 @@ async def query_viewer_issues(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -200,7 +238,10 @@ async def query_viewer_issues(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["issues"]
 
 
@@ -208,6 +249,8 @@ async def query_viewer_issues(  # noqa
 async def query_viewer_status(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The user's description of what they're currently doing.
@@ -216,6 +259,10 @@ async def query_viewer_status(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -231,7 +278,10 @@ async def query_viewer_status(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["status"]
 
 
@@ -240,6 +290,8 @@ async def query_viewer_project(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find project by number.
@@ -249,6 +301,10 @@ async def query_viewer_project(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -268,7 +324,10 @@ async def query_viewer_project(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["project"]
 
 
@@ -287,6 +346,8 @@ async def query_viewer_packages(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of packages under the owner.
@@ -305,6 +366,10 @@ async def query_viewer_packages(  # noqa
         order_by: Ordering of the returned packages.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -331,7 +396,10 @@ async def query_viewer_packages(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["packages"]
 
 
@@ -346,6 +414,8 @@ async def query_viewer_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -365,6 +435,10 @@ async def query_viewer_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -390,7 +464,10 @@ async def query_viewer_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["projects"]
 
 
@@ -404,6 +481,8 @@ async def query_viewer_sponsors(  # noqa
     tier_id: str = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsors for this user or organization.
@@ -423,6 +502,10 @@ async def query_viewer_sponsors(  # noqa
             connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -447,7 +530,10 @@ async def query_viewer_sponsors(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsors"]
 
 
@@ -467,6 +553,8 @@ async def query_viewer_watching(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories the given user is watching.
@@ -494,6 +582,10 @@ async def query_viewer_watching(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -521,7 +613,10 @@ async def query_viewer_watching(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["watching"]
 
 
@@ -530,6 +625,8 @@ async def query_viewer_project_v2(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by number.
@@ -539,6 +636,10 @@ async def query_viewer_project_v2(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -558,7 +659,10 @@ async def query_viewer_project_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["projectV2"]
 
 
@@ -570,6 +674,8 @@ async def query_viewer_followers(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users the given user is followed by.
@@ -584,6 +690,10 @@ async def query_viewer_followers(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -606,7 +716,10 @@ async def query_viewer_followers(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["followers"]
 
 
@@ -618,6 +731,8 @@ async def query_viewer_following(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of users the given user is following.
@@ -632,6 +747,10 @@ async def query_viewer_following(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -654,7 +773,10 @@ async def query_viewer_following(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["following"]
 
 
@@ -668,6 +790,8 @@ async def query_viewer_projects_v2(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects under the owner.
@@ -684,6 +808,10 @@ async def query_viewer_projects_v2(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -708,7 +836,10 @@ async def query_viewer_projects_v2(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["projectsV2"]
 
 
@@ -718,6 +849,8 @@ async def query_viewer_repository(  # noqa
     github_credentials: GitHubCredentials,
     follow_renames: bool = True,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find Repository.
@@ -729,6 +862,10 @@ async def query_viewer_repository(  # noqa
             repository referenced by its old name will return an error.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -749,7 +886,10 @@ async def query_viewer_repository(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["repository"]
 
 
@@ -762,6 +902,8 @@ async def query_viewer_sponsoring(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorOrder = {"field": "RELEVANCE", "direction": "DESC"},
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of users and organizations this entity is sponsoring.
@@ -778,6 +920,10 @@ async def query_viewer_sponsoring(  # noqa
             returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -801,7 +947,10 @@ async def query_viewer_sponsoring(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsoring"]
 
 
@@ -813,6 +962,8 @@ async def query_viewer_public_keys(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of public keys associated with this user.
@@ -827,6 +978,10 @@ async def query_viewer_public_keys(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -849,7 +1004,10 @@ async def query_viewer_public_keys(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["publicKeys"]
 
 
@@ -858,6 +1016,8 @@ async def query_viewer_project_next(  # noqa
     number: int,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find a project by project (beta) number.
@@ -867,6 +1027,10 @@ async def query_viewer_project_next(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -886,7 +1050,10 @@ async def query_viewer_project_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["projectNext"]
 
 
@@ -899,6 +1066,8 @@ async def query_viewer_pinned_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner has pinned to their profile.
@@ -914,6 +1083,10 @@ async def query_viewer_pinned_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -937,7 +1110,10 @@ async def query_viewer_pinned_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["pinnedItems"]
 
 
@@ -951,6 +1127,8 @@ async def query_viewer_projects_next(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of projects (beta) under the owner.
@@ -967,6 +1145,10 @@ async def query_viewer_projects_next(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -991,7 +1173,10 @@ async def query_viewer_projects_next(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["projectsNext"]
 
 
@@ -1012,6 +1197,8 @@ async def query_viewer_repositories(  # noqa
     last: int = None,
     is_fork: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user owns.
@@ -1042,6 +1229,10 @@ async def query_viewer_repositories(  # noqa
             whether they are forks of another repository.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1070,7 +1261,10 @@ async def query_viewer_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["repositories"]
 
 
@@ -1078,6 +1272,8 @@ async def query_viewer_repositories(  # noqa
 async def query_viewer_item_showcase(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Showcases a selection of repositories and gists that the profile owner has
@@ -1087,6 +1283,10 @@ async def query_viewer_item_showcase(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1102,7 +1302,10 @@ async def query_viewer_item_showcase(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["itemShowcase"]
 
 
@@ -1114,6 +1317,8 @@ async def query_viewer_gist_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of gist comments made by this user.
@@ -1128,6 +1333,10 @@ async def query_viewer_gist_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1150,7 +1359,10 @@ async def query_viewer_gist_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["gistComments"]
 
 
@@ -1159,6 +1371,8 @@ async def query_viewer_organization(  # noqa
     login: str,
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Find an organization by its login that the user belongs to.
@@ -1168,6 +1382,10 @@ async def query_viewer_organization(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1187,7 +1405,10 @@ async def query_viewer_organization(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["organization"]
 
 
@@ -1204,6 +1425,8 @@ async def query_viewer_pull_requests(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of pull requests associated with this user.
@@ -1227,6 +1450,10 @@ async def query_viewer_pull_requests(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1254,7 +1481,10 @@ async def query_viewer_pull_requests(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["pullRequests"]
 
 
@@ -1270,6 +1500,8 @@ async def query_viewer_saved_replies(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Replies this user has saved.
@@ -1285,6 +1517,10 @@ async def query_viewer_saved_replies(  # noqa
         order_by: The field to order saved replies by.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1308,7 +1544,10 @@ async def query_viewer_saved_replies(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["savedReplies"]
 
 
@@ -1321,6 +1560,8 @@ async def query_viewer_pinnable_items(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories and gists this profile owner can pin to their profile.
@@ -1337,6 +1578,10 @@ async def query_viewer_pinnable_items(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1360,7 +1605,10 @@ async def query_viewer_pinnable_items(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["pinnableItems"]
 
 
@@ -1373,6 +1621,8 @@ async def query_viewer_issue_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of issue comments made by this user.
@@ -1389,6 +1639,10 @@ async def query_viewer_issue_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1412,7 +1666,10 @@ async def query_viewer_issue_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["issueComments"]
 
 
@@ -1424,6 +1681,8 @@ async def query_viewer_organizations(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of organizations the user belongs to.
@@ -1438,6 +1697,10 @@ async def query_viewer_organizations(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1460,7 +1723,10 @@ async def query_viewer_organizations(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["organizations"]
 
 
@@ -1472,6 +1738,8 @@ async def query_viewer_recent_projects(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Recent projects that this user has modified in the context of the owner.
@@ -1486,6 +1754,10 @@ async def query_viewer_recent_projects(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1508,7 +1780,10 @@ async def query_viewer_recent_projects(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["recentProjects"]
 
 
@@ -1520,6 +1795,8 @@ async def query_viewer_commit_comments(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of commit comments made by this user.
@@ -1534,6 +1811,10 @@ async def query_viewer_commit_comments(  # noqa
         last: Returns the last _n_ elements from the list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1556,7 +1837,10 @@ async def query_viewer_commit_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["commitComments"]
 
 
@@ -1564,6 +1848,8 @@ async def query_viewer_commit_comments(  # noqa
 async def query_viewer_sponsors_listing(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The GitHub Sponsors listing for this user or organization.
@@ -1572,6 +1858,10 @@ async def query_viewer_sponsors_listing(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1587,7 +1877,10 @@ async def query_viewer_sponsors_listing(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorsListing"]
 
 
@@ -1601,6 +1894,8 @@ async def query_viewer_top_repositories(  # noqa
     last: int = None,
     since: datetime = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Repositories the user has contributed to, ordered by contribution rank, plus
@@ -1620,6 +1915,10 @@ async def query_viewer_top_repositories(  # noqa
             repositories.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1644,7 +1943,10 @@ async def query_viewer_top_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["topRepositories"]
 
 
@@ -1662,6 +1964,8 @@ async def query_viewer_sponsors_activities(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Events involving this sponsorable, such as new sponsorships.
@@ -1683,6 +1987,10 @@ async def query_viewer_sponsors_activities(  # noqa
             from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1708,7 +2016,10 @@ async def query_viewer_sponsors_activities(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorsActivities"]
 
 
@@ -1716,6 +2027,8 @@ async def query_viewer_sponsors_activities(  # noqa
 async def query_viewer_interaction_ability(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The interaction ability settings for this user.
@@ -1724,6 +2037,10 @@ async def query_viewer_interaction_ability(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1739,7 +2056,10 @@ async def query_viewer_interaction_ability(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["interactionAbility"]
 
 
@@ -1753,6 +2073,8 @@ async def query_viewer_starred_repositories(  # noqa
     owned_by_viewer: bool = None,
     order_by: graphql_schema.StarOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Repositories the user has starred.
@@ -1771,6 +2093,10 @@ async def query_viewer_starred_repositories(  # noqa
         order_by: Order for connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1795,7 +2121,10 @@ async def query_viewer_starred_repositories(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["starredRepositories"]
 
 
@@ -1813,6 +2142,8 @@ async def query_viewer_repository_discussions(  # noqa
     repository_id: str = None,
     answered: bool = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussions this user has started.
@@ -1836,6 +2167,10 @@ async def query_viewer_repository_discussions(  # noqa
             answered and unanswered discussions.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1861,7 +2196,10 @@ async def query_viewer_repository_discussions(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["repositoryDiscussions"]
 
 
@@ -1874,6 +2212,8 @@ async def query_viewer_sponsorships_as_sponsor(  # noqa
     last: int = None,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the sponsor.
@@ -1894,6 +2234,10 @@ async def query_viewer_sponsorships_as_sponsor(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1917,7 +2261,10 @@ async def query_viewer_sponsorships_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorshipsAsSponsor"]
 
 
@@ -1933,6 +2280,8 @@ async def query_viewer_sponsorship_newsletters(  # noqa
         "direction": "DESC",
     },
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     List of sponsorship updates sent from this sponsorable to sponsors.
@@ -1951,6 +2300,10 @@ async def query_viewer_sponsorship_newsletters(  # noqa
             updates returned from the connection.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -1974,7 +2327,10 @@ async def query_viewer_sponsorship_newsletters(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorshipNewsletters"]
 
 
@@ -1985,6 +2341,8 @@ async def query_viewer_contributions_collection(  # noqa
     from_: datetime = None,
     to: datetime = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The collection of contributions this user has made to different repositories.
@@ -2001,6 +2359,10 @@ async def query_viewer_contributions_collection(  # noqa
             argument.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2022,7 +2384,10 @@ async def query_viewer_contributions_collection(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["contributionsCollection"]
 
 
@@ -2036,6 +2401,8 @@ async def query_viewer_sponsorships_as_maintainer(  # noqa
     include_private: bool = False,
     order_by: graphql_schema.SponsorshipOrder = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     This object's sponsorships as the maintainer.
@@ -2058,6 +2425,10 @@ async def query_viewer_sponsorships_as_maintainer(  # noqa
             viewer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2082,7 +2453,10 @@ async def query_viewer_sponsorships_as_maintainer(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorshipsAsMaintainer"]
 
 
@@ -2099,6 +2473,8 @@ async def query_viewer_repositories_contributed_to(  # noqa
     first: int = None,
     last: int = None,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     A list of repositories that the user recently contributed to.
@@ -2126,6 +2502,10 @@ async def query_viewer_repositories_contributed_to(  # noqa
             list.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2153,7 +2533,10 @@ async def query_viewer_repositories_contributed_to(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["repositoriesContributedTo"]
 
 
@@ -2167,6 +2550,8 @@ async def query_viewer_repository_discussion_comments(  # noqa
     repository_id: str = None,
     only_answers: bool = False,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     Discussion comments this user has authored.
@@ -2187,6 +2572,10 @@ async def query_viewer_repository_discussion_comments(  # noqa
             to only those that were marked as the answer.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2211,7 +2600,10 @@ async def query_viewer_repository_discussion_comments(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["repositoryDiscussionComments"]
 
 
@@ -2219,6 +2611,8 @@ async def query_viewer_repository_discussion_comments(  # noqa
 async def query_viewer_sponsorship_for_viewer_as_sponsor(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from the viewer to this user/organization; that is, the
@@ -2229,6 +2623,10 @@ async def query_viewer_sponsorship_for_viewer_as_sponsor(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2246,7 +2644,10 @@ async def query_viewer_sponsorship_for_viewer_as_sponsor(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorshipForViewerAsSponsor"]
 
 
@@ -2254,6 +2655,8 @@ async def query_viewer_sponsorship_for_viewer_as_sponsor(  # noqa
 async def query_viewer_sponsorship_for_viewer_as_sponsorable(  # noqa
     github_credentials: GitHubCredentials,
     return_fields: Iterable[str] = None,
+    explain: bool = False,
+    priority: RequestPriority = RequestPriority.NORMAL,
 ) -> Dict[str, Any]:  # pragma: no cover
     """
     The sponsorship from this user/organization to the viewer; that is, the
@@ -2263,6 +2666,10 @@ async def query_viewer_sponsorship_for_viewer_as_sponsorable(  # noqa
         github_credentials: Credentials to use for authentication with GitHub.
         return_fields: Subset the return fields (as snake_case); defaults to
             fields listed in configs/query/*.json.
+        explain: Return the estimated rate-limit cost and node count of
+            the query instead of executing it.
+        priority: The lane the request is scheduled in; see
+            `prefect_github.concurrency.RequestPriority`.
 
     Returns:
         A dict of the returned fields.
@@ -2280,5 +2687,8 @@ async def query_viewer_sponsorship_for_viewer_as_sponsorable(  # noqa
         op_selection, op_stack, return_fields, return_fields_defaults
     )
 
-    result = await _execute_graphql_op(op, github_credentials)
+    if explain:
+        return _explain_graphql_op(op, return_path=op_stack)
+
+    result = await _execute_graphql_op(op, github_credentials, priority=priority)
     return result["viewer"]["sponsorshipForViewerAsSponsorable"]
@@ -0,0 +1,265 @@
+import asyncio
+
+import pytest
+from graphql import parse
+
+from prefect_github import GitHubCredentials, batching
+from prefect_github.batching import (
+    MutationPacer,
+    QueryBatcher,
+    is_batchable,
+    merge_operations,
+    split_result,
+)
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.graphql import _execute_graphql_op, execute_graphql_mutations
+
+QUERY = """
+query($owner: String!) {
+    repository(owner: $owner, name: "prefect") { ...RepositoryFields }
+}
+fragment RepositoryFields on Repository { name }
+"""
+
+
+class MockCredentials:
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self):
+        return self.client
+
+
+class BatchServer:
+    """
+    Answers every aliased repository field, failing for the `missing` owner.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, query, variables):
+        self.requests.append((query, variables))
+        operation = parse(query).definitions[0]
+        data, errors = {}, []
+        for field in operation.selection_set.selections:
+            key = (field.alias or field.name).value
+            owner = variables[field.arguments[0].value.name.value]
+            if owner == "missing":
+                data[key] = None
+                errors.append({"type": "NOT_FOUND", "path": [key], "message": owner})
+            else:
+                data[key] = {"name": owner}
+        result = {"data": data}
+        if errors:
+            result["errors"] = errors
+        return result
+
+
+def test_is_batchable():
+    assert is_batchable(parse(QUERY))
+    assert not is_batchable(parse("mutation { addStar { clientMutationId } }"))
+    assert not is_batchable(parse("query { ... on Query { viewer { login } } }"))
+
+
+def test_merge_operations_and_split_result():
+    document, variables, aliases = merge_operations(
+        [(parse(QUERY), {"owner": "a"}), (parse(QUERY), {"owner": "b"})]
+    )
+    assert variables == {"batch0_owner": "a", "batch1_owner": "b"}
+    assert aliases == [
+        {"batch0_repository": "repository"},
+        {"batch1_repository": "repository"},
+    ]
+    assert len(document.definitions) == 3
+
+    parts = split_result(
+        {
+            "data": {"batch0_repository": {"name": "a"}, "batch1_repository": None},
+            "errors": [
+                {"path": ["batch1_repository"], "message": "not found"},
+                {"message": "shared"},
+            ],
+        },
+        aliases,
+    )
+    assert parts[0] == ({"repository": {"name": "a"}}, [{"message": "shared"}])
+    assert parts[1][1][0]["path"] == ["repository"]
+
+
+async def test_execute_graphql_op_batches_concurrent_queries(monkeypatch):
+    server = BatchServer()
+    monkeypatch.setattr(GitHubCredentials, "get_client", lambda self: server)
+    github_credentials = GitHubCredentials(token="batch", query_batch_window=0.05)
+
+    results = await asyncio.gather(
+        *(
+            _execute_graphql_op(QUERY, github_credentials, owner=owner)
+            for owner in ("a", "b", "c")
+        ),
+        return_exceptions=True,
+    )
+    assert results == [{"repository": {"name": owner}} for owner in "abc"]
+    assert len(server.requests) == 1
+
+
+async def test_execute_graphql_op_routes_batch_errors(monkeypatch):
+    server = BatchServer()
+    monkeypatch.setattr(GitHubCredentials, "get_client", lambda self: server)
+    github_credentials = GitHubCredentials(token="errors", query_batch_window=0.05)
+
+    found, missing = await asyncio.gather(
+        _execute_graphql_op(QUERY, github_credentials, owner="a"),
+        _execute_graphql_op(QUERY, github_credentials, owner="missing"),
+        return_exceptions=True,
+    )
+    assert found == {"repository": {"name": "a"}}
+    assert isinstance(missing, GitHubGraphQLError)
+    assert missing.has_error_type("NOT_FOUND")
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize("max_operations, expected_requests", [(2, 2), (10, 1)])
+async def test_query_batcher_ceiling(max_operations, expected_requests):
+    server = BatchServer()
+    batcher = QueryBatcher(window=0.05, max_operations=max_operations)
+
+    async def send(query, variables, priority):
+        return server(query, variables)
+
+    results = await asyncio.gather(
+        *(
+            batcher.submit(parse(QUERY), {"owner": owner}, send)
+            for owner in ("a", "b", "c")
+        )
+    )
+    assert [result["repository"]["name"] for result in results] == ["a", "b", "c"]
+    assert len(server.requests) == expected_requests
+
+
+async def test_query_batcher_send_failure_fails_every_query():
+    batcher = QueryBatcher(window=0.05)
+
+    async def send(query, variables, priority):
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(batcher.submit(parse(QUERY), {"owner": owner}, send) for owner in "ab"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_mutation_pacer_delay():
+    pacer = MutationPacer(per_minute=3, interval=1.0)
+    assert pacer._get_delay(2, 0.0) <= 0
+    pacer._sent.extend([0.0, 0.0])
+    pacer._last_sent = 0.0
+    # too soon after the previous request
+    assert pacer._get_delay(1, 0.5) == 0.5
+    # over the per-minute limit until the first mutations leave the window
+    assert pacer._get_delay(2, 5.0) == 55.0
+    assert pacer._get_delay(2, 60.0) <= 0
+
+
+class MutationServer:
+    """
+    Answers aliased addStar mutations, failing for the `missing` starrable.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, query, variables):
+        self.requests.append((query, variables))
+        operation = parse(query).definitions[0]
+        data, errors = {}, []
+        for field in operation.selection_set.selections:
+            key = field.alias.value
+            starrable_id = variables[
+                field.arguments[0].value.fields[0].value.name.value
+            ]
+            if starrable_id == "missing":
+                data[key] = None
+                errors.append({"type": "NOT_FOUND", "path": [key, "starrable"]})
+            else:
+                data[key] = {"starrable": {"id": starrable_id}}
+        result = {"data": data}
+        if errors:
+            result["errors"] = errors
+        return result
+
+
+async def test_execute_graphql_mutations(monkeypatch):
+    server = MutationServer()
+    monkeypatch.setitem(batching._PACERS, "default", MutationPacer(interval=0))
+    mutation = """
+        mutation($id: ID!) {
+            addStar(input: {starrableId: $id}) { starrable { id } }
+        }
+    """
+    ops = [(mutation, {"id": starrable_id}) for starrable_id in ("a", "missing", "c")]
+    results = await execute_graphql_mutations.fn(
+        ops, MockCredentials(server), mutations_per_request=2
+    )
+    assert results[0] == {"data": {"addStar": {"starrable": {"id": "a"}}}, "errors": []}
+    assert results[1]["data"] == {"addStar": None}
+    assert results[1]["errors"][0]["path"] == ["addStar", "starrable"]
+    assert results[2]["data"] == {"addStar": {"starrable": {"id": "c"}}}
+    assert len(server.requests) == 2
+    assert "batch1_addStar: addStar(" in server.requests[0][0]
+
+
+async def test_execute_graphql_mutations_rejects_queries():
+    with pytest.raises(ValueError, match="single mutation"):
+        await execute_graphql_mutations.fn([QUERY], MockCredentials(BatchServer()))
+
+
+async def test_query_batcher_leader_cancelled_during_window():
+    server = BatchServer()
+    batcher = QueryBatcher(window=10)
+
+    async def send(query, variables, priority):
+        return server(query, variables)
+
+    leader = asyncio.ensure_future(batcher.submit(parse(QUERY), {"owner": "a"}, send))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(batcher.submit(parse(QUERY), {"owner": "b"}, send))
+    await asyncio.sleep(0)
+    leader.cancel()
+    result = await asyncio.wait_for(follower, 1)
+    assert result == {"repository": {"name": "b"}}
+    assert leader.cancelled()
+    # the follower is sent without the cancelled query
+    assert len(server.requests) == 1
+    assert "batch" not in server.requests[0][0]
+
+    # later queries start a new batch rather than joining the abandoned one
+    batcher.window = 0.01
+    result = await batcher.submit(parse(QUERY), {"owner": "c"}, send)
+    assert result == {"repository": {"name": "c"}}
+
+
+async def test_query_batcher_leader_cancelled_while_sending():
+    server = BatchServer()
+    batcher = QueryBatcher(window=0.01)
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def send(query, variables, priority):
+        if not sent.is_set():
+            sent.set()
+            await release.wait()
+        return server(query, variables)
+
+    leader = asyncio.ensure_future(batcher.submit(parse(QUERY), {"owner": "a"}, send))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(batcher.submit(parse(QUERY), {"owner": "b"}, send))
+    await asyncio.wait_for(sent.wait(), 1)
+    leader.cancel()
+    # the follower gets its own result rather than the leader's cancellation
+    result = await asyncio.wait_for(follower, 1)
+    assert result == {"repository": {"name": "b"}}
+    assert leader.cancelled()
+    assert len(server.requests) == 1
+    assert "batch" not in server.requests[0][0]
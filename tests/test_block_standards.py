@@ -1,10 +1,23 @@
 import pytest
 from prefect.testing.standard_test_suites import BlockStandardTestSuite
 
-from prefect_github import GitHubCredentials, GitHubRepository
+from prefect_github import (
+    GitHubAppCredentials,
+    GitHubCredentials,
+    GitHubCredentialsPool,
+    GitHubRepository,
+)
 
 
-@pytest.mark.parametrize("block", [GitHubRepository, GitHubCredentials])
+@pytest.mark.parametrize(
+    "block",
+    [
+        GitHubRepository,
+        GitHubCredentials,
+        GitHubCredentialsPool,
+        GitHubAppCredentials,
+    ],
+)
 class TestAllBlocksAdhereToStandards(BlockStandardTestSuite):
     @pytest.fixture
     def block(self, block):
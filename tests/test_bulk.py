@@ -0,0 +1,282 @@
+import pytest
+from graphql import parse, value_from_ast_untyped
+
+from prefect_github import bulk
+from prefect_github.bulk import (
+    chunk_by_cost,
+    clear_login_memo,
+    query_nodes,
+    query_organizations,
+    query_repositories,
+    query_repository_files,
+    query_users,
+)
+from prefect_github.cost import estimate_query_cost
+from prefect_github.exceptions import GitHubGraphQLError
+
+
+class AliasCredentials:
+    """
+    Credentials whose client answers every aliased root field through
+    `resolve`, given its name, arguments and selections, which returns its
+    data or raises a dict of its error, along with its partial data.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            self.queries.append(str(op))
+            operation = parse(str(op)).definitions[0]
+            data, errors = {}, []
+            for field in operation.selection_set.selections:
+                key = (field.alias or field.name).value
+                arguments = {
+                    argument.name.value: value_from_ast_untyped(argument.value)
+                    for argument in field.arguments
+                }
+                selections = ()
+                if field.selection_set is not None:
+                    selections = field.selection_set.selections
+                try:
+                    data[key] = self.resolve(field.name.value, arguments, selections)
+                except LookupError as exc:
+                    data[key] = exc.args[1] if len(exc.args) > 1 else None
+                    errors.append(dict(exc.args[0], path=[key]))
+            result = {"data": data}
+            if errors:
+                result["errors"] = errors
+            return result
+
+        return client
+
+
+def resolve_repository(field, arguments, selections):
+    if arguments["name"] == "missing":
+        raise LookupError({"type": "NOT_FOUND", "message": "Could not resolve"})
+    if arguments["name"] == "forbidden":
+        raise LookupError({"type": "FORBIDDEN", "message": "SAML enforcement"})
+    return {"nameWithOwner": f"{arguments['owner']}/{arguments['name']}"}
+
+
+def test_chunk_by_cost():
+    cost = estimate_query_cost(
+        "query { viewer { repositories(first: 100) "
+        "{ nodes { issues(first: 100) { nodes { id } } } } } }"
+    )
+    assert chunk_by_cost(range(5), lambda item: cost, max_aliases=2) == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    # each item costs one point
+    assert chunk_by_cost(range(5), lambda item: cost, max_points=3) == [
+        [0, 1, 2],
+        [3, 4],
+    ]
+
+
+async def test_query_repositories():
+    github_credentials = AliasCredentials(resolve_repository)
+    repositories = [("PrefectHQ", f"repository-{index}") for index in range(5)]
+    repositories += [("PrefectHQ", "missing"), ("PrefectHQ", "repository-0")]
+    result = await query_repositories.fn(
+        repositories,
+        github_credentials,
+        return_fields=["name_with_owner"],
+        max_aliases=2,
+    )
+    assert result[("PrefectHQ", "missing")] is None
+    assert result[("PrefectHQ", "repository-3")] == {
+        "nameWithOwner": "PrefectHQ/repository-3"
+    }
+    assert len(result) == 6
+    assert len(github_credentials.queries) == 3
+    assert "repository1: repository(" in github_credentials.queries[0]
+
+
+async def test_query_repositories_raises_other_errors():
+    github_credentials = AliasCredentials(resolve_repository)
+    with pytest.raises(GitHubGraphQLError, match="SAML"):
+        await query_repositories.fn(
+            [("PrefectHQ", "prefect"), ("PrefectHQ", "forbidden")],
+            github_credentials,
+            return_fields=["name_with_owner"],
+        )
+
+
+def resolve_nodes(field, arguments, selections):
+    nodes = []
+    for node_id in arguments["ids"]:
+        if node_id.startswith("I_"):
+            nodes.append({"__typename": "Issue", "id": node_id, "title": node_id})
+        elif node_id.startswith("U_"):
+            nodes.append({"__typename": "User", "id": node_id})
+        else:
+            nodes.append(None)
+    if None in nodes:
+        error = {"type": "NOT_FOUND", "message": "Could not resolve"}
+        raise LookupError(error, nodes)
+    return nodes
+
+
+async def test_query_nodes():
+    github_credentials = AliasCredentials(resolve_nodes)
+    ids = [f"I_{index}" for index in range(150)] + ["U_1", "I_0"]
+    result = await query_nodes.fn(
+        ids, github_credentials, return_fields={"Issue": ["title"]}
+    )
+    assert len(result) == 151
+    assert result["I_149"] == {"__typename": "Issue", "id": "I_149", "title": "I_149"}
+    assert result["U_1"] == {"__typename": "User", "id": "U_1"}
+    assert len(github_credentials.queries) == 2
+    assert "... on Issue {\n      title" in github_credentials.queries[0]
+
+
+async def test_query_nodes_reports_missing_nodes():
+    github_credentials = AliasCredentials(resolve_nodes)
+    result = await query_nodes.fn(["I_1", "gone"], github_credentials)
+    assert result["I_1"]["id"] == "I_1"
+    assert result["gone"] is None
+
+
+async def test_query_nodes_rejects_non_node_types():
+    with pytest.raises(ValueError, match="not a node type"):
+        await query_nodes.fn(
+            ["I_1"], AliasCredentials(resolve_nodes), {"PageInfo": None}
+        )
+
+
+@pytest.fixture
+def login_memo():
+    clear_login_memo()
+    yield
+    clear_login_memo()
+
+
+def resolve_login(field, arguments, selections):
+    if arguments["login"].lower() == "ghost":
+        raise LookupError({"type": "NOT_FOUND", "message": "Could not resolve"})
+    return {"login": arguments["login"].lower(), "root": field}
+
+
+async def test_query_users_deduplicates_and_memoizes(login_memo):
+    github_credentials = AliasCredentials(resolve_login)
+    result = await query_users.fn(
+        ["octocat", "OctoCat", "ghost", "hubot"],
+        github_credentials,
+        return_fields=["login"],
+    )
+    assert (
+        result["OctoCat"] == result["octocat"] == {"login": "octocat", "root": "user"}
+    )
+    assert result["ghost"] is None
+    assert len(github_credentials.queries) == 1
+    assert github_credentials.queries[0].count("login:") == 3
+
+    result = await query_users.fn(
+        ["hubot", "ghost", "monalisa"], github_credentials, return_fields=["login"]
+    )
+    assert result["monalisa"] == {"login": "monalisa", "root": "user"}
+    assert len(github_credentials.queries) == 2
+    assert github_credentials.queries[1].count("login:") == 1
+
+    # the memo is kept apart per root field and return fields
+    result = await query_organizations.fn(
+        ["hubot"], github_credentials, return_fields=["login"]
+    )
+    assert result["hubot"]["root"] == "organization"
+    assert len(github_credentials.queries) == 3
+
+
+async def test_query_users_memo_expires(login_memo, monkeypatch):
+    monkeypatch.setattr(bulk, "LOGIN_MEMO_TTL", 0)
+    github_credentials = AliasCredentials(resolve_login)
+    for _ in range(2):
+        await query_users.fn(["octocat"], github_credentials, return_fields=["login"])
+    assert len(github_credentials.queries) == 2
+
+
+async def test_query_users_memo_forgets_least_recently_used(login_memo, monkeypatch):
+    monkeypatch.setattr(bulk, "MAX_LOGIN_MEMO_SIZE", 2)
+    github_credentials = AliasCredentials(resolve_login)
+    for logins in (["octocat", "hubot"], ["octocat"], ["monalisa"]):
+        await query_users.fn(logins, github_credentials, return_fields=["login"])
+    assert len(bulk._LOGIN_MEMO) == 2
+
+    # hubot was used least recently, so it is fetched again
+    await query_users.fn(["octocat", "hubot"], github_credentials, ["login"])
+    assert len(github_credentials.queries) == 3
+    assert github_credentials.queries[-1].count("login:") == 1
+
+
+BLOBS = {
+    ("PrefectHQ/prefect", "HEAD:pyproject.toml"): {
+        "text": "[project]",
+        "byteSize": 9,
+        "isBinary": False,
+        "isTruncated": False,
+    },
+    ("PrefectHQ/prefect", "HEAD:logo.png"): {
+        "text": None,
+        "byteSize": 2048,
+        "isBinary": True,
+        "isTruncated": False,
+    },
+    ("PrefectHQ/prefect-github", "HEAD:README.md"): {
+        "text": "# prefect-github",
+        "byteSize": 16,
+        "isBinary": False,
+        "isTruncated": False,
+    },
+}
+
+
+def resolve_files(field, arguments, selections):
+    repository = f"{arguments['owner']}/{arguments['name']}"
+    if arguments["name"] == "missing":
+        raise LookupError({"type": "NOT_FOUND", "message": "Could not resolve"})
+    data = {}
+    for selection in selections:
+        expression = selection.arguments[0].value.value
+        blob = BLOBS.get((repository, expression))
+        if expression.endswith("/"):
+            data[selection.alias.value] = {"__typename": "Tree"}
+        elif blob is not None:
+            data[selection.alias.value] = dict(blob, __typename="Blob")
+        else:
+            data[selection.alias.value] = None
+    return data
+
+
+async def test_query_repository_files():
+    github_credentials = AliasCredentials(resolve_files)
+    files = list(BLOBS) + [
+        ("PrefectHQ/prefect", "HEAD:gone.txt"),
+        ("PrefectHQ/prefect", "HEAD:docs/"),
+        ("PrefectHQ/missing", "HEAD:README.md"),
+    ]
+    result = await query_repository_files.fn(
+        files, github_credentials, max_bytes=10, max_aliases=4
+    )
+    assert result["files"] == {
+        ("PrefectHQ/prefect", "HEAD:pyproject.toml"): {
+            "text": "[project]",
+            "byteSize": 9,
+        }
+    }
+    assert result["binary"] == [("PrefectHQ/prefect", "HEAD:logo.png")]
+    assert result["oversized"] == [("PrefectHQ/prefect-github", "HEAD:README.md")]
+    assert sorted(result["missing"]) == sorted(files[3:])
+    assert len(github_credentials.queries) == 2
+    # the files of a repository share its root field
+    assert github_credentials.queries[0].count("repository(") == 2
+
+
+async def test_query_repository_files_rejects_bad_repositories():
+    with pytest.raises(ValueError, match="owner/name"):
+        await query_repository_files.fn(
+            [("prefect", "HEAD:README.md")], AliasCredentials(resolve_files)
+        )
@@ -0,0 +1,37 @@
+import pytest
+
+from prefect_github.checkpoints import (
+    BlockCheckpointStore,
+    Checkpoint,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    get_checkpoint_key,
+)
+
+
+@pytest.fixture(params=["file", "sqlite", "block"])
+def store(request, tmp_path):
+    if request.param == "file":
+        yield FileCheckpointStore(tmp_path / "checkpoints.json")
+    elif request.param == "block":
+        yield BlockCheckpointStore(prefix=f"test-{tmp_path.name}")
+    else:
+        store = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+        yield store
+        store.close()
+
+
+async def test_store_round_trip(store):
+    assert await store.load("export") is None
+    await store.save("export", Checkpoint("20", 2, 20, 1.5))
+    await store.save("other", Checkpoint(None, 0, 0))
+    assert await store.load("export") == Checkpoint("20", 2, 20, 1.5)
+    await store.delete("export")
+    assert await store.load("export") is None
+    assert await store.load("other") == Checkpoint(None, 0, 0)
+
+
+def test_get_checkpoint_key():
+    key = get_checkpoint_key("query { viewer { login } }", ("viewer",))
+    assert key == get_checkpoint_key("query { viewer { login } }", ["viewer"])
+    assert key != get_checkpoint_key("query { viewer { login } }", ("user",))
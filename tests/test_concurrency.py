@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+import pytest
+
+from prefect_github import GitHubCredentials, rate_limit
+from prefect_github.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    RequestPriority,
+    get_concurrency_limiter,
+    is_overloaded,
+    wait_for_rate_limit_budget,
+)
+from prefect_github.rate_limit import RateLimitFeedback, record_token_feedback
+
+
+@pytest.mark.parametrize(
+    "result, overloaded",
+    [
+        ({"data": {}}, False),
+        ({"errors": [{"type": "NOT_FOUND", "message": "Not found"}]}, False),
+        ({"errors": [{"type": "RATE_LIMITED", "message": "API rate limit"}]}, True),
+        ({"errors": [{"message": "Something went wrong", "status": 502}]}, True),
+        ({"errors": [{"message": "timeout"}]}, True),
+        (
+            {
+                "errors": [
+                    {"message": "403", "status": 403, "headers": {"Retry-After": "1"}}
+                ]
+            },
+            True,
+        ),
+    ],
+)
+def test_is_overloaded(result, overloaded):
+    assert is_overloaded(result) is overloaded
+
+
+async def test_limiter_increases_additively():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    for _ in range(2):
+        await limiter.acquire()
+        limiter.release(time.monotonic())
+    assert limiter.limit == 2
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(time.monotonic())
+    assert limiter.limit == 3
+    for _ in range(100):
+        await limiter.acquire()
+        limiter.release(time.monotonic())
+    assert limiter.limit == 4
+
+
+async def test_limiter_does_not_increase_when_slow():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_threshold=1)
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release(time.monotonic() - 2)
+    assert limiter.limit == 2
+
+
+async def test_limiter_decreases_once_per_window():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    started_at = time.monotonic()
+    for _ in range(4):
+        await limiter.acquire()
+    for _ in range(4):
+        limiter.release(started_at, overloaded=True)
+    assert limiter.limit == 8
+    await limiter.acquire()
+    limiter.release(time.monotonic(), overloaded=True)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_caps_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(time.monotonic())
+
+    await asyncio.gather(*(request() for _ in range(10)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_cancelled_waiter_frees_nothing():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release(time.monotonic())
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), 1)
+
+
+def test_get_concurrency_limiter_is_shared_per_token():
+    limiter = get_concurrency_limiter(
+        GitHubCredentials(token="a", max_concurrent_requests=8)
+    )
+    assert limiter is get_concurrency_limiter(
+        GitHubCredentials(token="a", max_concurrent_requests=8)
+    )
+    assert limiter is not get_concurrency_limiter(
+        GitHubCredentials(token="b", max_concurrent_requests=8)
+    )
+
+
+def test_get_concurrency_limiter_starts_at_max_concurrent_requests():
+    limiter = get_concurrency_limiter(
+        GitHubCredentials(token="c", max_concurrent_requests=3)
+    )
+    assert limiter.limit == 3
+
+
+def test_get_concurrency_limiter_disabled_by_default():
+    assert get_concurrency_limiter(GitHubCredentials(token="a")) is None
+
+
+async def test_limiter_grants_high_priority_first():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    order = []
+
+    async def request(priority):
+        await limiter.acquire(priority)
+        order.append(priority)
+        limiter.release(time.monotonic())
+
+    waiters = [
+        asyncio.ensure_future(request(priority))
+        for priority in ("low", "normal", "high", "normal")
+    ]
+    await asyncio.sleep(0)
+    limiter.release(time.monotonic())
+    await asyncio.gather(*waiters)
+    assert order == ["high", "normal", "normal", "low"]
+
+
+async def test_limiter_reserves_slots_from_low_priority():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    assert limiter.get_limit(RequestPriority.LOW) == 3
+    for _ in range(3):
+        await limiter.acquire(RequestPriority.LOW)
+    low = asyncio.ensure_future(limiter.acquire(RequestPriority.LOW))
+    await asyncio.sleep(0)
+    assert not low.done()
+    await asyncio.wait_for(limiter.acquire(RequestPriority.HIGH), 1)
+    assert limiter.in_flight == 4
+    limiter.release(time.monotonic())
+    limiter.release(time.monotonic())
+    await asyncio.wait_for(low, 1)
+    assert limiter.in_flight == 3
+
+
+@pytest.fixture
+def fresh_budgets(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_TOKEN_BUDGETS", {})
+
+
+async def test_wait_for_rate_limit_budget_holds_back_low_priority(fresh_budgets):
+    feedback = RateLimitFeedback(
+        status=200,
+        limit=5000,
+        remaining=100,
+        reset_at=time.time() + 0.2,
+        retry_after=None,
+        scopes=None,
+        throttled=False,
+    )
+    record_token_feedback("token", feedback)
+
+    started_at = time.monotonic()
+    await wait_for_rate_limit_budget(["token"], RequestPriority.HIGH)
+    await wait_for_rate_limit_budget(["token"], RequestPriority.NORMAL)
+    assert time.monotonic() - started_at < 0.1
+    await wait_for_rate_limit_budget(["token"], RequestPriority.LOW)
+    assert time.monotonic() - started_at >= 0.1
+
+
+async def test_wait_for_rate_limit_budget_within_budget(fresh_budgets):
+    started_at = time.monotonic()
+    await wait_for_rate_limit_budget(["token"], "low")
+    assert time.monotonic() - started_at < 0.1
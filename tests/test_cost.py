@@ -0,0 +1,105 @@
+import pytest
+from sgqlc.operation import Operation
+
+from prefect_github.cost import MAX_NODE_LIMIT, estimate_query_cost
+from prefect_github.schemas import graphql_schema
+
+
+def test_estimate_query_cost_without_connections():
+    op = Operation(graphql_schema.Query)
+    op.repository(owner="PrefectHQ", name="prefect").__fields__("id")
+    cost = estimate_query_cost(op)
+    assert cost.points == 1
+    assert cost.node_count == 0
+    assert cost.connections == []
+
+
+def test_estimate_query_cost_multiplies_nested_connections():
+    op = Operation(graphql_schema.Query)
+    issues = op.repository(owner="PrefectHQ", name="prefect").issues(first=100)
+    issues.nodes().comments(first=50).nodes().__fields__("body")
+    issues.nodes().labels(last=10).nodes().__fields__("name")
+    cost = estimate_query_cost(op)
+    assert [
+        (connection.path, connection.page_size, connection.parent_count)
+        for connection in cost.connections
+    ] == [
+        ("repository.issues", 100, 1),
+        ("repository.issues.nodes.comments", 50, 100),
+        ("repository.issues.nodes.labels", 10, 100),
+    ]
+    assert cost.node_count == 100 + 5000 + 1000
+    assert cost.points == 2
+
+
+def test_estimate_query_cost_matches_github_example():
+    # example from GitHub's documentation on calculating rate limit scores
+    op = """
+        query {
+          viewer {
+            login
+            repositories(first: 100) {
+              edges {
+                node {
+                  id
+                  issues(first: 50) {
+                    edges {
+                      node {
+                        id
+                        labels(first: 60) {
+                          edges {
+                            node {
+                              id
+                              name
+                            }
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+    cost = estimate_query_cost(op)
+    assert cost.node_count == 100 + 5000 + 300000
+    assert cost.points == 51
+    assert not cost.exceeds_node_limit
+
+
+def test_estimate_query_cost_resolves_variables_and_fragments():
+    op = """
+        query Issues($owner: String!, $size: Int = 20) {
+          repository(owner: $owner, name: "prefect") {
+            issueOrPullRequest(number: 1) {
+              ... on Issue { ...IssueComments }
+            }
+            pullRequests(first: $size) { totalCount }
+          }
+        }
+        fragment IssueComments on Issue {
+          comments(first: 30) { nodes { body } }
+        }
+    """
+    cost = estimate_query_cost(op, owner="PrefectHQ")
+    assert cost.node_count == 30 + 20
+    assert estimate_query_cost(op, owner="PrefectHQ", size=100).node_count == 130
+
+
+def test_estimate_query_cost_assumes_full_page_without_boundaries():
+    cost = estimate_query_cost("query { viewer { repositories { totalCount } } }")
+    assert cost.connections[0].page_size == 100
+
+
+@pytest.mark.parametrize("size, exceeds", [(70, False), (80, True)])
+def test_estimate_query_cost_node_limit(size, exceeds):
+    op = Operation(graphql_schema.Query)
+    repositories = op.viewer().repositories(first=size)
+    issues = repositories.nodes().issues(first=size)
+    issues.nodes().comments(first=size).nodes().__fields__("id")
+    cost = estimate_query_cost(op)
+    assert cost.exceeds_node_limit is exceeds
+    assert cost.to_dict()["exceeds_node_limit"] is exceeds
+    assert (cost.node_count > MAX_NODE_LIMIT) is exceeds
@@ -1,7 +1,23 @@
+import base64
+import json
+import threading
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from sgqlc.endpoint.http import HTTPEndpoint
 
-from prefect_github import GitHubCredentials
+import prefect_github
+from prefect_github import (
+    GitHubAppCredentials,
+    GitHubCredentials,
+    GitHubCredentialsPool,
+)
+from prefect_github.graphql import _execute_graphql_op, execute_graphql
 
 
 @pytest.mark.parametrize("token", [None, "token_value"])
@@ -18,3 +34,295 @@ def test_github_credentials_get_client(token):
     assert isinstance(endpoint, HTTPEndpoint)
     if token is not None:
         assert endpoint.base_headers == {"Authorization": "Bearer token_value"}
+
+
+class MockEndpoint:
+    def __init__(self, url, base_headers=None):
+        self.token = base_headers["Authorization"].split()[-1]
+        self.responses = RESPONSES.setdefault(self.token, [])
+        CALLS.setdefault(self.token, 0)
+
+    def __call__(self, query, **kwargs):
+        CALLS[self.token] += 1
+        return self.responses.pop(0)
+
+
+RESPONSES = {}
+CALLS = {}
+
+
+def ok_response(remaining, scopes="repo"):
+    headers = {"X-RateLimit-Remaining": str(remaining), "X-OAuth-Scopes": scopes}
+    return {"data": {"viewer": {"login": "marvin"}}, "headers": headers}
+
+
+def throttled_response():
+    headers = {"Retry-After": "60", "X-RateLimit-Remaining": "10"}
+    return {
+        "data": None,
+        "errors": [{"message": "HTTP Error 403", "status": 403, "headers": headers}],
+    }
+
+
+@pytest.fixture
+def mock_pool_endpoints(monkeypatch):
+    monkeypatch.setattr(prefect_github.credentials, "HTTPEndpoint", MockEndpoint)
+    monkeypatch.setattr(prefect_github.rate_limit, "_TOKEN_BUDGETS", {})
+    RESPONSES.clear()
+    CALLS.clear()
+
+
+def test_github_credentials_pool_requires_tokens():
+    with pytest.raises(ValueError, match="does not contain any tokens"):
+        GitHubCredentialsPool().get_client()
+
+
+def test_github_credentials_pool_uses_least_loaded_token(mock_pool_endpoints):
+    RESPONSES["a"] = [ok_response(100), ok_response(99)]
+    RESPONSES["b"] = [ok_response(4000), ok_response(3999)]
+    client = GitHubCredentialsPool(token="a", tokens=["b"]).get_client()
+    client("query")  # both tokens start out with an assumed full budget
+    client("query")
+    client("query")
+    assert CALLS == {"a": 1, "b": 2}
+
+
+def test_github_credentials_pool_rotates_throttled_token_out(mock_pool_endpoints):
+    RESPONSES["a"] = [throttled_response()]
+    RESPONSES["b"] = [ok_response(50), ok_response(49), ok_response(48)]
+    client = GitHubCredentialsPool(tokens=["a", "b"]).get_client()
+    result = client("query")
+    assert result["data"] == {"viewer": {"login": "marvin"}}
+    client("query")
+    client("query")
+    assert CALLS == {"a": 1, "b": 3}
+
+
+def test_github_credentials_pool_respects_scopes(mock_pool_endpoints):
+    RESPONSES["a"] = [ok_response(4000, scopes="read:org")]
+    RESPONSES["b"] = [ok_response(10, scopes="repo, read:org")] * 2
+    pool = GitHubCredentialsPool(tokens=["a", "b"])
+    pool.get_client()("query")
+    pool.get_client()("query")
+    pool.get_client(scopes=["public_repo"])("query")
+    assert CALLS == {"a": 1, "b": 2}
+    with pytest.raises(ValueError, match="required scopes"):
+        pool.get_client(scopes=["admin:org"])("query")
+
+
+async def test_github_credentials_pool_required_scopes_apply_to_tasks(
+    mock_pool_endpoints,
+):
+    RESPONSES["a"] = [ok_response(4000, scopes="read:org")]
+    RESPONSES["b"] = [ok_response(10, scopes="repo, read:org")] * 2
+    pool = GitHubCredentialsPool(tokens=["a", "b"], required_scopes=["repo"])
+    for _ in range(3):
+        result = await execute_graphql.fn("query { viewer { login } }", pool)
+        assert result == {"viewer": {"login": "marvin"}}
+    assert CALLS == {"a": 1, "b": 2}
+
+
+@pytest.fixture(scope="module")
+def app_private_key():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return key, pem.decode("utf-8")
+
+
+@pytest.fixture
+def token_server(app_private_key):
+    """
+    Local stand-in for GitHub's installation token endpoint.
+    """
+    public_key = app_private_key[0].public_key()
+    minted = []
+    lifetime = {"seconds": 3600}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            app_jwt = self.headers["Authorization"].split()[-1]
+            signing_input, signature = app_jwt.rsplit(".", 1)
+            public_key.verify(
+                base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4)),
+                signing_input.encode("ascii"),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
+            assert self.path == "/app/installations/42/access_tokens"
+            minted.append(f"ghs_{len(minted)}")
+            expires_at = datetime.now(timezone.utc) + timedelta(
+                seconds=lifetime["seconds"]
+            )
+            body = json.dumps(
+                {"token": minted[-1], "expires_at": expires_at.isoformat()}
+            ).encode("utf-8")
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", minted, lifetime
+    server.shutdown()
+    prefect_github.credentials._INSTALLATION_TOKENS.clear()
+
+
+def test_github_app_credentials_caches_installation_token(
+    token_server, app_private_key
+):
+    api_url, minted, _ = token_server
+    credentials = GitHubAppCredentials(
+        app_id="1234",
+        installation_id=42,
+        private_key=app_private_key[1],
+        api_url=api_url,
+    )
+    client = credentials.get_client()
+    assert isinstance(client, HTTPEndpoint)
+    assert client.url == f"{api_url}/graphql"
+    assert client.base_headers == {"Authorization": "Bearer ghs_0"}
+    assert credentials.get_installation_token() == "ghs_0"
+    assert minted == ["ghs_0"]
+
+
+def test_github_app_credentials_refreshes_when_used(
+    token_server, app_private_key, monkeypatch
+):
+    api_url, minted, lifetime = token_server
+    credentials = GitHubAppCredentials(
+        app_id="1234",
+        installation_id=42,
+        private_key=app_private_key[1],
+        api_url=api_url,
+    )
+    assert credentials.get_installation_token() == "ghs_0"
+    # the cached token now expires within the margin, so it is still used
+    # while its replacement is minted in the background
+    monkeypatch.setattr(
+        prefect_github.credentials, "INSTALLATION_TOKEN_REFRESH_MARGIN", 3600
+    )
+    assert credentials.get_installation_token() == "ghs_0"
+    refresh = prefect_github.credentials._INSTALLATION_TOKEN_REFRESHES.get(
+        credentials._get_cache_key()
+    )
+    assert refresh is not None and refresh is not threading.current_thread()
+    refresh.join(timeout=5)
+    assert minted == ["ghs_0", "ghs_1"]
+    monkeypatch.setattr(
+        prefect_github.credentials, "INSTALLATION_TOKEN_REFRESH_MARGIN", 300
+    )
+    assert credentials.get_installation_token() == "ghs_1"
+    assert minted == ["ghs_0", "ghs_1"]
+
+
+def test_github_app_credentials_refreshes_once_in_the_background(monkeypatch):
+    minting, release = threading.Event(), threading.Event()
+    minted = []
+
+    def mint(self):
+        minting.set()
+        release.wait(timeout=5)
+        minted.append(threading.current_thread())
+        return prefect_github.credentials._InstallationToken(
+            "ghs_1", time.time() + 3600
+        )
+
+    monkeypatch.setattr(GitHubAppCredentials, "_mint_installation_token", mint)
+    credentials = GitHubAppCredentials(
+        app_id="1234", installation_id=44, private_key="unused"
+    )
+    key = credentials._get_cache_key()
+    tokens = prefect_github.credentials._INSTALLATION_TOKENS
+    tokens[key] = prefect_github.credentials._InstallationToken(
+        "ghs_0", time.time() + 60
+    )
+    try:
+        assert credentials.get_installation_token() == "ghs_0"
+        assert minting.wait(timeout=5)
+        assert credentials.get_installation_token() == "ghs_0"
+        refresh = prefect_github.credentials._INSTALLATION_TOKEN_REFRESHES[key]
+        release.set()
+        refresh.join(timeout=5)
+        assert credentials.get_installation_token() == "ghs_1"
+        assert minted == [refresh]
+    finally:
+        release.set()
+        tokens.clear()
+
+
+def test_github_app_credentials_mints_expired_tokens_in_the_open(monkeypatch):
+    monkeypatch.setattr(
+        GitHubAppCredentials,
+        "_mint_installation_token",
+        lambda self: prefect_github.credentials._InstallationToken(
+            "ghs_1", time.time() + 3600
+        ),
+    )
+    credentials = GitHubAppCredentials(
+        app_id="1234", installation_id=45, private_key="unused"
+    )
+    tokens = prefect_github.credentials._INSTALLATION_TOKENS
+    tokens[
+        credentials._get_cache_key()
+    ] = prefect_github.credentials._InstallationToken("ghs_0", time.time() - 1)
+    try:
+        assert credentials.get_installation_token() == "ghs_1"
+    finally:
+        tokens.clear()
+
+
+def test_github_app_credentials_has_no_token_field():
+    assert "token" not in GitHubAppCredentials.__fields__
+    assert "query_batch_window" in GitHubAppCredentials.__fields__
+
+
+async def test_github_app_credentials_mint_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def mint(self):
+        threads.append(threading.current_thread())
+        return prefect_github.credentials._InstallationToken(
+            "ghs_0", time.time() + 3600
+        )
+
+    monkeypatch.setattr(GitHubAppCredentials, "_mint_installation_token", mint)
+    monkeypatch.setattr(
+        prefect_github.credentials,
+        "HTTPEndpoint",
+        lambda url, base_headers: lambda op, vars: {"data": {"viewer": None}},
+    )
+    credentials = GitHubAppCredentials(
+        app_id="1234", installation_id=43, private_key="unused"
+    )
+    try:
+        assert await _execute_graphql_op("query { viewer { login } }", credentials) == {
+            "viewer": None
+        }
+    finally:
+        prefect_github.credentials._INSTALLATION_TOKENS.clear()
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_github_app_credentials_mint_times_out(app_private_key, monkeypatch):
+    timeouts = []
+
+    def urlopen(request, timeout=None):
+        timeouts.append(timeout)
+        raise TimeoutError("timed out")
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+    credentials = GitHubAppCredentials(
+        app_id="1234", installation_id=46, private_key=app_private_key[1]
+    )
+    with pytest.raises(TimeoutError):
+        credentials.get_installation_token()
+    assert timeouts == [prefect_github.credentials.INSTALLATION_TOKEN_TIMEOUT]
@@ -2,7 +2,13 @@ import pytest
 from prefect import flow
 from sgqlc.operation import Operation, Selector
 
+from prefect_github import GitHubCredentials, rate_limit
 from prefect_github.graphql import _subset_return_fields, execute_graphql
+from prefect_github.mutations import (
+    add_comment_subject,
+    close_pull_request,
+    request_reviews,
+)
 from prefect_github.schemas import graphql_schema
 
 
@@ -49,3 +55,129 @@ def test_execute_graphql(error_key):
             test_flow()
     else:
         assert test_flow() == "success"
+
+
+def test_execute_graphql_explain():
+    mock_credentials = MockCredentials(error_key="errors")
+    op = "query { viewer { repositories(first: 10) { nodes { id } } } }"
+
+    @flow
+    def test_flow():
+        return execute_graphql(op, mock_credentials, explain=True)
+
+    explanation = test_flow()
+    assert explanation["node_count"] == 10
+    assert explanation["points"] == 1
+    assert explanation["query"] == op
+
+
+def test_execute_graphql_records_token_budget(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_TOKEN_BUDGETS", {})
+    github_credentials = GitHubCredentials(token="token")
+    result = {
+        "data": "success",
+        "headers": {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "42"},
+    }
+    monkeypatch.setattr(
+        GitHubCredentials, "get_client", lambda self: lambda op, vars: result
+    )
+
+    @flow
+    def test_flow():
+        return execute_graphql("op", github_credentials, priority="high")
+
+    assert test_flow() == "success"
+    budget = rate_limit.get_token_budget(github_credentials._get_budget_key())
+    assert budget.remaining == 42
+
+
+def test_execute_graphql_hydrate():
+    class HydratingCredentials:
+        queries = []
+
+        def get_client(self):
+            def client(op, variables):
+                self.queries.append(op)
+                if "hydrate0" in op:
+                    issues = {
+                        "pageInfo": {"hasNextPage": False, "endCursor": "2"},
+                        "nodes": [{"title": "second"}],
+                    }
+                    return {"data": {"hydrate0": {"issues": issues}}}
+                issues = {
+                    "pageInfo": {"hasNextPage": True, "endCursor": "1"},
+                    "nodes": [{"title": "first"}],
+                }
+                repositories = {"nodes": [{"id": "R1", "issues": issues}]}
+                return {"data": {"viewer": {"repositories": repositories}}}
+
+            return client
+
+    op = "query { viewer { repositories(first: 1) { nodes { issues(first: 1) { nodes { title } } } } } }"  # noqa
+
+    @flow
+    def test_flow():
+        return execute_graphql(op, HydratingCredentials(), hydrate=True)
+
+    result = test_flow()
+    repository = result["viewer"]["repositories"]["nodes"][0]
+    assert [issue["title"] for issue in repository["issues"]["nodes"]] == [
+        "first",
+        "second",
+    ]
+    assert len(HydratingCredentials.queries) == 2
+    assert "id" in HydratingCredentials.queries[0]
+    assert '... on Repository {\n      issues(first: 100, after: "1")' in (
+        HydratingCredentials.queries[1]
+    )
+
+
+async def test_mutation_lean():
+    class LeanCredentials:
+        queries = []
+
+        def get_client(self):
+            def client(op, variables):
+                self.queries.append(str(op))
+                payload = {"clientMutationId": None, "pullRequest": {"id": "PR1"}}
+                return {"data": {"closePullRequest": payload}}
+
+            return client
+
+    result = await close_pull_request.fn(
+        "PR1", LeanCredentials(), return_fields=["title"], lean=True
+    )
+    assert result == {"clientMutationId": None, "id": "PR1"}
+    query = " ".join(LeanCredentials.queries[0].split())
+    assert "{ pullRequest { id } clientMutationId }" in query
+
+    # a task returning the payload selects the ID of the node in it
+    explanation = await request_reviews.fn(
+        "PR1", ["U1"], [], LeanCredentials(), explain=True, lean=True
+    )
+    query = " ".join(explanation["query"].split())
+    assert "{ clientMutationId pullRequest { id } }" in query
+
+
+async def test_add_comment_lean_returns_the_comment():
+    class CommentCredentials:
+        queries = []
+
+        def get_client(self):
+            def client(op, variables):
+                self.queries.append(str(op))
+                payload = {
+                    "clientMutationId": None,
+                    "commentEdge": {"node": {"id": "IC1"}},
+                }
+                return {"data": {"addComment": payload}}
+
+            return client
+
+    result = await add_comment_subject.fn(
+        "I1", "Thanks!", CommentCredentials(), lean=True
+    )
+    assert result == {"clientMutationId": None, "id": "IC1"}
+    query = " ".join(CommentCredentials.queries[0].split())
+    assert "{ commentEdge { node { id } } clientMutationId }" in query
+    assert "subject {" not in query
@@ -0,0 +1,139 @@
+from graphql import parse, print_ast, value_from_ast_untyped
+
+from prefect_github.hydration import (
+    build_hydration_query,
+    find_pending_connections,
+    hydrate_connections,
+    prepare_hydration,
+)
+
+QUERY = """
+query($owner: String!) {
+    repository(owner: $owner, name: "prefect") {
+        issues(first: 2) {
+            nodes {
+                number
+                comments(first: 2) {
+                    nodes { body }
+                }
+                labels(first: 1) {
+                    nodes { ...LabelFields }
+                }
+            }
+        }
+    }
+}
+fragment LabelFields on Label { name }
+"""
+
+COMMENTS = {"I1": [f"comment {index}" for index in range(5)], "I2": ["only"]}
+LABELS = {"I1": [], "I2": ["bug", "docs", "good first issue"]}
+
+
+def get_page(items, first, after, key):
+    start = int(after or 0)
+    end = min(start + first, len(items))
+    return {
+        "pageInfo": {"hasNextPage": end < len(items), "endCursor": str(end)},
+        "nodes": [{key: item} for item in items[start:end]],
+    }
+
+
+class HydrationServer:
+    """
+    Answers the hydration queries for the comments and labels of two issues.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    async def send(self, query, variables):
+        self.queries.append(query)
+        operation = parse(query).definitions[0]
+        data = {}
+        for selection in operation.selection_set.selections:
+            node_id = selection.arguments[0].value.value
+            field = selection.selection_set.selections[0].selection_set.selections[0]
+            arguments = {
+                argument.name.value: value_from_ast_untyped(argument.value)
+                for argument in field.arguments
+            }
+            if field.name.value == "comments":
+                items, key = COMMENTS[node_id], "body"
+            else:
+                items, key = LABELS[node_id], "name"
+            data[selection.alias.value] = {
+                field.name.value: get_page(
+                    items, arguments["first"], arguments.get("after"), key
+                )
+            }
+        return data
+
+
+def get_first_response():
+    return {
+        "repository": {
+            "issues": {
+                "nodes": [
+                    {
+                        "number": number,
+                        "id": node_id,
+                        "comments": get_page(COMMENTS[node_id], 2, None, "body"),
+                        "labels": get_page(LABELS[node_id], 1, None, "name"),
+                    }
+                    for number, node_id in ((1, "I1"), (2, "I2"))
+                ]
+            }
+        }
+    }
+
+
+def test_prepare_hydration_selects_page_info_and_ids():
+    query = print_ast(prepare_hydration(parse(QUERY)))
+    assert (
+        query.count("pageInfo {\n            hasNextPage\n            endCursor") == 2
+    )
+    assert "number\n" in query and "id\n" in query
+    # the outer connection is left alone
+    assert "issues(first: 2) {\n      nodes" in query
+
+
+def test_find_pending_connections():
+    document = prepare_hydration(parse(QUERY))
+    pending = find_pending_connections(document, get_first_response())
+    assert [
+        (item.parent_id, item.parent_type, item.field.name.value) for item in pending
+    ] == [
+        ("I1", "Issue", "comments"),
+        ("I2", "Issue", "labels"),
+    ]
+
+
+def test_build_hydration_query():
+    document = prepare_hydration(parse(QUERY))
+    pending = find_pending_connections(document, get_first_response())
+    query = print_ast(build_hydration_query(document, pending, page_size=50))
+    assert 'hydrate0: node(id: "I1") {\n    ... on Issue {\n      comments(' in query
+    assert 'comments(first: 50, after: "2")' in query
+    assert 'hydrate1: node(id: "I2")' in query
+    assert "fragment LabelFields on Label" in query
+    assert "$owner" not in query
+
+
+async def test_hydrate_connections():
+    document = prepare_hydration(parse(QUERY))
+    server = HydrationServer()
+    data = await hydrate_connections(
+        document,
+        get_first_response(),
+        server.send,
+        {"owner": "PrefectHQ"},
+        parents_per_request=1,
+        page_size=2,
+    )
+    issues = data["repository"]["issues"]["nodes"]
+    assert [node["body"] for node in issues[0]["comments"]["nodes"]] == COMMENTS["I1"]
+    assert [node["name"] for node in issues[1]["labels"]["nodes"]] == LABELS["I2"]
+    assert not issues[0]["comments"]["pageInfo"]["hasNextPage"]
+    # two rounds: one request per parent, then only the comments of I1 remain
+    assert len(server.queries) == 3
@@ -0,0 +1,174 @@
+import re
+
+import pytest
+from graphql import parse, value_from_ast_untyped
+
+from prefect_github import batching, issues
+from prefect_github.batching import MutationPacer
+from prefect_github.issues import _CREATED_KEYS, create_issues, get_idempotency_key
+from prefect_github.resolver import UserRef, get_node_id_resolver
+
+
+class IssueServer:
+    """
+    Credentials whose client resolves repositories and users, searches the
+    issues it created by body, and creates issues unless titled "fail", failing
+    the whole request if one is titled "outage".
+    """
+
+    def __init__(self, bodies=()):
+        self.bodies = list(bodies)
+        self.created = []
+        self.queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            self.queries.append(str(op))
+            operation = parse(str(op)).definitions[0]
+            if '"outage"' in str(op):
+                return {"data": None, "errors": [{"message": "Bad gateway"}]}
+            data, errors = {}, []
+            for field in operation.selection_set.selections:
+                alias = field.alias.value
+                arguments = {
+                    argument.name.value: value_from_ast_untyped(argument.value)
+                    for argument in field.arguments
+                }
+                if field.name.value == "search":
+                    key = re.search(r'"(.*)"', arguments["query"]).group(1)
+                    count = sum(key in body for body in self.bodies)
+                    data[alias] = {"issueCount": count}
+                elif field.name.value == "createIssue":
+                    issue = arguments["input"]
+                    if issue["title"] == "fail":
+                        data[alias] = None
+                        errors.append({"message": "Nope", "path": [alias]})
+                        continue
+                    self.bodies.append(issue["body"])
+                    self.created.append(issue)
+                    number = len(self.created)
+                    data[alias] = {"issue": {"id": f"issue:{number}", "number": number}}
+                else:
+                    login = arguments.get("login") or arguments.get("name")
+                    data[alias] = {"id": f"{field.name.value}:{login}"}
+            result = {"data": data}
+            if errors:
+                result["errors"] = errors
+            return result
+
+        return client
+
+
+@pytest.fixture(autouse=True)
+def clear_state(monkeypatch):
+    monkeypatch.setitem(batching._PACERS, "default", MutationPacer(interval=0))
+    get_node_id_resolver().clear()
+    _CREATED_KEYS.clear()
+    yield
+    get_node_id_resolver().clear()
+    _CREATED_KEYS.clear()
+
+
+def test_get_idempotency_key():
+    spec = {"repository": "PrefectHQ/prefect", "title": "Bug", "body": "Details"}
+    key = get_idempotency_key(spec)
+    assert key == get_idempotency_key(dict(spec))
+    assert key != get_idempotency_key(dict(spec, title="Other bug"))
+    assert get_idempotency_key(dict(spec, idempotency_key="finding-1")) == "finding-1"
+
+
+@pytest.mark.parametrize("key", ['a" OR "b', "key -->", "x" * 129])
+def test_get_idempotency_key_rejects_unsafe_keys(key):
+    spec = {"repository": "PrefectHQ/prefect", "title": "Bug"}
+    with pytest.raises(ValueError, match="Invalid idempotency key"):
+        get_idempotency_key(dict(spec, idempotency_key=key))
+
+
+async def test_create_issues():
+    github_credentials = IssueServer()
+    specs = [
+        {
+            "repository": "PrefectHQ/prefect",
+            "title": f"Issue {index}",
+            "assignee_ids": [UserRef("octocat")],
+        }
+        for index in range(5)
+    ]
+    report = await create_issues.fn(specs, github_credentials, batch_size=2)
+    assert report == {"created": 5, "skipped": 0, "failed": 0, "errors": []}
+    issue = github_credentials.created[0]
+    assert issue["repositoryId"] == "repository:prefect"
+    assert issue["assigneeIds"] == ["user:octocat"]
+    assert "prefect-github-idempotency-key" in issue["body"]
+    # a search and a mutation request for each of 3 batches, and a single
+    # resolution since the node IDs are cached
+    assert len(github_credentials.queries) == 7
+
+
+async def test_create_issues_skips_existing():
+    github_credentials = IssueServer()
+    spec = {"repository": "PrefectHQ/prefect", "title": "Bug", "body": "Details"}
+    report = await create_issues.fn([spec, dict(spec)], github_credentials)
+    assert report["created"] == 1
+    assert report["skipped"] == 1
+
+    # created earlier in the process
+    report = await create_issues.fn([spec], github_credentials)
+    assert report["skipped"] == 1
+
+    # found by search, e.g. after a restart
+    _CREATED_KEYS.clear()
+    report = await create_issues.fn([spec], github_credentials)
+    assert report["skipped"] == 1
+    assert len(github_credentials.created) == 1
+
+
+async def test_create_issues_from_async_iterable_reports_failures():
+    github_credentials = IssueServer()
+
+    async def specs():
+        for title in ("Bug", "fail"):
+            yield {"repository": "PrefectHQ/prefect", "title": title}
+
+    report = await create_issues.fn(specs(), github_credentials)
+    assert report["created"] == 1
+    assert report["failed"] == 1
+    assert report["errors"][0]["spec"]["title"] == "fail"
+    assert report["errors"][0]["errors"][0]["message"] == "Nope"
+
+
+async def test_create_issues_reports_failed_requests():
+    github_credentials = IssueServer()
+    specs = [
+        {"repository": "PrefectHQ/prefect", "title": title}
+        for title in ("Bug", "outage", "Other bug")
+    ]
+    report = await create_issues.fn(specs, github_credentials, batch_size=2)
+    assert report["created"] == 1
+    assert report["failed"] == 2
+    assert [error["spec"]["title"] for error in report["errors"]] == ["Bug", "outage"]
+    assert report["errors"][0]["errors"] == [{"message": "Bad gateway"}]
+
+
+async def test_create_issues_bounds_created_keys(monkeypatch):
+    monkeypatch.setattr(issues, "MAX_CREATED_KEYS", 2)
+    github_credentials = IssueServer()
+    specs = [
+        {"repository": "PrefectHQ/prefect", "title": f"Issue {index}"}
+        for index in range(3)
+    ]
+    await create_issues.fn(specs, github_credentials)
+    assert list(_CREATED_KEYS) == [
+        ("PrefectHQ/prefect", get_idempotency_key(spec)) for spec in specs[1:]
+    ]
+
+
+async def test_create_issues_forgets_created_keys(monkeypatch):
+    monkeypatch.setattr(issues, "CREATED_KEYS_TTL", 0)
+    github_credentials = IssueServer()
+    spec = {"repository": "PrefectHQ/prefect", "title": "Bug"}
+    await create_issues.fn([spec], github_credentials)
+    # no longer remembered, and only found by search
+    github_credentials.bodies.clear()
+    report = await create_issues.fn([spec], github_credentials)
+    assert report["created"] == 1
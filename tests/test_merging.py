@@ -0,0 +1,116 @@
+import pytest
+from graphql import parse
+
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.merging import query_merged
+from prefect_github.repository import (
+    query_repository,
+    query_repository_default_branch_ref,
+    query_repository_languages,
+)
+from prefect_github.user import query_user
+
+
+class RootCredentials:
+    """
+    Credentials whose client answers every field under the root object with
+    a string naming the field and the root arguments, failing the fields in
+    `failing`, the whole root object for the `missing` owner, and the whole
+    request for the `invalid` owner.
+    """
+
+    def __init__(self, failing=()):
+        self.failing = failing
+        self.queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            self.queries.append(str(op))
+            root = parse(str(op)).definitions[0].selection_set.selections[0]
+            owner = root.arguments[0].value.value
+            if owner == "invalid":
+                return {"errors": [{"message": "Parse error"}]}
+            if owner == "missing":
+                error = {"type": "NOT_FOUND", "path": [root.name.value]}
+                return {"data": {root.name.value: None}, "errors": [error]}
+            data, errors = {}, []
+            for selection in root.selection_set.selections:
+                alias = selection.alias.value
+                if selection.name.value in self.failing:
+                    data[alias] = None
+                    errors.append({"type": "FORBIDDEN", "path": ["repository", alias]})
+                else:
+                    data[alias] = f"{owner}.{selection.name.value}"
+            result = {"data": {root.name.value: data}}
+            if errors:
+                result["errors"] = errors
+            return result
+
+        return client
+
+
+async def test_query_merged():
+    github_credentials = RootCredentials()
+    prefect = dict(owner="PrefectHQ", name="prefect")
+    results = await query_merged.fn(
+        [
+            (query_repository, dict(prefect, return_fields=["name", "url"])),
+            (query_repository_languages, dict(prefect, first=10)),
+            (query_repository_default_branch_ref, prefect),
+            (query_user, dict(login="octocat", return_fields=["login"])),
+        ],
+        github_credentials,
+    )
+    assert results == [
+        {"name": "PrefectHQ.name", "url": "PrefectHQ.url"},
+        "PrefectHQ.languages",
+        "PrefectHQ.defaultBranchRef",
+        {"login": "octocat.login"},
+    ]
+    # one request per root object
+    assert len(github_credentials.queries) == 2
+    repository_query = next(
+        query for query in github_credentials.queries if "repository(" in query
+    )
+    assert repository_query.count("repository(") == 1
+    assert "task1_languages: languages(first: 10)" in repository_query
+
+
+async def test_query_merged_rejects_other_tasks():
+    async def execute_graphql(**kwargs):
+        return {}
+
+    with pytest.raises(ValueError, match="generated query task"):
+        await query_merged.fn([(execute_graphql, {})], RootCredentials())
+
+
+async def test_query_merged_maps_errors_to_tasks():
+    github_credentials = RootCredentials(failing=("defaultBranchRef",))
+    prefect = dict(owner="PrefectHQ", name="prefect")
+    missing = dict(owner="missing", name="prefect")
+    results = await query_merged.fn(
+        [
+            (query_repository_languages, dict(prefect, first=10)),
+            (query_repository_default_branch_ref, prefect),
+            (query_repository, dict(prefect, return_fields=["name"])),
+            (query_repository_languages, dict(missing, first=10)),
+            (query_repository_default_branch_ref, missing),
+        ],
+        github_credentials,
+    )
+    assert results[0] == "PrefectHQ.languages"
+    assert results[2] == {"name": "PrefectHQ.name"}
+    assert isinstance(results[1], GitHubGraphQLError)
+    assert results[1].errors[0]["path"] == ["repository", "defaultBranchRef"]
+    # errors on the root object concern every task on it
+    assert all(result.has_error_type("NOT_FOUND") for result in results[3:])
+    # the tasks of the failed group are sent again without the failing one
+    assert len(github_credentials.queries) == 3
+
+
+async def test_query_merged_raises_request_errors():
+    with pytest.raises(GitHubGraphQLError, match="Parse error"):
+        await query_merged.fn(
+            [(query_repository, dict(owner="invalid", name="prefect"))],
+            RootCredentials(),
+        )
@@ -0,0 +1,510 @@
+import asyncio
+
+import pytest
+
+from prefect_github.checkpoints import Checkpoint, FileCheckpointStore
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.pagination import (
+    AdaptivePageSize,
+    iterate_connection,
+    iterate_connection_bidirectional,
+    iterate_connection_nodes,
+    iterate_connection_pages,
+    read_ahead,
+)
+from prefect_github.repository import (
+    query_repository,
+    query_repository_forks,
+    query_repository_stargazers,
+)
+from prefect_github.utils import get_path
+from prefect_github.viewer import query_viewer_repositories
+
+
+class PagedConnection:
+    """
+    Serves a connection of numbered nodes at a path, page by page.
+    """
+
+    def __init__(self, path, total, null_nodes=()):
+        self.path = path
+        self.total = total
+        self.null_nodes = set(null_nodes)
+        self.requests = []
+
+    def page(self, variables):
+        self.requests.append(dict(variables))
+        start = int(variables["after"] or 0)
+        end = min(start + variables["first"], self.total)
+        connection = {
+            "pageInfo": {"hasNextPage": end < self.total, "endCursor": str(end)},
+            "nodes": [
+                None if index in self.null_nodes else {"number": index}
+                for index in range(start, end)
+            ],
+        }
+        for key in reversed(self.path):
+            connection = {key: connection}
+        return connection
+
+    async def fetch(self, variables):
+        return self.page(variables)
+
+
+class PagedCredentials(PagedConnection):
+    """
+    Credentials whose client serves the connection for any query.
+    """
+
+    def get_client(self):
+        def client(op, variables):
+            self.query = str(op)
+            return {"data": self.page(variables)}
+
+        return client
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.parametrize(
+    "total, page_size, max_items, expected, requests",
+    [
+        (5, 2, None, 5, 3),
+        (5, 2, 3, 3, 2),
+        (4, 2, None, 4, 2),
+        (0, 100, None, 0, 1),
+        (250, 100, 120, 120, 2),
+    ],
+)
+async def test_iterate_connection_nodes(
+    total, page_size, max_items, expected, requests
+):
+    connection = PagedConnection(("repository", "issues"), total)
+    nodes = await collect(
+        iterate_connection_nodes(
+            connection.fetch,
+            ("repository", "issues"),
+            page_size=page_size,
+            max_items=max_items,
+        )
+    )
+    assert [node["number"] for node in nodes] == list(range(expected))
+    assert len(connection.requests) == requests
+    assert all(request["first"] <= page_size for request in connection.requests)
+
+
+async def test_iterate_connection_pages_follows_cursors():
+    connection = PagedConnection(("viewer", "repositories"), 5, null_nodes=[1])
+    pages = await collect(
+        iterate_connection_pages(
+            connection.fetch, ("viewer", "repositories"), after="0", page_size=3
+        )
+    )
+    assert [request["after"] for request in connection.requests] == ["0", "3"]
+    assert [node["number"] for node in pages[0].nodes] == [0, 2]
+    assert pages[0].has_next_page and pages[0].end_cursor == "3"
+    assert not pages[1].has_next_page
+
+
+async def test_iterate_connection_pages_missing_connection():
+    async def fetch(variables):
+        return {"repository": None}
+
+    assert (
+        await collect(iterate_connection_pages(fetch, ("repository", "issues"))) == []
+    )
+
+
+async def test_iterate_connection_requests_page_info():
+    github_credentials = PagedCredentials(("repository", "stargazers"), 5)
+    nodes = await collect(
+        iterate_connection(
+            query_repository_stargazers,
+            ("repository", "stargazers"),
+            github_credentials,
+            owner="PrefectHQ",
+            name="prefect",
+            order_by={"field": "STARRED_AT", "direction": "DESC"},
+            first=2,
+            return_fields=["login", "createdAt"],
+        )
+    )
+    assert len(nodes) == 5
+    query = github_credentials.query
+    assert 'repository(owner: "PrefectHQ", name: "prefect"' in query
+    assert "stargazers(after: $after, first: $first, orderBy: {" in query
+    assert "endCursor" in github_credentials.query
+    assert "createdAt" in github_credentials.query
+
+
+@pytest.mark.parametrize(
+    "task, path, kwargs, error",
+    [
+        (query_repository_stargazers, ("repository", "stargazers"), {}, TypeError),
+        (
+            query_repository_stargazers,
+            ("repository", "stargazers"),
+            {"owner": "a", "name": "b", "last": 1},
+            TypeError,
+        ),
+        (
+            query_repository_stargazers,
+            ("repository", "stargazers"),
+            {"owner": "a", "name": "b", "states": ["OPEN"]},
+            TypeError,
+        ),
+        (query_repository, ("repository",), {"owner": "a", "name": "b"}, ValueError),
+        (
+            query_repository_stargazers,
+            ("repository", "watchers"),
+            {
+                "owner": "a",
+                "name": "b",
+                "order_by": {"field": "STARRED_AT", "direction": "DESC"},
+            },
+            ValueError,
+        ),
+    ],
+)
+async def test_iterate_connection_checks_arguments(task, path, kwargs, error):
+    github_credentials = PagedCredentials(("repository", "stargazers"), 1)
+    with pytest.raises(error):
+        await collect(iterate_connection(task, path, github_credentials, **kwargs))
+    assert not github_credentials.requests
+
+
+async def test_iterate_connection_defaults_to_scalar_node_fields():
+    github_credentials = PagedCredentials(("viewer", "repositories"), 1)
+    await collect(
+        iterate_connection(
+            query_viewer_repositories, ("viewer", "repositories"), github_credentials
+        )
+    )
+    assert "nameWithOwner" in github_credentials.query
+    assert "owner {" not in github_credentials.query
+
+
+async def test_read_ahead_fetches_next_page_while_consuming():
+    connection = PagedConnection(("repository", "issues"), 6)
+    pages = iterate_connection_pages(
+        connection.fetch, ("repository", "issues"), page_size=2, prefetch=1
+    )
+    first_page = await pages.__anext__()
+    assert first_page.end_cursor == "2"
+    await asyncio.sleep(0.01)
+    # the second page was requested while the first one was being handled
+    assert len(connection.requests) == 2
+    await asyncio.sleep(0.01)
+    # but no further than the prefetch depth
+    assert len(connection.requests) == 2
+    assert len([page async for page in pages]) == 2
+    assert len(connection.requests) == 3
+
+
+async def test_read_ahead_disabled():
+    connection = PagedConnection(("repository", "issues"), 6)
+    pages = iterate_connection_pages(
+        connection.fetch, ("repository", "issues"), page_size=2, prefetch=0
+    )
+    await pages.__anext__()
+    await asyncio.sleep(0.01)
+    assert len(connection.requests) == 1
+    await pages.aclose()
+
+
+async def test_read_ahead_raises_errors_in_order():
+    async def items():
+        yield 1
+        yield 2
+        raise ValueError("page 3 failed")
+
+    seen = []
+    with pytest.raises(ValueError, match="page 3 failed"):
+        async for item in read_ahead(items(), 2):
+            seen.append(item)
+    assert seen == [1, 2]
+
+
+async def test_read_ahead_stops_producing_when_consumer_stops():
+    produced = []
+    closed = asyncio.Event()
+
+    async def items():
+        try:
+            for item in range(100):
+                produced.append(item)
+                yield item
+        finally:
+            closed.set()
+
+    ahead = read_ahead(items(), 3)
+    async for item in ahead:
+        if item == 1:
+            break
+    await ahead.aclose()
+    assert closed.is_set()
+    assert len(produced) <= 5
+
+
+async def test_resume_from_checkpoint(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+    path = ("repository", "issues")
+    connection = PagedConnection(path, 10)
+    nodes = iterate_connection_nodes(
+        connection.fetch,
+        path,
+        page_size=2,
+        checkpoint_store=store,
+        checkpoint_key="issues",
+        checkpoint_every=2,
+    )
+    seen = []
+    async for node in nodes:
+        seen.append(node["number"])
+        if node["number"] == 6:
+            break  # crash while handling the fourth page
+    await nodes.aclose()
+    checkpoint = await store.load("issues")
+    assert (checkpoint.cursor, checkpoint.pages, checkpoint.items) == ("4", 2, 4)
+
+    connection.requests.clear()
+    resumed = await collect(
+        iterate_connection_nodes(
+            connection.fetch,
+            path,
+            page_size=2,
+            checkpoint_store=store,
+            checkpoint_key="issues",
+            checkpoint_every=2,
+        )
+    )
+    assert connection.requests[0]["after"] == "4"
+    assert [node["number"] for node in resumed] == list(range(4, 10))
+    assert await store.load("issues") is None
+
+
+async def test_resume_counts_items_toward_max_items(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+    path = ("repository", "issues")
+    connection = PagedConnection(path, 10)
+    await store.save("issues", Checkpoint("4", 2, 4))
+    nodes = await collect(
+        iterate_connection_nodes(
+            connection.fetch,
+            path,
+            page_size=2,
+            max_items=7,
+            checkpoint_store=store,
+            checkpoint_key="issues",
+        )
+    )
+    assert [node["number"] for node in nodes] == [4, 5, 6]
+
+
+async def test_checkpoint_store_requires_key(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+    connection = PagedConnection(("viewer", "repositories"), 1)
+    with pytest.raises(ValueError, match="checkpoint key"):
+        await collect(
+            iterate_connection_nodes(
+                connection.fetch, ("viewer", "repositories"), checkpoint_store=store
+            )
+        )
+
+
+async def test_iterate_connection_resumes(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+    github_credentials = PagedCredentials(("repository", "stargazers"), 6)
+    stargazers = iterate_connection(
+        query_repository_stargazers,
+        ("repository", "stargazers"),
+        github_credentials,
+        owner="PrefectHQ",
+        name="prefect",
+        first=2,
+        checkpoint_store=store,
+        checkpoint_every=1,
+    )
+    await stargazers.__anext__()
+    await stargazers.__anext__()
+    await stargazers.__anext__()
+    await stargazers.aclose()
+
+    github_credentials.requests.clear()
+    nodes = await collect(
+        iterate_connection(
+            query_repository_stargazers,
+            ("repository", "stargazers"),
+            github_credentials,
+            owner="PrefectHQ",
+            name="prefect",
+            first=2,
+            checkpoint_store=store,
+            checkpoint_every=1,
+        )
+    )
+    assert github_credentials.requests[0]["after"] == "2"
+    assert len(nodes) == 4
+
+
+class SlowConnection(PagedConnection):
+    """
+    Serves a connection, timing out on pages larger than a size.
+    """
+
+    def __init__(self, path, total, largest_page, error):
+        super().__init__(path, total)
+        self.largest_page = largest_page
+        self.error = error
+
+    async def fetch(self, variables):
+        if variables["first"] > self.largest_page:
+            self.requests.append(dict(variables))
+            raise self.error
+        return self.page(variables)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        GitHubGraphQLError([{"type": "RESOURCE_LIMITS_EXCEEDED", "message": "..."}]),
+        GitHubGraphQLError([{"message": "HTTP Error 502: Bad Gateway", "status": 502}]),
+        GitHubGraphQLError(
+            [{"message": "This may be the result of a timeout, or a GitHub bug."}]
+        ),
+        asyncio.TimeoutError(),
+    ],
+)
+async def test_adaptive_page_size_shrinks_on_errors(error):
+    connection = SlowConnection(("repository", "issues"), 60, 30, error)
+    nodes = await collect(
+        iterate_connection_nodes(
+            connection.fetch, ("repository", "issues"), adaptive_page_size=True
+        )
+    )
+    assert [node["number"] for node in nodes] == list(range(60))
+    assert [request["first"] for request in connection.requests][:4] == [
+        100,
+        50,
+        25,
+        38,
+    ]
+
+
+async def test_adaptive_page_size_gives_up_at_minimum():
+    error = GitHubGraphQLError([{"type": "RESOURCE_LIMITS_EXCEEDED"}])
+    connection = SlowConnection(("repository", "issues"), 10, 0, error)
+    with pytest.raises(GitHubGraphQLError):
+        await collect(
+            iterate_connection_nodes(
+                connection.fetch,
+                ("repository", "issues"),
+                page_size=4,
+                adaptive_page_size=True,
+            )
+        )
+    assert [request["first"] for request in connection.requests] == [4, 2, 1]
+
+
+async def test_adaptive_page_size_raises_other_errors():
+    error = GitHubGraphQLError([{"type": "NOT_FOUND"}])
+    connection = SlowConnection(("repository", "issues"), 10, 0, error)
+    with pytest.raises(GitHubGraphQLError):
+        await collect(
+            iterate_connection_nodes(
+                connection.fetch, ("repository", "issues"), adaptive_page_size=True
+            )
+        )
+    assert len(connection.requests) == 1
+
+
+def test_adaptive_page_size_growth():
+    page_size = AdaptivePageSize(10, fast_threshold=1.0)
+    page_size.record_success(0.1)
+    assert page_size.size == 15
+    page_size.record_success(5.0)
+    assert page_size.size == 15
+    for _ in range(10):
+        page_size.record_success(0.1)
+    assert page_size.size == 100
+
+
+class BidirectionalConnection(PagedConnection):
+    """
+    Serves a connection forward with after/first and backward with before/last.
+    """
+
+    def page(self, variables):
+        if variables.get("last") is None:
+            return super().page(variables)
+        self.requests.append(dict(variables))
+        end = int(variables["before"] or self.total)
+        start = max(end - variables["last"], 0)
+        connection = {
+            "pageInfo": {"hasPreviousPage": start > 0, "startCursor": str(start)},
+            "nodes": [{"id": index, "number": index} for index in range(start, end)],
+        }
+        for key in reversed(self.path):
+            connection = {key: connection}
+        return connection
+
+
+@pytest.mark.parametrize(
+    "total, page_size, requests",
+    [(10, 2, 6), (9, 2, 6), (3, 5, 2), (0, 5, 2), (100, 10, 12)],
+)
+async def test_iterate_connection_bidirectional(total, page_size, requests):
+    path = ("repository", "stargazers")
+    connection = BidirectionalConnection(path, total)
+    connection.page = _with_ids(connection.page)
+    nodes = await collect(
+        iterate_connection_bidirectional(connection.fetch, path, page_size=page_size)
+    )
+    assert sorted(node["number"] for node in nodes) == list(range(total))
+    assert len(connection.requests) == requests
+
+
+def _with_ids(page):
+    def page_with_ids(variables):
+        data = page(variables)
+        for node in get_path(data, ("repository", "stargazers"))["nodes"]:
+            node["id"] = node["number"]
+        return data
+
+    return page_with_ids
+
+
+async def test_iterate_connection_bidirectional_max_items():
+    path = ("repository", "stargazers")
+    connection = BidirectionalConnection(path, 10)
+    connection.page = _with_ids(connection.page)
+    nodes = await collect(
+        iterate_connection_bidirectional(
+            connection.fetch, path, page_size=2, max_items=5
+        )
+    )
+    assert [node["number"] for node in nodes] == [0, 1, 9, 8, 2]
+
+
+async def test_iterate_connection_task_bidirectional():
+    class BidirectionalCredentials(BidirectionalConnection, PagedCredentials):
+        pass
+
+    github_credentials = BidirectionalCredentials(("repository", "forks"), 0)
+    await collect(
+        iterate_connection(
+            query_repository_forks,
+            ("repository", "forks"),
+            github_credentials,
+            owner="PrefectHQ",
+            name="prefect",
+            bidirectional=True,
+        )
+    )
+    assert "$before: String" in github_credentials.query
+    assert "before: $before" in github_credentials.query
+    assert "last: $last" in github_credentials.query
+    assert "startCursor" in github_credentials.query
+    assert "id" in github_credentials.query
@@ -0,0 +1,156 @@
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from prefect_github import partitions
+from prefect_github.exceptions import SearchResultLimitError
+from prefect_github.partitions import (
+    TimeWindow,
+    iterate_partitioned_search,
+    merge_partitions,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+# an issue created every day of January, and ten on its last day
+CREATED = [START + timedelta(days=day) for day in range(31)] + [
+    START + timedelta(days=30, hours=hour) for hour in range(1, 11)
+]
+
+
+def parse_timestamp(timestamp):
+    return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").replace(
+        tzinfo=timezone.utc
+    )
+
+
+def search(query, created_at=CREATED):
+    start, last = re.search(r"created:(\S+)\.\.(\S+)", query).groups()
+    start, last = parse_timestamp(start), parse_timestamp(last)
+    return [
+        {"id": f"I{index}", "number": index}
+        for index, created in enumerate(created_at)
+        if start <= created <= last
+    ]
+
+
+class SearchCredentials:
+    """
+    Credentials whose client answers searches over the issues above, or
+    over issues created at other times.
+    """
+
+    def __init__(self, created_at=CREATED):
+        self.created_at = created_at
+        self.count_requests = 0
+        self.page_queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            queries = re.findall(r'query: "([^"]*)"', str(op))
+            if "issueCount" in str(op):
+                self.count_requests += 1
+                return {
+                    "data": {
+                        f"window{index}": {
+                            "issueCount": len(search(query, self.created_at))
+                        }
+                        for index, query in enumerate(queries)
+                    }
+                }
+            self.page_queries.append(queries[0])
+            results = search(queries[0], self.created_at)
+            start = int(variables["after"] or 0)
+            end = min(start + variables["first"], len(results))
+            page = {
+                "pageInfo": {"hasNextPage": end < len(results), "endCursor": str(end)},
+                "nodes": results[start:end],
+            }
+            return {"data": {"search": page}}
+
+        return client
+
+
+def test_time_window_split():
+    window = TimeWindow(START, START + timedelta(days=1))
+    windows = window.split(3)
+    assert [item.to_qualifier("created") for item in windows] == [
+        "created:2023-01-01T00:00:00Z..2023-01-01T07:59:59Z",
+        "created:2023-01-01T08:00:00Z..2023-01-01T15:59:59Z",
+        "created:2023-01-01T16:00:00Z..2023-01-01T23:59:59Z",
+    ]
+    assert len(TimeWindow(START, START + timedelta(seconds=2)).split(5)) == 2
+
+
+async def test_merge_partitions_deduplicates():
+    async def partition(ids, delay):
+        for node_id in ids:
+            await asyncio.sleep(delay)
+            yield {"id": node_id}
+
+    nodes = merge_partitions(
+        [partition([1, 2, 3], 0.01), partition([3, 4], 0), partition([5], 0)],
+        max_concurrency=2,
+    )
+    assert sorted([node["id"] async for node in nodes]) == [1, 2, 3, 4, 5]
+
+
+async def test_merge_partitions_raises_errors():
+    async def failing():
+        yield {"id": 1}
+        raise ValueError("window failed")
+
+    async def endless():
+        while True:
+            await asyncio.sleep(0)
+            yield {}
+
+    with pytest.raises(ValueError, match="window failed"):
+        async for _ in merge_partitions([failing(), endless()]):
+            pass
+
+
+async def test_iterate_partitioned_search(monkeypatch):
+    monkeypatch.setattr(partitions, "SEARCH_RESULT_LIMIT", 5)
+    github_credentials = SearchCredentials()
+    nodes = [
+        node
+        async for node in iterate_partitioned_search(
+            "repo:PrefectHQ/prefect is:issue",
+            "ISSUE",
+            github_credentials,
+            start="2023-01-01T00:00:00Z",
+            end="2023-02-01T00:00:00Z",
+            partitions=4,
+            first=2,
+            return_fields=["number"],
+        )
+    ]
+    assert sorted(node["number"] for node in nodes) == list(range(len(CREATED)))
+    # windows holding more issues than the search limit were split and recounted
+    assert github_credentials.count_requests > 1
+    assert all(len(search(query)) <= 5 for query in github_credentials.page_queries)
+
+
+@pytest.mark.parametrize("allow_truncated", [False, True])
+async def test_iterate_partitioned_search_over_limit_in_a_second(
+    monkeypatch, caplog, allow_truncated
+):
+    monkeypatch.setattr(partitions, "SEARCH_RESULT_LIMIT", 2)
+    github_credentials = SearchCredentials(created_at=[START] * 3)
+    nodes = iterate_partitioned_search(
+        "repo:PrefectHQ/prefect is:issue",
+        "ISSUE",
+        github_credentials,
+        start=START,
+        end=START + timedelta(seconds=2),
+        allow_truncated=allow_truncated,
+    )
+    if not allow_truncated:
+        with pytest.raises(SearchResultLimitError, match="returns 3 results"):
+            await nodes.__anext__()
+        assert github_credentials.page_queries == []
+        return
+    assert len([node async for node in nodes]) == 3
+    assert "only the first 2 are fetched" in caplog.text
@@ -0,0 +1,227 @@
+import re
+
+import pytest
+from graphql import parse
+from sgqlc.operation import Operation
+
+from prefect_github.cost import estimate_query_cost
+from prefect_github.exceptions import GitHubGraphQLError
+from prefect_github.graphql import _execute_graphql_op
+from prefect_github.planner import (
+    execute_within_node_limit,
+    plan_node_limit_split,
+    shrink_inner_page_sizes,
+)
+from prefect_github.schemas import graphql_schema
+
+WIDE_QUERY = """
+    query Wide($owner: String!, $size: Int!) {
+      repository(owner: $owner, name: "prefect") {
+        issues(first: $size) {
+          totalCount
+          nodes {
+            number
+            comments(first: 100) {
+              nodes {
+                reactions(first: 100) { totalCount }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+class PagedIssues:
+    """Serves issue pages for whatever page size and cursor is requested."""
+
+    def __init__(self, total=100):
+        self.total = total
+        self.requests = []
+
+    async def __call__(self, query, variables):
+        self.requests.append((query, variables))
+        issues = parse(query).definitions[0].selection_set.selections[0]
+        issues = issues.selection_set.selections[0]
+        arguments = {
+            argument.name.value: argument.value.value for argument in issues.arguments
+        }
+        start = int(arguments.get("after", 0))
+        end = min(start + int(arguments["first"]), self.total)
+        nodes = [
+            {"number": number, "comments": {"nodes": []}}
+            for number in range(start, end)
+        ]
+        page_info = {"endCursor": str(end), "hasNextPage": end < self.total}
+        return {
+            "repository": {
+                "issues": {
+                    "totalCount": self.total,
+                    "nodes": nodes,
+                    "pageInfo": page_info,
+                }
+            }
+        }
+
+
+def test_plan_node_limit_split_within_limit():
+    document = parse(WIDE_QUERY)
+    assert plan_node_limit_split(document, {"owner": "a", "size": 40}) is None
+
+
+def test_plan_node_limit_split_outer_connection():
+    document = parse(WIDE_QUERY)
+    assert estimate_query_cost(document, owner="a", size=100).exceeds_node_limit
+    plan = plan_node_limit_split(document, {"owner": "a", "size": 100})
+    assert plan.path == ["repository", "issues"]
+    assert plan.page_argument == "first"
+    assert plan.total == 100
+    assert plan.chunk_size == 49
+
+
+async def test_execute_within_node_limit_merges_pages():
+    send = PagedIssues()
+    data = await execute_within_node_limit(
+        parse(WIDE_QUERY), send, {"owner": "a", "size": 100}
+    )
+    issues = data["repository"]["issues"]
+    assert [node["number"] for node in issues["nodes"]] == list(range(100))
+    assert issues["totalCount"] == 100
+    assert "pageInfo" not in issues
+    assert len(send.requests) == 3
+    for query, variables in send.requests:
+        assert variables == {"owner": "a"}
+        assert "$size" not in query
+        assert estimate_query_cost(query, **variables).node_count <= 500_000
+
+
+async def test_execute_within_node_limit_stops_at_last_page():
+    send = PagedIssues(total=60)
+    data = await execute_within_node_limit(
+        parse(WIDE_QUERY), send, {"owner": "a", "size": 100}
+    )
+    assert len(data["repository"]["issues"]["nodes"]) == 60
+    assert len(send.requests) == 2
+
+
+def test_shrink_inner_page_sizes():
+    op = Operation(graphql_schema.Query)
+    issue = op.repository(owner="a", name="b").issue(number=1)
+    comments = issue.comments(first=100).nodes()
+    followers = comments.reactions(first=100).nodes().user().followers(first=100)
+    followers.nodes().followers(first=100).__fields__("total_count")
+    document = parse(bytes(op).decode())
+    assert plan_node_limit_split(document) is None
+    shrunk = shrink_inner_page_sizes(document)
+    cost = estimate_query_cost(shrunk)
+    assert not cost.exceeds_node_limit
+    assert cost.connections[0].page_size == 100
+    assert estimate_query_cost(document).exceeds_node_limit
+
+
+def test_shrink_inner_page_sizes_impossible():
+    with pytest.raises(ValueError, match="even with one node per page"):
+        shrink_inner_page_sizes(parse(WIDE_QUERY), {"size": 1}, node_limit=2)
+
+
+class NodeLimitCredentials:
+    def __init__(self):
+        self.queries = []
+
+    def get_client(self):
+        def client(op, vars):
+            self.queries.append(op)
+            if len(self.queries) == 1:
+                return {"errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED"}]}
+            return {"data": {"viewer": {"repositories": {"nodes": [{"id": "1"}]}}}}
+
+        return client
+
+
+async def test_execute_graphql_op_splits_when_github_rejects():
+    credentials = NodeLimitCredentials()
+    op = "query { viewer { repositories(first: 100) { nodes { id } } } }"
+    data = await _execute_graphql_op(op, credentials)
+    assert data == {"viewer": {"repositories": {"nodes": [{"id": "1"}]}}}
+    assert "repositories(first: 50)" in credentials.queries[1]
+
+
+async def test_execute_graphql_op_raises_other_errors():
+    credentials = NodeLimitCredentials()
+    credentials.queries.append("already sent")
+    credentials.get_client = lambda: lambda op, vars: {
+        "errors": [{"type": "NOT_FOUND"}]
+    }
+    with pytest.raises(GitHubGraphQLError, match="NOT_FOUND") as exc_info:
+        await _execute_graphql_op("query { viewer { login } }", credentials)
+    assert exc_info.value.has_error_type("NOT_FOUND")
+
+
+REACTIONS_QUERY = """
+    query {
+      repository(owner: "a", name: "b") {
+        issue(number: 1) {
+          comments(first: 1) {
+            nodes {
+              reactions(first: 8) { nodes { content } }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+class PagedReactions:
+    """Serves the reactions of a single comment, ten in all."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_page(self, query):
+        match = re.search(r'reactions\(first: (\d+)(?:, after: "(\d+)")?\)', query)
+        start = int(match.group(2) or 0)
+        end = min(start + int(match.group(1)), 10)
+        return {
+            "nodes": [{"content": str(index)} for index in range(start, end)],
+            "pageInfo": {"hasNextPage": end < 10, "endCursor": str(end)},
+        }
+
+    async def __call__(self, query, variables):
+        self.requests.append(query)
+        reactions = self.get_page(query)
+        if "hydrate0" in query:
+            return {"hydrate0": {"reactions": reactions}}
+        comment = {"id": "C1", "reactions": reactions}
+        return {"repository": {"issue": {"comments": {"nodes": [comment]}}}}
+
+
+async def test_execute_within_node_limit_follows_up_shrunk_connections():
+    send = PagedReactions()
+    data = await execute_within_node_limit(parse(REACTIONS_QUERY), send, node_limit=6)
+    [comment] = data["repository"]["issue"]["comments"]["nodes"]
+    contents = [reaction["content"] for reaction in comment["reactions"]["nodes"]]
+    # the page size asked for, not the shrunk one nor every page
+    assert contents == [str(index) for index in range(8)]
+    assert len(send.requests) == 2
+    assert "reactions(first: 4)" in send.requests[0]
+    assert 'reactions(first: 4, after: "4")' in send.requests[1]
+
+
+async def test_execute_within_node_limit_rejects_unfollowable_shrinking():
+    query = REACTIONS_QUERY.replace(
+        "comments(first: 1)", "labels(first: 8) { totalCount } comments(first: 1)"
+    ).replace("reactions(first: 8)", "reactions(first: 6)")
+    send = PagedReactions()
+    with pytest.raises(ValueError, match="labels"):
+        await execute_within_node_limit(parse(query), send, node_limit=6)
+    assert not send.requests
+
+
+async def test_execute_graphql_op_retries_small_operations_within_one_node():
+    credentials = NodeLimitCredentials()
+    op = "query { viewer { repositories(first: 1) { nodes { id } } } }"
+    data = await _execute_graphql_op(op, credentials)
+    assert data == {"viewer": {"repositories": {"nodes": [{"id": "1"}]}}}
+    assert "repositories(first: 1)" in credentials.queries[1]
@@ -0,0 +1,160 @@
+import pytest
+from graphql import parse
+
+from prefect_github.mutations import add_star_starrable
+from prefect_github.resolver import (
+    IssueRef,
+    NodeIdResolver,
+    PullRequestRef,
+    RepositoryRef,
+    UserRef,
+    get_node_id_resolver,
+    resolve_node_id_arguments,
+)
+
+
+class ResolverCredentials:
+    """
+    Credentials whose client resolves references to made-up node IDs, and
+    stars repositories.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            self.queries.append(str(op))
+            operation = parse(str(op)).definitions[0]
+            if operation.operation.value == "mutation":
+                return {"data": {"addStar": {"starrable": {"id": "starred"}}}}
+            data, errors = {}, []
+            for field in operation.selection_set.selections:
+                alias = field.alias.value
+                arguments = [argument.value.value for argument in field.arguments]
+                if "missing" in arguments:
+                    data[alias] = None
+                    errors.append({"type": "NOT_FOUND", "path": [alias]})
+                    continue
+                node_id = f"{field.name.value}:{'/'.join(arguments)}"
+                inner = field.selection_set.selections[0]
+                if inner.name.value == "id":
+                    data[alias] = {"id": node_id}
+                else:
+                    number = inner.arguments[0].value.value
+                    data[alias] = {
+                        inner.name.value: {"id": f"{inner.name.value}:{number}"}
+                    }
+            result = {"data": data}
+            if errors:
+                result["errors"] = errors
+            return result
+
+        return client
+
+
+@pytest.fixture(autouse=True)
+def clear_resolver():
+    get_node_id_resolver().clear()
+    yield
+    get_node_id_resolver().clear()
+
+
+async def test_node_id_resolver_batches_and_caches():
+    github_credentials = ResolverCredentials()
+    resolver = NodeIdResolver(max_aliases=2)
+    references = [
+        RepositoryRef("PrefectHQ", "prefect"),
+        IssueRef("PrefectHQ", "prefect", 1),
+        PullRequestRef("PrefectHQ", "prefect", 1),
+        UserRef("octocat"),
+        RepositoryRef("PrefectHQ", "missing"),
+    ]
+    node_ids = await resolver.resolve(references, github_credentials)
+    assert node_ids == [
+        "repository:PrefectHQ/prefect",
+        "issue:1",
+        "pullRequest:1",
+        "user:octocat",
+        None,
+    ]
+    assert len(github_credentials.queries) == 3
+
+    node_ids = await resolver.resolve(references[1:], github_credentials)
+    assert node_ids == ["issue:1", "pullRequest:1", "user:octocat", None]
+    # only the missing repository is fetched again
+    assert len(github_credentials.queries) == 4
+
+
+async def test_node_id_resolver_expires_node_ids():
+    github_credentials = ResolverCredentials()
+    resolver = NodeIdResolver(ttl=0)
+    for _ in range(2):
+        await resolver.resolve([UserRef("octocat")], github_credentials)
+    assert len(github_credentials.queries) == 2
+
+
+async def test_node_id_resolver_evicts_least_recently_used():
+    github_credentials = ResolverCredentials()
+    resolver = NodeIdResolver(max_size=2)
+    for login in ("octocat", "hubot", "octocat", "monalisa"):
+        await resolver.resolve([UserRef(login)], github_credentials)
+    assert len(github_credentials.queries) == 3
+    # hubot was the least recently used when monalisa was kept
+    await resolver.resolve([UserRef("octocat")], github_credentials)
+    assert len(github_credentials.queries) == 3
+    await resolver.resolve([UserRef("hubot")], github_credentials)
+    assert len(github_credentials.queries) == 4
+
+
+async def test_resolve_node_id_arguments():
+    github_credentials = ResolverCredentials()
+    arguments = await resolve_node_id_arguments(
+        ["MDQ6VXNlcjE=", RepositoryRef("PrefectHQ", "prefect"), None],
+        github_credentials,
+    )
+    assert arguments == ["MDQ6VXNlcjE=", "repository:PrefectHQ/prefect", None]
+
+    arguments = await resolve_node_id_arguments(
+        [[UserRef("octocat"), "MDQ6VXNlcjE="]], github_credentials
+    )
+    assert arguments == [["user:octocat", "MDQ6VXNlcjE="]]
+
+    with pytest.raises(ValueError, match="Could not resolve"):
+        await resolve_node_id_arguments([UserRef("missing")], github_credentials)
+
+
+async def test_resolve_node_id_arguments_without_references_sends_nothing():
+    github_credentials = ResolverCredentials()
+    arguments = await resolve_node_id_arguments(
+        ["MDQ6VXNlcjE=", ["MDQ6VXNlcjI="]], github_credentials
+    )
+    assert arguments == ["MDQ6VXNlcjE=", ["MDQ6VXNlcjI="]]
+    assert not github_credentials.queries
+
+
+async def test_mutation_accepts_references():
+    github_credentials = ResolverCredentials()
+    result = await add_star_starrable.fn(
+        RepositoryRef("PrefectHQ", "prefect"),
+        github_credentials,
+        return_fields=["id"],
+    )
+    assert result == {"id": "starred"}
+    assert (
+        'starrableId: "repository:PrefectHQ/prefect"' in github_credentials.queries[1]
+    )
+
+
+@pytest.mark.parametrize("lean", [False, True])
+async def test_mutation_explain_sends_no_request(lean):
+    github_credentials = ResolverCredentials()
+    explanation = await add_star_starrable.fn(
+        RepositoryRef("PrefectHQ", "missing"),
+        github_credentials,
+        return_fields=["id"],
+        explain=True,
+        lean=lean,
+    )
+    assert not github_credentials.queries
+    assert "RepositoryRef(owner='PrefectHQ', name='missing')" in explanation["query"]
@@ -0,0 +1,104 @@
+import pytest
+
+from prefect_github.sync import (
+    collect_updated_nodes,
+    sync_repository_issues,
+    sync_repository_pull_requests,
+)
+
+UPDATED_AT = [
+    "2023-03-05T00:00:00Z",
+    "2023-03-04T00:00:00Z",
+    "2023-03-03T00:00:00Z",
+    "2023-03-02T00:00:00Z",
+    "2023-03-01T00:00:00Z",
+]
+
+
+class UpdatedCredentials:
+    """
+    Credentials whose client serves a connection of nodes, newest update first.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.queries = []
+
+    def get_client(self):
+        def client(op, variables):
+            self.queries.append(str(op))
+            start = int(variables["after"] or 0)
+            end = min(start + variables["first"], len(UPDATED_AT))
+            connection = {
+                "pageInfo": {
+                    "hasNextPage": end < len(UPDATED_AT),
+                    "endCursor": str(end),
+                },
+                "nodes": [
+                    {"number": index, "updatedAt": UPDATED_AT[index]}
+                    for index in range(start, end)
+                ],
+            }
+            for key in reversed(self.path):
+                connection = {key: connection}
+            return {"data": connection}
+
+        return client
+
+
+async def iterate(nodes):
+    for node in nodes:
+        yield node
+
+
+@pytest.mark.parametrize(
+    "watermark, expected, new_watermark",
+    [
+        (None, [0, 1, 2, 3, 4], UPDATED_AT[0]),
+        ("2023-03-03T00:00:00Z", [0, 1, 2], UPDATED_AT[0]),
+        ("2023-03-02T12:00:00+00:00", [0, 1, 2], UPDATED_AT[0]),
+        ("2023-03-06T00:00:00Z", [], "2023-03-06T00:00:00Z"),
+    ],
+)
+async def test_collect_updated_nodes(watermark, expected, new_watermark):
+    nodes = [
+        {"number": index, "updatedAt": updated_at}
+        for index, updated_at in enumerate(UPDATED_AT)
+    ]
+    updated_nodes, watermark = await collect_updated_nodes(iterate(nodes), watermark)
+    assert [node["number"] for node in updated_nodes] == expected
+    assert watermark == new_watermark
+
+
+async def test_sync_repository_issues_uses_since_filter():
+    github_credentials = UpdatedCredentials(("repository", "issues"))
+    result = await sync_repository_issues.fn(
+        "PrefectHQ",
+        "prefect",
+        github_credentials,
+        watermark="2023-03-04T00:00:00Z",
+        first=1,
+        return_fields=["number"],
+    )
+    assert [node["number"] for node in result["nodes"]] == [0, 1]
+    assert result["watermark"] == UPDATED_AT[0]
+    # pagination stopped at the first node older than the watermark
+    assert len(github_credentials.queries) == 3
+    query = github_credentials.queries[0]
+    assert "orderBy: {field: UPDATED_AT, direction: DESC}" in query
+    assert "filterBy: {since: " in query
+    assert "updatedAt" in query
+
+
+async def test_sync_repository_pull_requests_stops_at_watermark():
+    github_credentials = UpdatedCredentials(("repository", "pullRequests"))
+    result = await sync_repository_pull_requests.fn(
+        "PrefectHQ",
+        "prefect",
+        github_credentials,
+        watermark="2023-03-03T00:00:00Z",
+        first=2,
+    )
+    assert [node["number"] for node in result["nodes"]] == [0, 1, 2]
+    assert len(github_credentials.queries) == 2
+    assert "filterBy" not in github_credentials.queries[0]
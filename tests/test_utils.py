@@ -2,9 +2,16 @@ import json
 
 import pytest
 
+from prefect_github.schemas import graphql_schema
 from prefect_github.utils import (
     camel_to_snake_case,
+    get_named_type,
+    get_operation_definition,
+    get_root_type,
+    get_schema_field,
+    get_schema_type,
     initialize_return_fields_defaults,
+    parse_graphql_document,
     strip_kwargs,
 )
 
@@ -34,3 +41,23 @@ def test_strip_kwargs():
     assert strip_kwargs(**{"a": "abc", "b": "def"}) == {"a": "abc", "b": "def"}
     assert strip_kwargs(a="abc", b="def") == {"a": "abc", "b": "def"}
     assert strip_kwargs(**dict(a=[])) == {"a": []}
+
+
+def test_get_schema_field_and_named_type():
+    field = get_schema_field(graphql_schema.Repository, "issues")
+    assert field.name == "issues"
+    assert get_named_type(field.type) is graphql_schema.IssueConnection
+    assert get_schema_field(graphql_schema.Repository, "doesNotExist") is None
+    assert get_schema_type("Issue") is graphql_schema.Issue
+    assert get_schema_type("NotAType") is None
+
+
+def test_get_operation_definition():
+    document = parse_graphql_document(
+        "query A { viewer { login } } mutation B { addStar { clientMutationId } }"
+    )
+    assert get_operation_definition(document).name.value == "A"
+    operation = get_operation_definition(document, "B")
+    assert get_root_type(operation) is graphql_schema.Mutation
+    with pytest.raises(ValueError, match="not found"):
+        get_operation_definition(document, "C")